@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Compare ChoiceIndex with a linear scan over the labels."""
+
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from djextra.forms.angular1.choices import (  # noqa: E402
+    ChoiceIndex, get_choice_index
+)
+
+
+def linear(choices, query, limit):
+    """Search the labels with a linear scan."""
+    query = query.casefold()
+    return [
+        (value, label) for (value, label) in choices
+        if query in label.casefold()
+    ][:limit]
+
+
+def main(size=50000, number=200):
+    """Run the benchmark."""
+    rand = random.Random(0)
+    words = ["".join(
+        rand.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(7)
+    ) for _ in range(2000)]
+    choices = [
+        (str(idx), f"{rand.choice(words)} {rand.choice(words)}")
+        for idx in range(size)
+    ]
+    build = timeit.timeit(lambda: ChoiceIndex(choices), number=1)
+    print(f"build index ({size} choices)  {build * 1e3:9.1f} ms")
+    get_choice_index(choices)
+    cached = timeit.timeit(lambda: get_choice_index(choices), number=10)
+    print(f"cached index lookup          {cached / 10 * 1e3:9.1f} ms")
+    index = ChoiceIndex(choices)
+    for query in ("ab", words[5][:4], words[7][2:6]):
+        scan = timeit.timeit(
+            lambda: linear(choices, query, 10), number=number // 10
+        ) / (number // 10)
+        found = timeit.timeit(
+            lambda: index.search(query, 10), number=number
+        ) / number
+        print(
+            f"query {query!r:<8} linear {scan * 1e6:9.1f} us  "
+            f"index {found * 1e6:9.1f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Measure the first render of the widgets in a fresh process."""
+
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WORKER = """
+import os, sys, time
+sys.path.insert(0, {root!r})
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "settings")
+import django
+django.setup()
+from django.conf import settings
+settings.DEBUG = False
+settings.DJEXTRA_COMPILED_WIDGET_TEMPLATES = {bundle!r}
+from djextra.forms.angular1.widgets import MDCheckBox, MDDatePicker, MDSelect
+start = time.perf_counter()
+MDSelect(choices=(("a", "A"), ("b", "B"))).render("bench", "a")
+MDCheckBox("Check").render("bench", True)
+MDDatePicker().render("bench", "2020-01-01")
+print((time.perf_counter() - start) * 1e3)
+"""
+
+
+def measure(bundle, number=10):
+    """Return the best first-render time in milliseconds."""
+    return min(
+        float(subprocess.check_output([
+            sys.executable, "-c", WORKER.format(root=ROOT, bundle=bundle)
+        ]))
+        for _ in range(number)
+    )
+
+
+def main():
+    """Run the benchmark."""
+    with tempfile.TemporaryDirectory() as tmp:
+        bundle = os.path.join(tmp, "widgets.bundle")
+        subprocess.check_call(
+            [sys.executable, "manage.py", "compilewidgets", bundle],
+            cwd=ROOT, stdout=subprocess.DEVNULL,
+            env=dict(os.environ, DJANGO_SETTINGS_MODULE="settings")
+        )
+        print(f"source templates   {measure(None):8.2f} ms")
+        print(f"compiled bundle    {measure(bundle):8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Measure the instantiation of the forms with many fields."""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django import forms  # noqa: E402
+
+from djextra.forms import AllRequiredForm, FieldAttributeForm  # noqa: E402
+from djextra.forms.angular1 import AngularForm  # noqa: E402
+
+
+def make_form(base, size, meta):
+    """Make the form class that has size fields."""
+    attrs = {
+        f"field{idx}": forms.CharField(required=False) for idx in range(size)
+    }
+    attrs["Meta"] = meta
+    return type(f"Bench{base.__name__}", (base, ), attrs)
+
+
+def main(size=150, number=200):
+    """Run the benchmark."""
+    classes = {
+        "Form": make_form(forms.Form, size, type("Meta", (), {})),
+        "AngularForm": make_form(AngularForm, size, type("Meta", (), {
+            "handle_ng_init": True,
+            "ng_init_format_func": {"field0": str}
+        })),
+        "FieldAttributeForm": make_form(
+            FieldAttributeForm, size, type("Meta", (), {
+                "common_attrs": {"data-a": "a", "data-b": str},
+                "fld_attrs": {"field0": {"data-c": "c"}}
+            })
+        ),
+        "AllRequiredForm": make_form(AllRequiredForm, size, type("Meta", (), {
+            "optional": ("field0", )
+        })),
+    }
+    print(f"{size} fields")
+    for (label, form_cls) in classes.items():
+        form_cls()
+        elapsed = min(
+            timeit.repeat(form_cls, number=number, repeat=5)
+        ) / number
+        print(f"{label:<20} {elapsed * 1e3:8.3f} ms/instance")
+
+
+if __name__ == "__main__":
+    main()
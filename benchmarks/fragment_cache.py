@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Compare the rendering with/without the fragment cache."""
+
+import os
+import sys
+import timeit
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from djextra.forms.angular1.widgets import (  # noqa: E402
+    MDCheckBox, MDDateSelect, MDSelect
+)
+from djextra.forms.angular1.widgets.cache import FragmentCache  # noqa: E402
+
+
+def main(number=2000, repeat=5):
+    """Run the benchmark."""
+    choices = [(f"v{i}", f"Label {i}") for i in range(50)]
+    widgets = {
+        "MDSelect": (MDSelect, {"choices": choices}, "v3"),
+        "MDCheckBox": (MDCheckBox, {"label": "Check"}, True),
+        "MDDateSelect": (MDDateSelect, {}, date(2020, 1, 1)),
+    }
+    for (label, (cls, kwargs, value)) in widgets.items():
+        for cached in (False, True):
+            cache = FragmentCache() if cached else None
+            widget = cls(fragment_cache=cache, **kwargs)
+            widget.render("bench", value)
+            elapsed = min(timeit.repeat(
+                lambda: widget.render("bench", value),
+                number=number, repeat=repeat
+            ))
+            print(
+                f"{label:<14} cached={cached!s:<6}"
+                f"{elapsed / number * 1e6:10.1f} us/render"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Compare json.loads and iter_json_array for a large ListField payload."""
+
+import io
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django import forms  # noqa: E402
+
+from djextra.forms import ListField, iter_json_array  # noqa: E402
+
+
+def main(size=200000):
+    """Run the benchmark."""
+    payloads = (
+        ("CharField", forms.CharField(max_length=16),
+         [f"item-{index:08d}" for index in range(size)]),
+        ("IntegerField", forms.IntegerField(),
+         [str(index * 7919) for index in range(size)]),
+    )
+    for (name, inner, items) in payloads:
+        body = json.dumps(items).encode()
+        field = ListField(field=inner)
+        print(f"{name}: {len(body) / 2 ** 20:.1f} MiB body, {size} items")
+        for (label, func) in (
+            ("json.loads", lambda stream: field.clean(
+                json.loads(stream.read())
+            )),
+            ("iter_json_array", lambda stream: field.clean(
+                iter_json_array(stream)
+            )),
+        ):
+            started = time.perf_counter()
+            func(io.BytesIO(body))
+            elapsed = time.perf_counter() - started
+            stream = io.BytesIO(body)
+            tracemalloc.start()
+            result = func(stream)
+            (held, peak) = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(
+                f"  {label:<16}held {held / 2 ** 20:6.1f} MiB  "
+                f"peak {peak / 2 ** 20:6.1f} MiB  {elapsed * 1e3:8.1f} ms"
+            )
+            del result
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Measure ListField.clean on large numeric lists."""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django import forms  # noqa: E402
+
+from djextra.forms import ListField  # noqa: E402
+
+
+def per_item(field_class):
+    """Return the subclass that disables the batched path."""
+    class PerItemField(field_class):
+        def to_python(self, value):
+            return super().to_python(value)
+
+    return PerItemField
+
+
+def main(size=50000, number=5, repeat=5):
+    """Run the benchmark."""
+    floats = [str(index * 0.5) for index in range(size)]
+    ints = [str(index) for index in range(size)]
+    cases = (
+        ("FloatField", forms.FloatField, {"min_value": 0}, floats),
+        ("IntegerField", forms.IntegerField, {"max_value": size}, ints),
+        ("DecimalField", forms.DecimalField, {}, floats),
+    )
+    for (label, field_class, kwargs, payload) in cases:
+        for (mode, cls) in (
+            ("per-item", per_item(field_class)), ("batched", field_class)
+        ):
+            field = ListField(field=cls(**kwargs))
+            elapsed = min(timeit.repeat(
+                lambda: field.clean(payload), number=number, repeat=repeat
+            ))
+            print(
+                f"{label:<14}{mode:<10}"
+                f"{elapsed / number * 1e3:10.2f} ms/{size} items"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Measure the memory held by the cleaned values of ListField."""
+
+import base64
+import os
+import sys
+import time
+import tracemalloc
+from array import array
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django import forms  # noqa: E402
+
+from djextra.forms import ListField  # noqa: E402
+from djextra.forms.listfield import numpy  # noqa: E402
+
+
+def main(size=1000000):
+    """Run the benchmark."""
+    payload = base64.b64encode(
+        array("d", (index / 7 for index in range(size))).tobytes()
+    ).decode()
+    containers = ("list", "array") + (("numpy", ) if numpy else ())
+    for container in containers:
+        field = ListField(
+            field=forms.FloatField(), packed="float64", container=container
+        )
+        tracemalloc.start()
+        started = time.perf_counter()
+        result = field.clean(payload)
+        elapsed = time.perf_counter() - started
+        (held, peak) = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f"{container:<8}held {held / 2 ** 20:7.1f} MiB  "
+            f"peak {peak / 2 ** 20:7.1f} MiB  {elapsed * 1e3:8.1f} ms"
+        )
+        del result
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Compare the structured errors with the formatted "Index N" messages."""
+
+import json
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django import forms  # noqa: E402
+
+from djextra.forms import ListField  # noqa: E402
+from djextra.forms.angular1 import AngularForm  # noqa: E402
+
+# What the client did to get the index back from the message.
+INDEX = re.compile(r"^Index (\d+): (.*)$", re.S)
+
+
+class TagForm(AngularForm):
+    """The form."""
+
+    tags = ListField(field=forms.IntegerField(min_value=0))
+
+
+def main(size=50000, number=1, repeat=5):
+    """Run the benchmark."""
+    data = {"tags": [str(-index) for index in range(1, size + 1)]}
+
+    def messages():
+        form = TagForm(data=data)
+        payload = json.loads(form.errors.as_json())
+        parsed = {}
+        for error in payload["tags"]:
+            (index, message) = INDEX.match(error["message"]).groups()
+            parsed[f"model.tags.{index}"] = message
+        assert len(parsed) == size
+
+    def structured():
+        form = TagForm(data=data)
+        payload = json.loads(form.ng_errors_json())
+        assert len(payload) == size
+
+    for (label, func) in (
+        ("as_json + regex", messages), ("ng_errors_json", structured)
+    ):
+        elapsed = min(timeit.repeat(func, number=number, repeat=repeat))
+        print(f"{label:<18}{elapsed / number * 1e3:10.1f} ms/{size} errors")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Compare ListField(form=...) with a formset on many rows."""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django import forms  # noqa: E402
+
+from djextra.forms import ListField  # noqa: E402
+
+
+class LineItemForm(forms.Form):
+    """Line item."""
+
+    sku = forms.CharField(max_length=32)
+    quantity = forms.IntegerField(min_value=1)
+    price = forms.DecimalField(max_digits=10, decimal_places=2)
+    note = forms.CharField(required=False)
+
+
+def main(size=10000, number=1, repeat=5):
+    """Run the benchmark."""
+    rows = [
+        {"sku": f"SKU-{index}", "quantity": str(index % 9 + 1),
+         "price": "9.99", "note": ""}
+        for index in range(size)
+    ]
+    formset_class = forms.formset_factory(
+        LineItemForm, max_num=size, absolute_max=size
+    )
+    formset_data = {"form-TOTAL_FORMS": str(size), "form-INITIAL_FORMS": "0"}
+    for (index, row) in enumerate(rows):
+        for (key, value) in row.items():
+            formset_data[f"form-{index}-{key}"] = value
+
+    def formset():
+        assert formset_class(data=formset_data).is_valid()
+
+    def form_per_row():
+        assert all(LineItemForm(data=row).is_valid() for row in rows)
+
+    field = ListField(form=LineItemForm)
+
+    def list_field():
+        field.clean(rows)
+
+    for (label, func) in (
+        ("formset", formset), ("form per row", form_per_row),
+        ("ListField(form)", list_field)
+    ):
+        elapsed = min(timeit.repeat(func, number=number, repeat=repeat))
+        print(f"{label:<18}{elapsed / number * 1e3:10.1f} ms/{size} rows")
+
+
+if __name__ == "__main__":
+    main()
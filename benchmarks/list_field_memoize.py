@@ -0,0 +1,40 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Measure ListField(memoize=True) on lists with many duplicates."""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django import forms  # noqa: E402
+
+from djextra.forms import ListField  # noqa: E402
+
+
+def main(size=20000, number=3, repeat=5):
+    """Run the benchmark."""
+    for distinct in (10, 1000, size):
+        payload = [
+            f"user{index % distinct}@example.com" for index in range(size)
+        ]
+        for memoize in (False, True):
+            field = ListField(field=forms.EmailField(), memoize=memoize)
+            elapsed = min(timeit.repeat(
+                lambda: field.clean(payload), number=number, repeat=repeat
+            ))
+            print(
+                f"distinct={distinct:<7}memoize={memoize!s:<7}"
+                f"{elapsed / number * 1e3:10.2f} ms/{size} items"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Compare the JSON list and the packed array payloads of ListField."""
+
+import base64
+import json
+import os
+import sys
+import timeit
+from array import array
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django import forms  # noqa: E402
+
+from djextra.forms import ListField  # noqa: E402
+
+
+def main(size=50000, number=10, repeat=5):
+    """Run the benchmark."""
+    values = [index / 7 for index in range(size)]
+    payloads = {
+        "json": json.dumps(values),
+        "delimited": ",".join(map(str, values)),
+        "float64": base64.b64encode(array("d", values).tobytes()).decode(),
+    }
+    fields = {
+        "json": ListField(field=forms.FloatField()),
+        "delimited": ListField(field=forms.FloatField(), delimiter=","),
+        "float64": ListField(field=forms.FloatField(), packed="float64"),
+    }
+    for (label, payload) in payloads.items():
+        field = fields[label]
+        if label == "json":
+            def clean():
+                return field.clean(json.loads(payload))
+        else:
+            def clean():
+                return field.clean(payload)
+        elapsed = min(timeit.repeat(clean, number=number, repeat=repeat))
+        print(
+            f"{label:<10}{len(payload):>10} bytes"
+            f"{elapsed / number * 1e3:10.2f} ms/{size} items"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Measure MDMultiSelect rendering with many selected values."""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from djextra.forms.angular1 import MDMultiSelect  # noqa: E402
+
+
+def main(size=10000, selected=1000, number=3, repeat=5):
+    """Run the benchmark."""
+    widget = MDMultiSelect(
+        choices=[(index, f"Label {index}") for index in range(size)]
+    )
+    value = list(range(0, size, size // selected))
+
+    def optgroups():
+        widget.optgroups("items", widget.format_value(value))
+
+    def render():
+        widget.render("items", value)
+
+    for (label, func) in (("optgroups", optgroups), ("render", render)):
+        elapsed = min(timeit.repeat(func, number=number, repeat=repeat))
+        print(
+            f"{label:<10}{elapsed / number * 1e3:9.1f} ms "
+            f"({size} options x {len(value)} selected)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Compare data-ng-init attributes with the ng-init JSON block."""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django import forms  # noqa: E402
+
+from djextra.forms.angular1 import AngularForm  # noqa: E402
+
+
+def build_form(size, mode):
+    """Return the form class that has size fields."""
+    attrs = {
+        f"field_{index}": forms.CharField() for index in range(size)
+    }
+    attrs["Meta"] = type("Meta", (object, ), {"handle_ng_init": mode})
+    return type(f"Form{size}", (AngularForm, ), attrs)
+
+
+def main(size=150, number=20, repeat=5):
+    """Run the benchmark."""
+    initial = {
+        f"field_{index}": f"Value <{index}> & \"quoted\""
+        for index in range(size)
+    }
+    for (label, mode) in (("data-ng-init", True), ("json block", "json")):
+        form_class = build_form(size, mode)
+
+        def render():
+            form = form_class(initial=initial)
+            html = "".join(str(field) for field in form)
+            if mode == "json":
+                html = str(form.ng_init_script()) + html
+            return html
+
+        elapsed = min(timeit.repeat(render, number=number, repeat=repeat))
+        print(
+            f"{label:<14}{elapsed / number * 1e3:8.2f} ms/form "
+            f"{len(render()):8d} chars"
+        )
+
+
+if __name__ == "__main__":
+    main()
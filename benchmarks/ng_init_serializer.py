@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Compare the ng-init serializers on typical initial payloads."""
+
+import json
+import os
+import sys
+import timeit
+import uuid
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.core.serializers.json import DjangoJSONEncoder  # noqa: E402
+
+from djextra.forms.angular1.serializers import (  # noqa: E402
+    Serializer, orjson, register_defaults
+)
+
+
+def payloads():
+    """Return the typical initial values of the fields."""
+    return {
+        "name": "Test User",
+        "age": 30,
+        "price": Decimal("1234.50"),
+        "created": datetime(2020, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        "birthday": date(1990, 1, 2),
+        "token": uuid.UUID(int=12345),
+        "choice": ("a", "b", "c"),
+        "tags": [f"tag-{index}" for index in range(1000)],
+        "numbers": list(range(10000)),
+    }
+
+
+def main(number=200, repeat=5):
+    """Run the benchmark."""
+    values = list(payloads().values())
+    cases = [("json.dumps(DjangoJSONEncoder)", lambda value: json.dumps(
+        value, cls=DjangoJSONEncoder
+    ))]
+    backends = ("json", "orjson") if orjson is not None else ("json", )
+    for backend in backends:
+        for memo_size in (0, 1024):
+            serializer = register_defaults(
+                Serializer(backend=backend, memo_size=memo_size)
+            )
+            cases.append((
+                f"Serializer({backend}, memo_size={memo_size})",
+                serializer.dumps
+            ))
+    for (label, dumps) in cases:
+        elapsed = min(timeit.repeat(
+            lambda: [dumps(value) for value in values],
+            number=number, repeat=repeat
+        ))
+        scalars = min(timeit.repeat(
+            lambda: [dumps(value) for value in values[:7]],
+            number=number * 10, repeat=repeat
+        ))
+        print(
+            f"{label:<34}{elapsed / number * 1e6:9.1f} us/form "
+            f"{scalars / number / 10 * 1e6:7.1f} us/scalar fields"
+        )
+
+
+if __name__ == "__main__":
+    main()
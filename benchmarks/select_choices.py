@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Measure the form instantiation with the huge choices."""
+
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django import forms  # noqa: E402
+
+from djextra.forms.angular1 import MDSelect  # noqa: E402
+from djextra.forms.angular1.choices import ChoiceTable  # noqa: E402
+
+
+def build_form(widget, choices):
+    """Return the form class that has the choice field."""
+    return type("ChoiceForm", (forms.Form, ), {
+        "item": forms.ChoiceField(choices=choices, widget=widget)
+    })
+
+
+def main(size=30000, forms_per_run=50, number=5, repeat=5):
+    """Run the benchmark."""
+    choices = [(f"value-{index}", f"Label {index}") for index in range(size)]
+    for (label, form_class) in (
+        ("Select + list", build_form(forms.Select, choices)),
+        ("MDSelect + list", build_form(MDSelect, choices)),
+        ("MDSelect + ChoiceTable", build_form(MDSelect, ChoiceTable(choices))),
+    ):
+        tracemalloc.start()
+        instances = [form_class() for _ in range(forms_per_run)]
+        (current, _) = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del instances
+        elapsed = min(timeit.repeat(
+            form_class, number=number, repeat=repeat
+        ))
+        print(
+            f"{label:<24}{elapsed / number * 1e3:8.3f} ms/form "
+            f"{current / forms_per_run / 1024:9.1f} KiB/form"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Measure MDSelect / MDMultiSelect rendering with large choice lists."""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.conf import settings  # noqa: E402
+
+from djextra.forms.angular1.widgets import (  # noqa: E402
+    MDMultiSelect, MDSelect
+)
+
+
+def measure(widget, value, number=3):
+    """Return the best render time in milliseconds."""
+    widget.render("bench", value)
+    result = []
+    for _ in range(number):
+        start = time.perf_counter()
+        widget.render("bench", value)
+        result.append(time.perf_counter() - start)
+    return min(result) * 1e3
+
+
+def main():
+    """Run the benchmark."""
+    settings.DEBUG = False
+    for size in (1000, 10000, 20000):
+        choices = [(f"v{i}", f"Label {i}") for i in range(size)]
+        single = measure(MDSelect(choices=choices), "v1")
+        selected = [f"v{i}" for i in range(0, size, 10)]
+        multi = measure(MDMultiSelect(choices=choices), selected)
+        print(
+            f"{size:>6} options  MDSelect {single:9.1f} ms  "
+            f"MDMultiSelect {multi:9.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Measure streaming MDSelect fed by a huge queryset on sqlite."""
+
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django import forms  # noqa: E402
+from django.contrib.contenttypes.models import ContentType  # noqa: E402
+from django.db import connection  # noqa: E402
+
+from djextra.forms.angular1 import MDSelect  # noqa: E402
+
+
+def measure(widget, queryset):
+    """Stream the widget, and return the elapsed time and the peak."""
+    field = forms.ModelChoiceField(queryset, widget=widget)
+    tracemalloc.start()
+    started = time.perf_counter()
+    size = sum(map(len, field.widget.stream("item", None)))
+    elapsed = time.perf_counter() - started
+    (_, peak) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (elapsed, peak, size)
+
+
+def main(sizes=(50000, 500000)):
+    """Run the benchmark."""
+    # Use the in-memory test database instead of the devel database.
+    connection.creation.create_test_db(verbosity=0)
+    created = 0
+    for size in sizes:
+        ContentType.objects.bulk_create(
+            ContentType(app_label="bench", model=f"model-{index}")
+            for index in range(created, size)
+        )
+        created = size
+        queryset = ContentType.objects.filter(app_label="bench")
+        for (label, widget) in (
+            ("ModelChoiceIterator", MDSelect()),
+            ("chunk_size=2000", MDSelect(chunk_size=2000)),
+            ("label_field=model", MDSelect(label_field="model")),
+        ):
+            (elapsed, peak, html) = measure(widget, queryset)
+            print(
+                f"{size:>7} rows {label:<20}{elapsed:7.2f} s "
+                f"peak {peak / 1024 / 1024:7.1f} MiB ({html} chars)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Measure the per-render cost of the Angular Material widgets."""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from djextra.forms.angular1.widgets import (  # noqa: E402
+    MDCheckBox, MDDatePicker, MDSelect
+)
+
+
+def main(number=2000):
+    """Run the benchmark."""
+    widgets = {
+        "MDSelect": (
+            MDSelect(choices=[(f"v{i}", f"Label {i}") for i in range(10)]),
+            "v3"
+        ),
+        "MDCheckBox": (MDCheckBox("Check"), True),
+        "MDDatePicker": (MDDatePicker(), "2020-01-01"),
+    }
+    for (label, (widget, value)) in widgets.items():
+        widget.render("bench", value)
+        elapsed = timeit.timeit(
+            lambda: widget.render("bench", value), number=number
+        )
+        print(f"{label:<14} {elapsed / number * 1e6:10.1f} us/render")
+
+
+if __name__ == "__main__":
+    main()
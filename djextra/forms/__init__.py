@@ -4,6 +4,11 @@
 """Additional forms / form fields."""
 
 from .listfield import ListField
+from .asyncform import AsyncForm
+from .jsonstream import iter_json_array
 from .forms import (AllRequiredForm, FieldAttributeForm)
 
-__all__ = ("ListField", "AllRequiredForm", "FieldAttributeForm")
+__all__ = (
+    "ListField", "AsyncForm", "AllRequiredForm", "FieldAttributeForm",
+    "iter_json_array"
+)
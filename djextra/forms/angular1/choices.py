@@ -0,0 +1,520 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Utilities to handle the choices of the select widgets."""
+
+import threading
+import time
+from bisect import bisect_left
+from collections import OrderedDict, defaultdict
+from itertools import islice
+
+from django.conf import settings
+from django.core.exceptions import EmptyResultSet, ValidationError
+from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
+from django.forms.fields import CallableChoiceIterator
+from django.forms.models import ModelChoiceIterator
+from django.utils.functional import Promise
+
+from .keys import digest
+
+# The number of the rows fetched at once by QuerySetChoices.
+DEFAULT_CHUNK_SIZE = 2000
+# Seconds the version of the model-backed choices is trusted.
+DEFAULT_VERSION_TTL = 300
+
+
+def iter_choices(choices):
+    """Iterate (value, label) pairs of the choices, flattening the groups."""
+    for (value, label) in choices:
+        if isinstance(label, (list, tuple)):
+            yield from label
+        else:
+            yield (value, label)
+
+
+def _choice_key(choices):
+    """Return the field name used to paginate the model-backed choices."""
+    return choices.field.to_field_name or "pk"
+
+
+def _keyset_ordering(queryset, key):
+    """
+    Return (field name, descending) pairs that order the queryset.
+
+    The ordering of the queryset (or the default ordering of the model) is
+    followed, and key is appended as the tie breaker. ValueError is raised
+    if the ordering can't be used for the keyset (e.g. expressions or "?").
+    """
+    query = queryset.query
+    if query.extra_order_by:
+        raise ValueError("The extra ordering can't be paged by key.")
+    ordering = list(query.order_by)
+    if not ordering and query.default_ordering:
+        ordering = list(queryset.model._meta.ordering)
+    pk_names = {"pk", queryset.model._meta.pk.name}
+    keys = pk_names if key in pk_names else {key}
+    fields = []
+    for item in ordering:
+        if not isinstance(item, str) or item == "?":
+            raise ValueError(f"The ordering {item!r} can't be paged by key.")
+        name = item.lstrip("-")
+        fields.append((name, item.startswith("-")))
+        if name in keys:
+            # The key is unique, so the rest of the ordering is irrelevant.
+            return fields
+    fields.append((key, False))
+    return fields
+
+
+def _after_filter(queryset, fields, after):
+    """Return Q that matches the rows after the row whose key is after."""
+    key = fields[-1][0]
+    if len(fields) == 1:
+        return Q(**{f"{key}__{'lt' if fields[0][1] else 'gt'}": after})
+    row = queryset.filter(**{key: after}).values_list(
+        *(name for (name, _) in fields)
+    ).first()
+    if row is None:
+        raise ValueError(f"No choice has the value {after!r}.")
+    if None in row:
+        raise ValueError("The row having NULL can't be paged by key.")
+    condition = Q(pk__in=[])
+    equals = {}
+    for ((name, descending), value) in zip(fields, row):
+        condition |= Q(
+            **equals, **{f"{name}__{'lt' if descending else 'gt'}": value}
+        )
+        equals[name] = value
+    return condition
+
+
+def _page_queryset(queryset, key, empty_label, rows, offset, limit, after):
+    """
+    Return the page of the queryset converted into choices by rows.
+
+    The pages keep the ordering of the queryset (ordered by key if it's
+    unordered). The page after the key is fetched with the row comparison on
+    the ordering with key as the tie breaker, and ValueError is raised if
+    after can't be used.
+    """
+    page = []
+    if after is not None:
+        fields = _keyset_ordering(queryset, key)
+        ordered = queryset.order_by(*(
+            f"-{name}" if descending else name
+            for (name, descending) in fields
+        )).filter(_after_filter(queryset, fields, after))
+    else:
+        ordered = queryset if queryset.ordered else queryset.order_by(key)
+    if after is None and empty_label is not None:
+        if offset:
+            offset -= 1
+        else:
+            page.append(("", empty_label))
+            limit = None if limit is None else limit - 1
+    stop = None if limit is None else offset + limit
+    page.extend(rows(ordered[offset:stop]))
+    return page
+
+
+def page_choices(choices, offset=0, limit=None, after=None):
+    """
+    Return a page of the choices as a list of (value, label) pairs.
+
+    If after is specified, the page starts at the next of the choice that
+    has the value (i.e. keyset pagination). The model-backed choices
+    (i.e. the choices of ModelChoiceField) are fetched with LIMIT / OFFSET,
+    or with the row comparison on the ordering of the queryset and
+    to_field_name (or pk) when after is specified. ValueError is raised if
+    the queryset can't be paged by after (e.g. ordered by an expression).
+    """
+    if isinstance(choices, ModelChoiceIterator):
+        return _page_queryset(
+            choices.queryset, _choice_key(choices), choices.field.empty_label,
+            lambda queryset: map(choices.choice, queryset),
+            offset, limit, after
+        )
+    if isinstance(choices, QuerySetChoices):
+        return _page_queryset(
+            choices.queryset, choices.value_field, choices.empty_label,
+            choices.rows, offset, limit, after
+        )
+    items = iter_choices(choices)
+    if after is not None:
+        after = str(after)
+        for (value, _) in items:
+            if str(value) == after:
+                break
+    stop = None if limit is None else offset + limit
+    return list(islice(items, offset, stop))
+
+
+def find_choices(choices, values):
+    """Return (value, label) pairs of the choices that have the values."""
+    if isinstance(choices, ModelChoiceIterator):
+        try:
+            return [
+                choices.choice(obj) for obj in choices.queryset.filter(**{
+                    f"{_choice_key(choices)}__in": values
+                })
+            ]
+        except (ValueError, TypeError, ValidationError):
+            return []
+    if isinstance(choices, QuerySetChoices):
+        try:
+            return list(choices.rows(choices.queryset.filter(**{
+                f"{choices.value_field}__in": values
+            })))
+        except (ValueError, TypeError, ValidationError):
+            return []
+    values = set(values)
+    return [
+        (value, label) for (value, label) in iter_choices(choices)
+        if str(value) in values
+    ]
+
+
+_model_versions = {}
+_model_version_lock = threading.Lock()
+
+
+def _bump_model_version(sender, **kwargs):
+    """Invalidate the versions of the choices of the model."""
+    with _model_version_lock:
+        _model_versions[sender] += 1
+
+
+def _queryset_version(queryset):
+    """
+    Return the model, the query and the version of the model.
+
+    The version is bumped by post_save / post_delete in this process, and
+    also changes every DJEXTRA_CHOICE_VERSION_TTL seconds (300 by default,
+    None to disable) so that the changes the signals don't catch (e.g. the
+    other processes, QuerySet.update(), bulk_create() or raw SQL) are picked
+    up at last.
+    """
+    model = queryset.model
+    ttl = getattr(
+        settings, "DJEXTRA_CHOICE_VERSION_TTL", DEFAULT_VERSION_TTL
+    )
+    period = None if not ttl else int(time.time() // ttl)
+    with _model_version_lock:
+        if model not in _model_versions:
+            post_save.connect(_bump_model_version, sender=model)
+            post_delete.connect(_bump_model_version, sender=model)
+            _model_versions[model] = 0
+        version = _model_versions[model]
+    try:
+        query = str(queryset.query)
+    except EmptyResultSet:
+        query = ""
+    return (model._meta.label, query, version, period)
+
+
+def choice_version(choices):
+    """
+    Return the hashable version of the choices.
+
+    The version of the model-backed choices is bumped when the model is saved
+    or deleted in this process, and expires after DJEXTRA_CHOICE_VERSION_TTL
+    seconds. The version of the other choices is the digest of the values
+    and labels, or None if it can't be computed (e.g. the values are model
+    instances).
+    """
+    if isinstance(choices, ModelChoiceIterator):
+        return _queryset_version(choices.queryset) + (
+            choices.field.to_field_name, str(choices.field.empty_label)
+        )
+    if isinstance(choices, QuerySetChoices):
+        return _queryset_version(choices.queryset) + (
+            choices.value_field, choices.label_field, str(choices.empty_label)
+        )
+    if isinstance(choices, ChoiceTable):
+        return choices.version
+    return _digest_choices(choices)
+
+
+def _digest_choices(choices):
+    """
+    Return the digest of the values and labels of the choices.
+
+    The digest tells the types (e.g. 1 and True) and is stable between the
+    processes. None is returned if the choices can't be frozen.
+    """
+    try:
+        return digest(tuple(choices))
+    except TypeError:
+        return None
+
+
+class ChoiceTable(tuple):
+    """
+    Immutable choices shared between the widgets and the forms.
+
+    copy / deepcopy return the table itself, so the choices aren't copied
+    when a form copies its fields. The table is also callable returning
+    itself so that ChoiceField keeps it as CallableChoiceIterator instead of
+    copying it into a list. The version (see choice_version) is computed on
+    the first use, and kept unless the table has lazy strings (they are
+    translated on each use).
+    """
+
+    def __new__(cls, choices=()):
+        """Build the table, converting the groups into tuples."""
+        return super().__new__(cls, (
+            (value, tuple(map(tuple, label)))
+            if isinstance(label, (list, tuple)) else
+            (value, label)
+            for (value, label) in choices
+        ))
+
+    @property
+    def version(self):
+        """Return the digest of the values and labels."""
+        version = self.__dict__.get("_version")
+        if version is None:
+            version = _digest_choices(self)
+            if not _has_lazy(self):
+                self._version = version
+        return version
+
+    def __copy__(self):
+        """Return the table itself."""
+        return self
+
+    def __deepcopy__(self, memo):
+        """Return the table itself."""
+        return self
+
+    def __call__(self):
+        """Return the table itself."""
+        return self
+
+
+class QuerySetChoices(object):
+    """
+    Choices streamed from the queryset chunk by chunk.
+
+    Only value_field and label_field are fetched with values_list(), and the
+    rows are iterated with iterator(chunk_size=...), so neither the model
+    instances nor the rows are kept in memory. If label_field is None, the
+    instances are iterated instead and labelled by label_from_instance.
+    empty_label comes first unless it's None.
+
+    Like ChoiceTable, the choices are callable returning themselves and
+    aren't copied, so ChoiceField doesn't turn them into a list.
+    """
+
+    def __init__(
+        self, queryset, value_field="pk", label_field=None,
+        chunk_size=DEFAULT_CHUNK_SIZE, empty_label=None,
+        label_from_instance=str
+    ):
+        """Init the choices."""
+        self.queryset = queryset
+        self.value_field = value_field
+        self.label_field = label_field
+        self.chunk_size = chunk_size
+        self.empty_label = empty_label
+        self.label_from_instance = label_from_instance
+
+    def rows(self, queryset):
+        """Iterate (value, label) pairs of the rows of the queryset."""
+        if self.label_field is not None:
+            return queryset.values_list(
+                self.value_field, self.label_field
+            ).iterator(chunk_size=self.chunk_size)
+        if not queryset._prefetch_related_lookups:
+            # iterator() can't be used with prefetch_related().
+            queryset = queryset.iterator(chunk_size=self.chunk_size)
+        return (
+            (getattr(obj, self.value_field), self.label_from_instance(obj))
+            for obj in queryset
+        )
+
+    def __iter__(self):
+        """Iterate the choices."""
+        if self.empty_label is not None:
+            yield ("", self.empty_label)
+        yield from self.rows(self.queryset)
+
+    def __copy__(self):
+        """Return the choices themselves."""
+        return self
+
+    def __deepcopy__(self, memo):
+        """Return the choices themselves."""
+        return self
+
+    def __call__(self):
+        """Return the choices themselves."""
+        return self
+
+
+_tables = OrderedDict()
+_table_lock = threading.Lock()
+MAX_TABLES = 256
+# The number of the choices the interned tables can have in total.
+MAX_TABLE_ITEMS = 65536
+_table_items = 0
+
+
+def _has_lazy(table):
+    """Return True if the table (or its groups) has lazy strings."""
+    return any(
+        isinstance(value, Promise) or isinstance(label, Promise) or
+        (isinstance(label, tuple) and _has_lazy(label))
+        for (value, label) in table
+    )
+
+
+def intern_choices(choices):
+    """
+    Return the shared ChoiceTable that has the same choices.
+
+    The tables are shared by the digest of the values and labels (see
+    choice_version) that tells their types, and the tables having lazy
+    strings aren't shared. The tables are kept in the process up to
+    MAX_TABLES tables and MAX_TABLE_ITEMS choices in total, evicting the least
+    recently used ones. The choices that aren't a list nor a tuple (e.g. the
+    choices of ModelChoiceField, or QuerySetChoices) are returned as they are.
+    """
+    if isinstance(choices, ChoiceTable):
+        return choices
+    if isinstance(choices, CallableChoiceIterator) and isinstance(
+        choices.choices_func, (ChoiceTable, QuerySetChoices)
+    ):
+        return choices.choices_func
+    if not isinstance(choices, (list, tuple)):
+        return choices
+    table = ChoiceTable(choices)
+    # The lazy strings are translated on rendering (maybe before the apps are
+    # ready), and must not be replaced by the equal strings of the other
+    # table.
+    if _has_lazy(table) or len(table) > MAX_TABLE_ITEMS or \
+            table.version is None:
+        return table
+    with _table_lock:
+        shared = _tables.get(table.version)
+        if shared is not None:
+            # The digest tells the types, so the tables are the same.
+            _tables.move_to_end(table.version)
+            return shared
+        _store_table(table)
+    return table
+
+
+def _store_table(table):
+    """Store the table, evicting the least recently used ones."""
+    global _table_items
+    _tables[table.version] = table
+    _table_items += len(table)
+    while len(_tables) > MAX_TABLES or _table_items > MAX_TABLE_ITEMS:
+        (_, evicted) = _tables.popitem(last=False)
+        _table_items -= len(evicted)
+
+
+class ChoiceIndex(object):
+    """
+    Search index over the labels of the choices.
+
+    The labels are case-folded and indexed both as a sorted list (for prefix
+    search with bisect) and as a trigram map (for substring search).
+    """
+
+    def __init__(self, choices):
+        """Build the index."""
+        self.choices = [
+            ("" if value is None else str(value), str(label))
+            for (value, label) in iter_choices(choices)
+        ]
+        self.labels = [label.casefold() for (_, label) in self.choices]
+        self.sorted = sorted(
+            (label, position) for (position, label) in enumerate(self.labels)
+        )
+        self.trigrams = defaultdict(list)
+        for (position, label) in enumerate(self.labels):
+            for gram in {label[idx:idx + 3] for idx in range(len(label) - 2)}:
+                self.trigrams[gram].append(position)
+
+    def _prefix(self, query):
+        """Iterate the positions of the labels that start with the query."""
+        for idx in range(
+            bisect_left(self.sorted, (query, -1)), len(self.sorted)
+        ):
+            (label, position) = self.sorted[idx]
+            if not label.startswith(query):
+                break
+            yield position
+
+    def _substring(self, query):
+        """Iterate the positions of the labels that contain the query."""
+        if len(query) < 3:
+            candidates = range(len(self.labels))
+        else:
+            postings = sorted(
+                (
+                    self.trigrams.get(query[idx:idx + 3], ())
+                    for idx in range(len(query) - 2)
+                ),
+                key=len
+            )
+            candidates = set(postings[0])
+            for posting in postings[1:]:
+                candidates.intersection_update(posting)
+            candidates = sorted(candidates)
+        return (
+            position for position in candidates
+            if query in self.labels[position]
+        )
+
+    def search(self, query, limit=10):
+        """
+        Return (value, label) pairs of the labels that match the query.
+
+        The labels that start with the query come first in alphabetical
+        order, and the labels that contain the query follow in the order of
+        the choices.
+        """
+        query = query.casefold()
+        found = dict.fromkeys(islice(self._prefix(query), limit))
+        if len(found) < limit:
+            for position in self._substring(query):
+                found.setdefault(position)
+                if len(found) >= limit:
+                    break
+        return [self.choices[position] for position in found]
+
+
+_indexes = OrderedDict()
+_index_lock = threading.Lock()
+MAX_INDEXES = 32
+
+
+def get_choice_index(choices, version=None):
+    """
+    Return the index of the choices, building it once per choice set.
+
+    The indexes are kept in the process, and are rebuilt when the version
+    (choice_version by default) of the choices changes. Only MAX_INDEXES
+    indexes are kept, evicting the least recently used one. The index of the
+    choices having no version is built on each call.
+    """
+    if version is None:
+        version = choice_version(choices)
+        if version is None:
+            return ChoiceIndex(choices)
+    with _index_lock:
+        index = _indexes.get(version)
+        if index is not None:
+            _indexes.move_to_end(version)
+            return index
+    index = ChoiceIndex(choices)
+    with _index_lock:
+        _indexes[version] = index
+        while len(_indexes) > MAX_INDEXES:
+            _indexes.popitem(last=False)
+    return index
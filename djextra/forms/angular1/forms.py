@@ -4,49 +4,206 @@
 """Django AngularJS Helper Froms."""
 
 import json
+from collections import namedtuple
 from datetime import date
-from functools import wraps
-from django import forms
-
-
-class AngularForm(forms.Form):
-    """AngularJS Form."""
-
-    def __wrap_ng_init(self, f, fld):
-        """Wrap ng-init attribute."""
-        @wraps(f)
-        def inside(name, value, attrs):
-            format_func = getattr(
-                fld, "ng_init_format_func",
-                lambda v: (
-                    fld.widget.format_value(v)
-                    if isinstance(v, (date, str)) else
-                    v
-                )
+from functools import partial
+
+from django.core.exceptions import NON_FIELD_ERRORS
+from django.utils.html import format_html
+from django.utils.safestring import mark_safe
+
+from ..asyncform import AsyncForm
+from ..listfield import iter_errors
+from .serializers import default_serializer
+from .widgets.base import DEFAULT_CHUNK_SIZE, chunked
+
+NgModelPlan = namedtuple(
+    "NgModelPlan",
+    ("prefix", "handle_ng_init", "format_funcs", "models", "serializer")
+)
+# handle_ng_init mode that puts the initial values into one script block.
+NG_INIT_JSON = "json"
+# The same escapes as django.utils.html.json_script.
+_JSON_SCRIPT_ESCAPES = {
+    ord(">"): "\\u003E",
+    ord("<"): "\\u003C",
+    ord("&"): "\\u0026",
+}
+
+
+def _ng_init_value(fld, value, format_func=None):
+    """
+    Return the value of the field to be dumped for ng-init.
+
+    The date / str is formatted by the widget like the value of the input, so
+    the serializer encodes the dates in the containers only.
+    """
+    if format_func is None:
+        return (
+            fld.widget.format_value(value)
+            if isinstance(value, (date, str)) else
+            value
+        )
+    return format_func(value)
+
+
+def _get_context_with_ng_init(
+    get_context, fld, serializer, name, value, attrs
+):
+    """Call get_context with ng-init attribute."""
+    value_to_dump = _ng_init_value(
+        fld, value, getattr(fld, "ng_init_format_func", None)
+    )
+    model_var = \
+        fld.widget.attrs.get("data-ng-model") or attrs["data-ng-model"]
+    attrs["data-ng-init"] = \
+        f"{model_var} = {serializer.dumps(value_to_dump)}"
+    return get_context(name, value, attrs)
+
+
+class AngularForm(AsyncForm):
+    """
+    AngularJS Form.
+
+    Meta options are resolved once per form class into NgModelPlan, and the
+    instances only apply it to their fields.
+
+    The initial values are dumped by Meta.ng_init_serializer (default:
+    serializers.default_serializer) that has the encoders per type. The dumps
+    are compact and not ASCII-escaped in data-ng-init too.
+
+    If Meta.handle_ng_init is "json", the initial values aren't put into
+    data-ng-init of each field. Instead, ng_init_script() renders them as one
+    JSON block that is assigned to the models by djextra/ng-init.js.
+    """
+
+    @classmethod
+    def get_ng_model_plan(cls):
+        """Return the ng-model wiring of the form class."""
+        # Metaclass can't be used here because it conflicts with the
+        # metaclass of ModelForm. The plan is built on the first
+        # instantiation instead, and kept on the class.
+        plan = cls.__dict__.get("_ng_model_plan")
+        if plan is None:
+            metaclass = getattr(cls, "Meta", type("Meta", (object,), {}))
+            prefix = getattr(metaclass, "ng_model_prefix", "model")
+            plan = NgModelPlan(
+                prefix, getattr(metaclass, "handle_ng_init", False),
+                getattr(metaclass, "ng_init_format_func", {}),
+                {name: f"{prefix}.{name}" for name in cls.base_fields},
+                getattr(metaclass, "ng_init_serializer", default_serializer)
             )
-            model_var = \
-                fld.widget.attrs.get("data-ng-model") or attrs["data-ng-model"]
-            attrs["data-ng-init"] = \
-                f"{model_var} = {json.dumps(format_func(value))}"
-            return f(name, value, attrs)
-        return inside
+            cls._ng_model_plan = plan
+        return plan
 
     def __init__(self, *args, **kwargs):
         """Init the function."""
         super().__init__(*args, **kwargs)
-        metaclass = getattr(self, "Meta", type("Meta", (object,), {}))
-        handle_ng_init = getattr(metaclass, "handle_ng_init", False)
-        ng_init_format_func = getattr(metaclass, "ng_init_format_func", {})
-        self.ng_model_prefix = getattr(metaclass, "ng_model_prefix", "model")
+        plan = self.get_ng_model_plan()
+        self.ng_model_prefix = plan.prefix
 
         for (name, field) in self.fields.items():
-            model = f"{self.ng_model_prefix}.{name}"
+            model = plan.models.get(name) or f"{plan.prefix}.{name}"
             field.widget.attrs.setdefault("data-ng-model", model)
-            if handle_ng_init:
-                if name in ng_init_format_func:
-                    setattr(
-                        field, "ng_init_format_func",
-                        ng_init_format_func[name]
-                    )
-                tmp = field.widget.get_context
-                field.widget.get_context = self.__wrap_ng_init(tmp, field)
+            if plan.handle_ng_init and plan.handle_ng_init != NG_INIT_JSON:
+                if name in plan.format_funcs:
+                    field.ng_init_format_func = plan.format_funcs[name]
+                field.widget.get_context = partial(
+                    _get_context_with_ng_init, field.widget.get_context,
+                    field, plan.serializer
+                )
+
+    def ng_init_data(self):
+        """Return the dict of the ng-model path and its initial value."""
+        format_funcs = self.get_ng_model_plan().format_funcs
+        return {
+            field.widget.attrs["data-ng-model"]: _ng_init_value(
+                field, self[name].value(), format_funcs.get(name)
+            ) for (name, field) in self.fields.items()
+        }
+
+    def ng_init_script(self, element_id=None):
+        """
+        Render the initial values as a JSON script block.
+
+        The values are dumped at once, and djextraNgInit directive of
+        djextra/ng-init.js assigns them to the models on link. Put the block
+        into the scope of the form:
+
+        ```HTML
+        <form>{{ form.ng_init_script() }}{{ form.as_p() }}</form>
+        ```
+        """
+        if element_id is None:
+            element_id = "-".join(
+                filter(None, (self.prefix, self.ng_model_prefix, "ng-init"))
+            )
+        payload = self.get_ng_model_plan().serializer.dumps(
+            self.ng_init_data()
+        ).translate(_JSON_SCRIPT_ESCAPES)
+        return format_html(
+            "<script id=\"{}\" type=\"application/json\" "
+            "data-djextra-ng-init>{}</script>",
+            element_id, mark_safe(payload)
+        )
+
+    @property
+    def ng_errors(self):
+        """
+        Return the errors keyed by the ng-model path.
+
+        The errors of the list items are keyed by the path of the item, e.g.
+        "model.tags.3" (or "model.lines.3.name" for the form items), and the
+        non-field errors are keyed by ng_model_prefix. Each error is
+        {"message": ..., "code": ...}.
+        """
+        result = {}
+        for (name, errors) in self.errors.as_data().items():
+            if name == NON_FIELD_ERRORS:
+                model = self.ng_model_prefix
+            else:
+                model = self.fields[name].widget.attrs.get(
+                    "data-ng-model"
+                ) or f"{self.ng_model_prefix}.{name}"
+            for (path, entry) in iter_errors(errors):
+                key = ".".join((model, *map(str, path))) if path else model
+                result.setdefault(key, []).append(entry)
+        return result
+
+    def ng_errors_json(self):
+        """Return ng_errors as the compact JSON."""
+        return json.dumps(self.ng_errors, separators=(",", ":"))
+
+    def generate_field(self, field):
+        """Render the bound field as fragments."""
+        widget = field.field.widget
+        if not hasattr(widget, "generate"):
+            yield str(field)
+            return
+        if field.field.localize:
+            widget.is_localized = True
+        attrs = field.build_widget_attrs({}, widget)
+        if field.auto_id and "id" not in widget.attrs:
+            attrs.setdefault("id", field.auto_id)
+        yield from widget.generate(
+            field.html_name, field.value(), attrs, self.renderer
+        )
+        if field.field.show_hidden_initial:
+            yield field.as_hidden(only_initial=True)
+
+    def stream(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Render the fields as an iterator of chunks.
+
+        The joined chunks are the same as rendering each field in order,
+        i.e. {% for field in form %}{{ field }}{% endfor %}. The iterator can
+        be passed to StreamingHttpResponse.
+        """
+        return chunked(
+            (
+                fragment
+                for field in self
+                for fragment in self.generate_field(field)
+            ),
+            chunk_size
+        )
@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Hashable keys of the values that have the stable repr."""
+
+import datetime
+import hashlib
+import types
+import uuid
+from decimal import Decimal
+
+from django.utils.functional import Promise
+
+# The types whose equal values are rendered in the same way.
+_EXACT = (str, int, bool, type(None))
+# The types whose equal values can be rendered differently (e.g. 0.0 and
+# -0.0, Decimal("1") and Decimal("1.0"), or the same moment in other
+# timezones); the repr tells the difference.
+_BY_REPR = (float, datetime.date, datetime.time, Decimal, uuid.UUID)
+
+
+def _freeze_exact(value):
+    """Tag with the type so that True, 1 and 1.0 don't share the key."""
+    return (type(value).__qualname__, value)
+
+
+def _freeze_by_repr(value):
+    """Return the key of the value whose repr tells the difference."""
+    return (type(value).__qualname__, repr(value))
+
+
+def _freeze_promise(value):
+    """Return the key of the lazy string."""
+    return ("str", str(value))
+
+
+def _freeze_dict(value):
+    """Return the key of the dict."""
+    return ("dict",) + tuple(
+        (freeze(key), freeze(item)) for (key, item) in value.items()
+    )
+
+
+def _freeze_sequence(value):
+    """Return the key of the list / tuple."""
+    return tuple(freeze(item) for item in value)
+
+
+def _freeze_range(value):
+    """Return the key of the range."""
+    return ("range", value.start, value.stop, value.step)
+
+
+def _freeze_class(value):
+    """Return the key of the class."""
+    return ("callable", value.__module__, value.__qualname__)
+
+
+def _freeze_function(value):
+    """Return the key of the function that isn't lambda nor local."""
+    if "<" in value.__qualname__:
+        _unfreezable(value)
+    return _freeze_class(value)
+
+
+def _unfreezable(value):
+    """Raise TypeError for the value that can't be the key."""
+    raise TypeError(f"{type(value).__name__} can't be a key of the cache.")
+
+
+# (types, function that converts the value of the types into the key)
+_FREEZERS = (
+    (_EXACT, _freeze_exact),
+    (_BY_REPR, _freeze_by_repr),
+    (Promise, _freeze_promise),
+    (dict, _freeze_dict),
+    ((list, tuple), _freeze_sequence),
+    (range, _freeze_range),
+    (type, _freeze_class),
+    (types.FunctionType, _freeze_function),
+)
+
+
+# The freezers of the exact types, looked up before the isinstance checks.
+_FREEZERS_BY_TYPE = {
+    cls: func for (classes, func) in _FREEZERS[:2] for cls in classes
+}
+_FREEZERS_BY_TYPE.update({
+    dict: _freeze_dict, list: _freeze_sequence, tuple: _freeze_sequence
+})
+
+
+def freeze(value):
+    """
+    Convert value into a hashable key that has the stable repr.
+
+    TypeError is raised if the value can't be represented so; the objects
+    whose repr depends on the memory address (e.g. lambda) can't be shared
+    via Django's cache framework safely.
+    """
+    func = _FREEZERS_BY_TYPE.get(type(value))
+    if func is not None:
+        return func(value)
+    for (classes, func) in _FREEZERS:
+        if isinstance(value, classes):
+            return func(value)
+    return _unfreezable(value)
+
+
+def digest(value):
+    """
+    Return the SHA-1 digest of the frozen value.
+
+    Unlike hash(), the digest doesn't change between the processes (the
+    hashes of str are randomized), so it can be shared via Django's cache
+    framework. TypeError is raised if the value can't be frozen.
+    """
+    return hashlib.sha1(repr(freeze(value)).encode("utf-8")).hexdigest()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Serializers of the initial values for ng-init."""
+
+import datetime
+import json
+import threading
+import uuid
+from array import array
+from collections import OrderedDict
+from decimal import Decimal
+from functools import singledispatch
+
+from django.utils.functional import Promise
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+BACKENDS = ("json", "orjson")
+DEFAULT_MEMO_SIZE = 1024
+# The types whose values can't be changed after they are rendered.
+_IMMUTABLE = frozenset((str, int, bool, type(None), uuid.UUID))
+_TEMPORAL = frozenset((datetime.date, datetime.datetime, datetime.time))
+
+
+def _memo_key(value):
+    """
+    Return the key of the memo, or None if value might be changed.
+
+    The equal values can be dumped differently (e.g. 1 and True, 0.0 and
+    -0.0, Decimal("1.0") and Decimal("1.00"), or the same time in the other
+    timezones), so the key has what makes the difference.
+    """
+    cls = type(value)
+    if cls in _IMMUTABLE:
+        return (cls, value)
+    if cls is float:
+        return (cls, repr(value))
+    if cls is Decimal:
+        return (cls, str(value))
+    if cls in _TEMPORAL:
+        return (cls, value, getattr(value, "tzinfo", None))
+    if cls in (tuple, frozenset):
+        keys = tuple(_memo_key(item) for item in value)
+        if any(key is None for key in keys):
+            return None
+        return (cls, keys if cls is tuple else frozenset(keys))
+    return None
+
+
+def _unsupported(value):
+    """Raise TypeError for the value that has no encoder."""
+    raise TypeError(
+        f"Object of type {type(value).__name__} is not JSON serializable."
+    )
+
+
+class Serializer(object):
+    """
+    Registry of the encoders that dumps the values into JSON.
+
+    The encoders are dispatched by the type (functools.singledispatch), and
+    convert the values that JSON doesn't support into the ones it supports.
+    backend is "json" or "orjson" (the default if orjson is installed), and
+    both write the compact JSON without escaping non-ASCII chars. The dumps
+    of the immutable values (e.g. the defaults of the choices) are kept up to
+    memo_size values.
+    """
+
+    def __init__(self, backend=None, memo_size=DEFAULT_MEMO_SIZE):
+        """Init the serializer."""
+        if backend is None:
+            backend = "json" if orjson is None else "orjson"
+        if backend not in BACKENDS:
+            raise ValueError(f"backend must be one of {', '.join(BACKENDS)}.")
+        if backend == "orjson" and orjson is None:
+            raise ValueError("orjson isn't installed.")
+        self.backend = backend
+        self.encode = singledispatch(_unsupported)
+        self.memo_size = memo_size
+        self.memo = OrderedDict()
+        self.lock = threading.Lock()
+        self._encoder = json.JSONEncoder(
+            default=self.encode, ensure_ascii=False, separators=(",", ":")
+        )
+
+    def register(self, cls, func=None):
+        """
+        Register the encoder of cls. Usable as a decorator.
+
+        The memo is dropped because the dumps might be changed.
+        """
+        self.clear()
+        return self.encode.register(cls, func)
+
+    def clear(self):
+        """Drop the memo."""
+        with self.lock:
+            self.memo.clear()
+
+    def _dumps(self, value):
+        """Dump value into JSON with the backend."""
+        if self.backend == "orjson":
+            return orjson.dumps(
+                value, default=self.encode, option=(
+                    orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+                )
+            ).decode("utf-8")
+        return self._encoder.encode(value)
+
+    def dumps(self, value):
+        """Dump value into JSON."""
+        key = _memo_key(value) if self.memo_size else None
+        if key is None:
+            return self._dumps(value)
+        with self.lock:
+            dumped = self.memo.get(key)
+            if dumped is not None:
+                self.memo.move_to_end(key)
+                return dumped
+        dumped = self._dumps(value)
+        with self.lock:
+            self.memo[key] = dumped
+            if len(self.memo) > self.memo_size:
+                self.memo.popitem(last=False)
+        return dumped
+
+
+def _isoformat(value):
+    """Return ISO 8601 format of the date / time."""
+    return value.isoformat()
+
+
+def _to_str(value):
+    """Return str of the value."""
+    return str(value)
+
+
+def _to_list(value):
+    """Return list of the value."""
+    return list(value)
+
+
+def _to_number_list(value):
+    """Return list of the array."""
+    return value.tolist()
+
+
+def register_defaults(serializer):
+    """Register the encoders of the standard types into serializer."""
+    for cls in (datetime.date, datetime.datetime, datetime.time):
+        serializer.register(cls, _isoformat)
+    for cls in (Decimal, uuid.UUID, Promise):
+        serializer.register(cls, _to_str)
+    for cls in (set, frozenset):
+        serializer.register(cls, _to_list)
+    serializer.register(array, _to_number_list)
+    if numpy is not None:
+        serializer.register(numpy.ndarray, _to_number_list)
+        serializer.register(numpy.generic, _to_number_list)
+    return serializer
+
+
+default_serializer = register_defaults(Serializer())
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Views for AngularJS widgets."""
+
+from django.core.exceptions import ValidationError
+from django.http import HttpResponseBadRequest, JsonResponse
+from django.views.generic import View
+
+from .choices import get_choice_index, page_choices
+
+
+class ChoicePageView(View):
+    """
+    Serve the choices of a form field page by page as JSON.
+
+    This view is the companion of MDSelect with page_size. The query
+    parameters are offset, limit and after (the value of the last choice the
+    client has, for keyset pagination). The response looks like this:
+
+    ```JSON
+    {
+        "results": [{"value": "1", "label": "Item 1"}],
+        "has_next": true
+    }
+    ```
+
+    Example:
+    ```Python
+    path("items/choices", ChoicePageView.as_view(
+        form_class=ItemForm, field_name="item"
+    ))
+    ```
+    """
+
+    form_class = None
+    field_name = None
+    page_size = 50
+    max_page_size = 500
+
+    def get_choices(self):
+        """Return the choices to paginate."""
+        return self.form_class.base_fields[self.field_name].choices
+
+    def get(self, request, *args, **kwargs):
+        """Return the page of the choices."""
+        try:
+            offset = int(request.GET.get("offset", 0))
+            limit = int(request.GET.get("limit", self.page_size))
+        except ValueError:
+            return HttpResponseBadRequest()
+        if offset < 0 or limit < 1:
+            return HttpResponseBadRequest()
+        limit = min(limit, self.max_page_size)
+        try:
+            page = page_choices(
+                self.get_choices(), offset, limit + 1,
+                request.GET.get("after")
+            )
+        except (ValueError, ValidationError):
+            return HttpResponseBadRequest()
+        return JsonResponse({
+            "results": [
+                {
+                    "value": "" if value is None else str(value),
+                    "label": str(label)
+                } for (value, label) in page[:limit]
+            ],
+            "has_next": len(page) > limit
+        })
+
+
+class ChoiceSearchView(ChoicePageView):
+    """
+    Search the choices of a form field by the label.
+
+    The query parameters are q (the query) and limit. The labels that start
+    with the query come first, followed by the labels that contain it. The
+    search index is built once per choice set and shared in the process.
+    """
+
+    page_size = 10
+
+    def get(self, request, *args, **kwargs):
+        """Return the matched choices."""
+        try:
+            limit = int(request.GET.get("limit", self.page_size))
+        except ValueError:
+            return HttpResponseBadRequest()
+        if limit < 1:
+            return HttpResponseBadRequest()
+        index = get_choice_index(self.get_choices())
+        return JsonResponse({
+            "results": [
+                {"value": value, "label": label}
+                for (value, label) in index.search(
+                    request.GET.get("q", ""), min(limit, self.max_page_size)
+                )
+            ]
+        })
@@ -4,19 +4,33 @@
 """Base classes."""
 
 import os
+import threading
 
+from django.conf import settings
+from django.forms.models import ModelChoiceIterator
 from django.forms.widgets import Widget
 from django.forms.renderers import Jinja2 as Jinja2Base
+from django.forms.renderers import get_default_renderer as get_form_renderer
 from django.utils.safestring import mark_safe
 from django.utils.functional import cached_property
+from django.utils.translation import get_language
+
+from ..choices import QuerySetChoices, choice_version
+from ..keys import freeze
+from .compiled import PrecompiledLoader
 
 
 class Jinja2Engine(Jinja2Base):
-    """Jinja2 template engine."""
+    """
+    Jinja2 template engine.
 
-    @cached_property
-    def engine(self):
-        """Return engine setting."""
+    If DJEXTRA_COMPILED_WIDGET_TEMPLATES setting points the bundle generated
+    by compilewidgets command, the templates are served from the bundle
+    without auto-reloading.
+    """
+
+    def _build_engine(self, options):
+        """Build the engine with the options."""
         return self.backend({
             'DIRS': [
                 os.path.join(
@@ -26,15 +40,160 @@ class Jinja2Engine(Jinja2Base):
             ],
             'APP_DIRS': True,
             'NAME': "djextra-widgets",
-            'OPTIONS': {}
+            'OPTIONS': options
         })
 
+    @cached_property
+    def source_engine(self):
+        """Return the engine that reads the template sources."""
+        return self._build_engine({})
+
+    @cached_property
+    def engine(self):
+        """Return engine setting."""
+        bundle = getattr(settings, "DJEXTRA_COMPILED_WIDGET_TEMPLATES", None)
+        if not bundle:
+            return self.source_engine
+        return self._build_engine({
+            "loader": PrecompiledLoader(bundle),
+            "auto_reload": False
+        })
+
+
+DEFAULT_CHUNK_SIZE = 8192
+_QUERYSET_CHOICES = (ModelChoiceIterator, QuerySetChoices)
+
+_renderer_lock = threading.Lock()
+_renderer = None
+
+
+def get_default_renderer():
+    """
+    Return the renderer shared by the widgets in the process.
+
+    When FORM_RENDERER points Jinja2Engine (or its subclass), the renderer
+    Django instantiated is used so that the forms and the widgets share the
+    same environment and template cache. Otherwise, a renderer is built once
+    per process.
+    """
+    global _renderer
+    renderer = get_form_renderer()
+    if isinstance(renderer, Jinja2Engine):
+        return renderer
+    if _renderer is None:
+        with _renderer_lock:
+            if _renderer is None:
+                renderer = Jinja2Engine()
+                # Build the environment while the lock is held so that
+                # concurrent first renders don't construct it twice.
+                renderer.engine
+                _renderer = renderer
+    return _renderer
+
+
+def chunked(fragments, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Join the fragments into chunks that have chunk_size chars at least."""
+    buffer = []
+    size = 0
+    for fragment in fragments:
+        buffer.append(fragment)
+        size += len(fragment)
+        if size >= chunk_size:
+            yield "".join(buffer)
+            buffer = []
+            size = 0
+    if buffer:
+        yield "".join(buffer)
+
 
 class BaseWidget(Widget):
-    """Base widget to render the widget properly."""
+    """
+    Base widget to render the widget properly.
+
+    If fragment_cache (FragmentCache) is given, the rendered html is cached
+    by the class, name, value, attrs, the configuration of the widget and the
+    version of the choices. The cache is bypassed if get_context is
+    overridden on the instance (e.g. by FieldAttributeForm), or the choices
+    are model-backed and the cache has the backend shared between the
+    processes.
+    """
+
+    fragment_cache = None
+
+    def __init__(self, *args, fragment_cache=None, **kwargs):
+        """Init the widget."""
+        super().__init__(*args, **kwargs)
+        if fragment_cache is not None:
+            self.fragment_cache = fragment_cache
+
+    def fragment_key(self, name, value, attrs=None, renderer=None):
+        """Return the key of the fragment, or None if it can't be cached."""
+        state = dict(self.__dict__)
+        state.pop("fragment_cache", None)
+        for key in ("choices", "_choices"):
+            if key not in state:
+                continue
+            if isinstance(state[key], _QUERYSET_CHOICES) and getattr(
+                self.fragment_cache, "backend", None
+            ) is not None:
+                # The version of the model-backed choices is only valid in
+                # this process, so it can't be shared via the backend.
+                return None
+            state[key] = choice_version(state[key])
+            if state[key] is None:
+                return None
+        if not isinstance(renderer, Jinja2Engine):
+            renderer = None
+        try:
+            return freeze((
+                type(self), type(renderer), get_language(),
+                name, value, attrs, state
+            ))
+        except TypeError:
+            return None
+
+    def render(self, name, value, attrs=None, renderer=None):
+        """Render the widget, using fragment_cache if it's available."""
+        cache = self.fragment_cache
+        key = None
+        if cache is not None and "get_context" not in self.__dict__:
+            key = self.fragment_key(name, value, attrs, renderer)
+        if key is None:
+            return super().render(name, value, attrs, renderer)
+        html = cache.get(key)
+        if html is None:
+            html = super().render(name, value, attrs, renderer)
+            cache.set(key, html)
+        return mark_safe(html)
+
+    def _get_template(self, template_name, renderer=None):
+        """Return the template from the renderer."""
+        if not isinstance(renderer, Jinja2Engine):
+            renderer = get_default_renderer()
+        return renderer.get_template(template_name)
 
     def _render(self, template_name, context, renderer=None):
         """Override render protected function."""
-        renderer = Jinja2Engine()
-        template = renderer.get_template(template_name)
+        template = self._get_template(template_name, renderer)
         return mark_safe(template.render(context))
+
+    def generate(self, name, value, attrs=None, renderer=None):
+        """Render the widget as the fragments generated by Jinja2."""
+        context = self.get_context(name, value, attrs)
+        template = self._get_template(self.template_name, renderer)
+        return template.template.generate(context)
+
+    def stream(
+        self, name, value, attrs=None, renderer=None,
+        chunk_size=DEFAULT_CHUNK_SIZE
+    ):
+        """
+        Render the widget as an iterator of chunks.
+
+        The iterator can be passed to StreamingHttpResponse so that huge
+        widgets (e.g. MDSelect with many options) are sent without holding
+        the whole html on the memory.
+        """
+        return chunked(
+            self.generate(name, value, attrs, renderer), chunk_size
+        )
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Cache of the rendered widgets."""
+
+import hashlib
+import threading
+from collections import OrderedDict
+
+from django.core.cache import caches
+
+
+class FragmentCache(object):
+    """
+    LRU cache of the rendered html fragments.
+
+    The fragments are kept up to max_size chars in the process. If backend is
+    specified (the alias of CACHES, or the cache itself), the fragments are
+    also shared via Django's cache framework with timeout.
+    """
+
+    def __init__(self, max_size=4 * 1024 * 1024, backend=None, timeout=None):
+        """Init the cache."""
+        self.max_size = max_size
+        self.backend = caches[backend] if isinstance(backend, str) \
+            else backend
+        self.timeout = timeout
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def backend_key(key):
+        """Return the key for Django's cache framework."""
+        return "djextra-fragment:" + hashlib.sha1(
+            repr(key).encode("utf-8")
+        ).hexdigest()
+
+    def _store(self, key, html):
+        """Store the fragment into the LRU."""
+        if len(html) > self.max_size:
+            return
+        with self.lock:
+            old = self.entries.pop(key, None)
+            if old is not None:
+                self.size -= len(old)
+            self.entries[key] = html
+            self.size += len(html)
+            while self.size > self.max_size:
+                (_, evicted) = self.entries.popitem(last=False)
+                self.size -= len(evicted)
+
+    def get(self, key):
+        """Return the fragment, or None if it's not cached."""
+        with self.lock:
+            html = self.entries.get(key)
+            if html is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return html
+        if self.backend is not None:
+            html = self.backend.get(self.backend_key(key))
+            if html is not None:
+                self._store(key, html)
+                with self.lock:
+                    self.hits += 1
+                return html
+        with self.lock:
+            self.misses += 1
+        return None
+
+    def set(self, key, html):
+        """Cache the fragment."""
+        html = str(html)
+        self._store(key, html)
+        if self.backend is not None:
+            self.backend.set(self.backend_key(key), html, self.timeout)
+
+    def clear(self):
+        """Drop the fragments in the process and reset the counts."""
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """Return the hit/miss counts and the usage."""
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self.entries),
+                "size": self.size,
+            }
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Precompiled widget templates."""
+
+import marshal
+from importlib.util import MAGIC_NUMBER
+
+import jinja2
+from django.core.exceptions import ImproperlyConfigured
+from jinja2.loaders import split_template_path
+
+
+def _header():
+    """Return the header that identifies the bundle format."""
+    return b"djextra-widgets %s %s\n" % (
+        MAGIC_NUMBER.hex().encode(), jinja2.__version__.encode()
+    )
+
+
+def compile_templates(env, target):
+    """
+    Compile all templates that env can find into a bundle.
+
+    The bundle holds the code objects of the templates and is bound to the
+    python interpreter and the version of Jinja2 that compiled it. Therefore,
+    it should be built on the deployment (e.g. when building the image).
+    """
+    codes = {}
+    for name in env.list_templates():
+        (source, filename, _) = env.loader.get_source(env, name)
+        codes[name] = env.compile(source, name, filename)
+    with open(target, "wb") as bundle:
+        bundle.write(_header())
+        marshal.dump(codes, bundle)
+    return sorted(codes)
+
+
+class PrecompiledLoader(jinja2.BaseLoader):
+    """
+    Serve the templates compiled by compile_templates from memory.
+
+    The bundle is read once, and neither stat calls nor template parsing are
+    issued afterwards.
+    """
+
+    def __init__(self, path):
+        """Load the bundle."""
+        with open(path, "rb") as bundle:
+            if bundle.readline() != _header():
+                raise ImproperlyConfigured(
+                    f"{path} was compiled by the other version of python or "
+                    "Jinja2. Please compile the templates again."
+                )
+            self.codes = marshal.load(bundle)
+
+    def get_source(self, environment, template):
+        """Raise TemplateNotFound because the bundle has no source."""
+        raise jinja2.TemplateNotFound(template)
+
+    def list_templates(self):
+        """Return the names of the templates in the bundle."""
+        return sorted(self.codes)
+
+    def load(self, environment, name, globals=None):
+        """Load the template from the compiled code."""
+        try:
+            code = self.codes["/".join(split_template_path(name))]
+        except KeyError:
+            raise jinja2.TemplateNotFound(name)
+        return environment.template_class.from_code(
+            environment, code, globals or {}, lambda: True
+        )
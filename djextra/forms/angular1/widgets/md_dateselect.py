@@ -4,10 +4,13 @@
 """Date Select for Angular Material."""
 
 from django import forms
+
+from .base import BaseWidget
 from .mdselect import MDSelect
 
 
-class MDDateSelect(forms.SelectDateWidget):
+class MDDateSelect(BaseWidget, forms.SelectDateWidget):
     """Date Select for Angular Material."""
 
+    template_name = "md_dateselect.html"
     select_widget = MDSelect
@@ -3,19 +3,211 @@
 
 """MDSelect widgets."""
 
+import copy
+from collections.abc import MutableSequence, Sequence
+
 from django.forms import Select
+from django.forms.models import ModelChoiceIterator
 
+from ..choices import (
+    DEFAULT_CHUNK_SIZE, ChoiceTable, QuerySetChoices, find_choices,
+    intern_choices, page_choices
+)
 from .base import BaseWidget
 
 
+class _CopyOnWriteChoices(MutableSequence):
+    """
+    The shared ChoiceTable of the widget, copied on the first modification.
+
+    The reads go to the table, and the modifications (e.g. append) replace
+    the table of the widget with its own list first, so the other widgets
+    sharing the table aren't affected.
+    """
+
+    __hash__ = None
+
+    def __init__(self, widget):
+        """Init with the widget."""
+        self.widget = widget
+
+    def _own(self):
+        """Return the list of the widget, copying the table if needed."""
+        choices = self.widget._choices
+        if isinstance(choices, ChoiceTable):
+            choices = self.widget._choices = list(choices)
+        return choices
+
+    def __getitem__(self, index):
+        """Return the choice."""
+        return self.widget._choices[index]
+
+    def __iter__(self):
+        """Iterate the choices."""
+        return iter(self.widget._choices)
+
+    def __len__(self):
+        """Return the number of the choices."""
+        return len(self.widget._choices)
+
+    def __eq__(self, other):
+        """Compare the choices with the sequence."""
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return list(self) == list(other)
+
+    def __repr__(self):
+        """Return the repr of the choices."""
+        return repr(self.widget._choices)
+
+    def __copy__(self):
+        """Return the table (or the copy of the list) of the widget."""
+        choices = self.widget._choices
+        return choices if isinstance(choices, ChoiceTable) else list(choices)
+
+    def __setitem__(self, index, choice):
+        """Replace the choice."""
+        self._own()[index] = choice
+
+    def __delitem__(self, index):
+        """Delete the choice."""
+        del self._own()[index]
+
+    def insert(self, index, choice):
+        """Insert the choice."""
+        self._own().insert(index, choice)
+
+
 class MDSelect(BaseWidget, Select):
-    """MDSelect."""
+    """
+    MDSelect.
+
+    If page_size is specified, only the selected options and the first
+    page_size options are rendered, and data-page-size / data-page-url
+    attributes are added so that the client can fetch the rest of the options
+    from page_url (e.g. ChoicePageView) with md-virtual-repeat. Likewise,
+    search_url (e.g. ChoiceSearchView) is rendered as data-search-url.
+
+    The list of the choices is stored as the interned ChoiceTable, so the
+    copies of the widget (e.g. per form instance) share it. The choices are
+    copied into the list of the instance when they're modified in place
+    (e.g. widget.choices.append(...)).
+    """
 
     template_name = "md_select.html"
     option_template_name = "md_select_option.html"
 
-    def __init__(self, disable_select=False, *args, **kwargs):
+    def __init__(
+        self, disable_select=False, *args,
+        page_size=None, page_url=None, search_url=None,
+        label_field=None, chunk_size=None, **kwargs
+    ):
         """Init the class."""
+        # Select copies the choices into a list; keep the tables and the
+        # streamed choices given by the keyword as they are.
+        choices = kwargs.pop("choices", None)
         super().__init__(*args, **kwargs)
+        if choices is not None:
+            if not isinstance(choices, (ChoiceTable, QuerySetChoices)):
+                choices = list(choices)
+            self.choices = choices
+        self.label_field = label_field
+        self.chunk_size = chunk_size
         self.disable_select = disable_select
         self.checked_attribute = {"data-selected": not self.disable_select}
+        self.page_size = page_size
+        self.page_url = page_url
+        self.search_url = search_url
+
+    @property
+    def choices(self):
+        """Return the choices, copying the shared table on modification."""
+        choices = self._choices
+        if isinstance(choices, ChoiceTable):
+            return _CopyOnWriteChoices(self)
+        return choices
+
+    @choices.setter
+    def choices(self, choices):
+        """Set the choices, sharing the table of the same choices."""
+        if isinstance(choices, _CopyOnWriteChoices):
+            choices = copy.copy(choices)
+        self._choices = intern_choices(choices)
+
+    def get_choices(self):
+        """Return the choices to render, streaming the queryset if needed."""
+        choices = self._choices
+        if isinstance(choices, ModelChoiceIterator) and (
+            self.label_field or self.chunk_size
+        ):
+            field = choices.field
+            return QuerySetChoices(
+                choices.queryset, field.to_field_name or "pk",
+                self.label_field, self.chunk_size or DEFAULT_CHUNK_SIZE,
+                field.empty_label, field.label_from_instance
+            )
+        return choices
+
+    def _optgroups(self, name, value, attrs, choices):
+        """Return a list of optgroups of the choices."""
+        return list(self._iter_optgroups(name, value, attrs, choices))
+
+    def _iter_optgroups(self, name, value, attrs, choices):
+        """Iterate optgroups of the choices."""
+        # format_value returns the list of the strings; look them up in O(1).
+        value = frozenset(value)
+        has_selected = False
+        for (index, (option_value, option_label)) in enumerate(choices):
+            if option_value is None:
+                option_value = ""
+            subgroup = []
+            if isinstance(option_label, (list, tuple)):
+                group_name = option_value
+                subindex = 0
+                group_choices = option_label
+            else:
+                group_name = None
+                subindex = None
+                group_choices = [(option_value, option_label)]
+            for (subvalue, sublabel) in group_choices:
+                selected = (
+                    str(subvalue) in value and
+                    (not has_selected or self.allow_multiple_selected)
+                )
+                has_selected |= selected
+                subgroup.append(self.create_option(
+                    name, subvalue, sublabel, selected, index,
+                    subindex=subindex, attrs=attrs
+                ))
+                if subindex is not None:
+                    subindex += 1
+            yield (group_name, subgroup, index)
+
+    def optgroups(self, name, value, attrs=None):
+        """Return a list of optgroups, limiting the options on paging."""
+        source = self.get_choices()
+        if not self.page_size:
+            if isinstance(source, QuerySetChoices):
+                # Generate the options while the rows are fetched.
+                return self._iter_optgroups(name, value, attrs, source)
+            return self._optgroups(name, value, attrs, source)
+        choices = page_choices(source, limit=self.page_size)
+        shown = {
+            "" if option_value is None else str(option_value)
+            for (option_value, _) in choices
+        }
+        missing = [item for item in value if item not in shown]
+        if missing:
+            choices.extend(find_choices(source, missing))
+        return self._optgroups(name, value, attrs, choices)
+
+    def get_context(self, name, value, attrs):
+        """Add the paging attributes."""
+        context = super().get_context(name, value, attrs)
+        if self.search_url:
+            context["widget"]["attrs"]["data-search-url"] = self.search_url
+        if self.page_size:
+            context["widget"]["attrs"]["data-page-size"] = self.page_size
+            if self.page_url:
+                context["widget"]["attrs"]["data-page-url"] = self.page_url
+        return context
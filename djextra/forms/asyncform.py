@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Form that can be validated asynchronously."""
+
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django import forms
+from django.forms.utils import ErrorDict
+
+
+async def run_async_validators(validators, value):
+    """
+    Run the coroutine validators concurrently.
+
+    The errors of the validators are raised as a ValidationError in the
+    order of the validators.
+    """
+    results = await asyncio.gather(
+        *(validator(value) for validator in validators),
+        return_exceptions=True
+    )
+    errors = []
+    for result in results:
+        if isinstance(result, forms.ValidationError):
+            errors.extend(result.error_list)
+        elif isinstance(result, BaseException):
+            raise result
+    if errors:
+        raise forms.ValidationError(errors)
+
+
+def is_empty(value, empty_values):
+    """
+    Return True if value is one of empty_values.
+
+    The arrays (e.g. numpy.ndarray, array.array) and the scalars of numpy
+    aren't compared with `in`, because they're compared element-wise. The
+    arrays are empty if they have no items.
+    """
+    if not hasattr(value, "tolist"):
+        return value in empty_values
+    if getattr(value, "ndim", None) == 0:
+        return value.tolist() in empty_values
+    return len(value) == 0
+
+
+class AsyncForm(forms.Form):
+    """
+    Form that can be validated without blocking the event loop.
+
+    ais_valid() / afull_clean() validate the form like is_valid() /
+    full_clean(); the synchronous steps run in a thread by sync_to_async,
+    and the coroutine validators of the fields run concurrently:
+
+    ```Python
+    async def email_not_taken(value):
+        if await accounts_api.email_exists(value):
+            raise forms.ValidationError("Taken")
+
+    class SignUpForm(AsyncForm):
+
+        class Meta(object):
+            async_validators = {"email": [email_not_taken]}
+
+        email = forms.EmailField()
+        tags = ListField(async_validators=[tag_exists])
+    ```
+
+    The coroutine validators are run after the fields are cleaned, and only
+    for the cleaned non-empty values. aclean() is called instead of clean(),
+    and calls clean() by default.
+    """
+
+    @classmethod
+    def get_async_validators(cls):
+        """Return the dict of the field name and its coroutine validators."""
+        plan = cls.__dict__.get("_async_validators_plan")
+        if plan is None:
+            metaclass = getattr(cls, "Meta", type("Meta", (object,), {}))
+            plan = {
+                name: tuple(validators) for (name, validators) in getattr(
+                    metaclass, "async_validators", {}
+                ).items()
+            }
+            cls._async_validators_plan = plan
+        return plan
+
+    async def ais_valid(self):
+        """Return True if the form has no errors, asynchronously."""
+        if self._errors is None:
+            await self.afull_clean()
+        return self.is_bound and not self._errors
+
+    async def afull_clean(self):
+        """Clean all of the data asynchronously."""
+        self._errors = ErrorDict()
+        if not self.is_bound:
+            return
+        self.cleaned_data = {}
+        if self.empty_permitted and not await sync_to_async(
+            self.has_changed
+        )():
+            return
+        await sync_to_async(self._clean_fields)()
+        await self._arun_validators()
+        await self._aclean_form()
+        await sync_to_async(self._post_clean)()
+
+    async def _arun_validators(self):
+        """Run the coroutine validators of the cleaned fields."""
+        plan = self.get_async_validators()
+        names = []
+        checks = []
+        for (name, field) in self.fields.items():
+            if name not in self.cleaned_data:
+                continue
+            value = self.cleaned_data[name]
+            if hasattr(field, "arun_validators"):
+                names.append(name)
+                checks.append(field.arun_validators(value))
+            if plan.get(name) and not is_empty(value, field.empty_values):
+                names.append(name)
+                checks.append(run_async_validators(plan[name], value))
+        results = await asyncio.gather(*checks, return_exceptions=True)
+        for (name, result) in zip(names, results):
+            if isinstance(result, forms.ValidationError):
+                self.add_error(name, result)
+            elif isinstance(result, BaseException):
+                raise result
+
+    async def _aclean_form(self):
+        """Call aclean like _clean_form."""
+        try:
+            cleaned_data = await self.aclean()
+        except forms.ValidationError as exc:
+            self.add_error(None, exc)
+        else:
+            if cleaned_data is not None:
+                self.cleaned_data = cleaned_data
+
+    async def aclean(self):
+        """Clean the form asynchronously. Call clean() by default."""
+        return await sync_to_async(self.clean)()
@@ -3,27 +3,187 @@
 
 """Django AngularJS Helper Froms."""
 
-from functools import wraps
+import copy
+from collections import defaultdict, namedtuple
+from functools import partial
+
 from django import forms
+from django.core.exceptions import ImproperlyConfigured
+
+from .asyncform import AsyncForm
+
+
+def _get_context_with_attrs(
+    get_context, form, fld, attrs_plan, name, value, attrs
+):
+    """Call get_context with the attributes of the plan."""
+    (merged, callables) = attrs_plan
+    attrs.update(merged)
+    for (key, value_func) in callables:
+        attrs[key] = value_func(form, fld, name, value)
+    return get_context(name, value, attrs)
+
+
+RequiredPlan = namedtuple(
+    "RequiredPlan", ("names", "rules", "required_if", "optional_if")
+)
+
+
+def _compile_conditions(spec):
+    """Return the list of (source, predicate) of the rule."""
+    if isinstance(spec, str):
+        return [(spec, bool)]
+    if isinstance(spec, tuple) and len(spec) == 2 and callable(spec[1]):
+        return [spec]
+    return [
+        condition for item in spec for condition in _compile_conditions(item)
+    ]
+
+
+def _compile_rules(metaclass):
+    """
+    Return the rules keyed by the source field, and the targets.
+
+    The targets map the field names to True for required_if, or False for
+    optional_if.
+    """
+    rules = defaultdict(list)
+    targets = {}
+    for (attr, required) in (("required_if", True), ("optional_if", False)):
+        for (target, spec) in getattr(metaclass, attr, {}).items():
+            if targets.setdefault(target, required) != required:
+                raise ImproperlyConfigured(
+                    f"{target} is in both required_if and optional_if."
+                )
+            for (source, predicate) in _compile_conditions(spec):
+                rules[source].append((target, predicate))
+    return (rules, targets)
+
+
+def _required_fields(fields, optional_fields, targets):
+    """
+    Return the fields required except optional_fields and targets.
+
+    The fields in optional_fields are kept as they are declared, and the
+    targets of the rules are not required on the fields (they are checked
+    by clean()).
+    """
+    result = {}
+    for (name, field) in fields.items():
+        required = name not in targets and (
+            field.required or name not in optional_fields
+        )
+        if field.required != required:
+            field = copy.deepcopy(field)
+            field.required = required
+        result[name] = field
+    return result
+
 
+class AllRequiredForm(AsyncForm):
+    """
+    All required form.
+
+    All fields become required except the fields in Meta.optional (they are
+    kept as they are declared). In addition to this, the fields can be
+    required conditionally:
+
+    ```Python
+    class TestForm(AllRequiredForm):
+
+        class Meta(object):
+            optional = ("note", )
+            required_if = {
+                # phone is required when contact_by_phone is truthy.
+                "phone": "contact_by_phone",
+                # state is required when country is "US".
+                "state": ("country", lambda value: value == "US")
+            }
+            optional_if = {
+                # company is optional when is_private is truthy, or
+                # country is "JP".
+                "company": [
+                    "is_private", ("country", lambda value: value == "JP")
+                ]
+            }
+    ```
 
-class AllRequiredForm(forms.Form):
-    """All required form."""
+    The required flags and the rules are resolved once per form class on
+    the first instantiation, and clean() only evaluates the rules whose
+    source fields have values.
+    """
+
+    @classmethod
+    def get_required_plan(cls):
+        """Return the required plan of the form class."""
+        plan = cls.__dict__.get("_required_plan")
+        if plan is not None:
+            return plan
+        metaclass = getattr(cls, "Meta", type("Meta", (object,), {}))
+        (rules, targets) = _compile_rules(metaclass)
+        unknown = (set(targets) | set(rules)) - set(cls.base_fields)
+        if unknown:
+            raise ImproperlyConfigured(
+                f"Unknown fields in the rules: {', '.join(sorted(unknown))}"
+            )
+        base_fields = _required_fields(
+            cls.base_fields, getattr(metaclass, "optional", None) or (),
+            targets
+        )
+        cls.base_fields = base_fields
+        plan = RequiredPlan(
+            frozenset(base_fields), dict(rules),
+            frozenset(name for (name, req) in targets.items() if req),
+            frozenset(name for (name, req) in targets.items() if not req)
+        )
+        cls._required_plan = plan
+        return plan
 
     def __init__(self, *args, **kwargs):
         """Init field."""
+        plan = self.get_required_plan()
         super().__init__(*args, **kwargs)
-        optional_fields = getattr(
-            getattr(self, "Meta", type("Meta", (object,), {})()),
-            "optional", None
-        ) or {}
-        for (name, field) in self.fields.items():
-            if name in optional_fields:
+        if self.fields.keys() != plan.names:
+            # The fields added on the instantiation.
+            optional_fields = getattr(
+                getattr(self, "Meta", type("Meta", (object,), {})()),
+                "optional", None
+            ) or {}
+            for (name, field) in self.fields.items():
+                if name in plan.names or name in optional_fields:
+                    continue
+                field.required = True
+
+    def _met_targets(self, plan, cleaned_data):
+        """Return the targets whose conditions are met."""
+        met = set()
+        for source in plan.rules.keys() & cleaned_data.keys():
+            value = cleaned_data[source]
+            if value in self.fields[source].empty_values:
+                continue
+            met.update(
+                target for (target, predicate) in plan.rules[source]
+                if target not in met and predicate(value)
+            )
+        return met
+
+    def clean(self):
+        """Check the conditionally required fields."""
+        cleaned_data = super().clean()
+        plan = self.get_required_plan()
+        met = self._met_targets(plan, cleaned_data)
+        for target in (plan.required_if & met) | (plan.optional_if - met):
+            field = self.fields.get(target)
+            if field is None or target in self._errors:
                 continue
-            field.required = True
+            if cleaned_data.get(target) in field.empty_values:
+                self.add_error(target, forms.ValidationError(
+                    field.error_messages["required"], code="required"
+                ))
+        return cleaned_data
 
 
-class FieldAttributeForm(forms.Form):
+class FieldAttributeForm(AsyncForm):
     """
     Field common attribute form.
 
@@ -58,25 +218,46 @@ class FieldAttributeForm(forms.Form):
     to handle metadata attribute.
     """
 
-    def __wrap_attr(self, f, fld):
-        """Wrap attribute."""
-        @wraps(f)
-        def inside(name, value, attrs):
-            metaclass = getattr(self, "Meta", type("Meta", (object,), {}))
-            attrs.update(getattr(metaclass, "common_attrs", {}))
-            attrs.update(getattr(metaclass, "fld_attrs", {}).get(name, {}))
-            for (key, value_func) in attrs.items():
-                try:
-                    attrs[key] = value_func(self, fld, name, value)
-                except TypeError:
-                    continue
-            return f(name, value, attrs)
-        return inside
+    @staticmethod
+    def _compile_attrs(metaclass, name):
+        """Return the merged attributes and the callables of the field."""
+        merged = dict(getattr(metaclass, "common_attrs", {}))
+        merged.update(getattr(metaclass, "fld_attrs", {}).get(name, {}))
+        return (merged, tuple(
+            (key, value) for (key, value) in merged.items() if callable(value)
+        ))
+
+    @classmethod
+    def get_attrs_plan(cls):
+        """
+        Return the attributes plan of the form class.
+
+        The plan is built on the first instantiation of the class and is a
+        dict of the field name and the tuple of the merged attributes and
+        the callable attributes. Only the callables are evaluated on
+        rendering.
+        """
+        plan = cls.__dict__.get("_attrs_plan")
+        if plan is None:
+            metaclass = getattr(cls, "Meta", type("Meta", (object,), {}))
+            plan = {
+                name: cls._compile_attrs(metaclass, name)
+                for name in cls.base_fields
+            }
+            cls._attrs_plan = plan
+        return plan
 
     def __init__(self, *args, **kwargs):
         """Init."""
         super().__init__(*args, **kwargs)
-        # print(self.fields)
+        plan = self.get_attrs_plan()
         for name, fld in self.fields.items():
-            tmp = fld.widget.get_context
-            fld.widget.get_context = self.__wrap_attr(tmp, fld)
+            attrs_plan = plan.get(name)
+            if attrs_plan is None:
+                attrs_plan = self._compile_attrs(
+                    getattr(self, "Meta", type("Meta", (object,), {})), name
+                )
+            fld.widget.get_context = partial(
+                _get_context_with_attrs, fld.widget.get_context,
+                self, fld, attrs_plan
+            )
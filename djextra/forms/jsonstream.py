@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Incremental JSON array parser."""
+
+import codecs
+import json
+import re
+
+DEFAULT_READ_SIZE = 65536
+# The longest token that can be cut at the end of the buffer without
+# the error of "Unterminated string" (e.g. "-Infinit", "\ud83").
+_MAX_PARTIAL_TOKEN = 8
+_DELIMITERS = " \t\n\r,]"
+_skip_spaces = re.compile(r"[ \t\n\r]*").match
+_separator = re.compile(r"[ \t\n\r]*([,\]])[ \t\n\r]*").match
+
+
+class _ArrayReader(object):
+    """The buffer of the JSON array read from the stream by chunks."""
+
+    def __init__(self, stream, read_size, decoder):
+        """Init the reader."""
+        self.stream = stream
+        self.read_size = read_size
+        self.decoder = decoder
+        self.text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self):
+        """Read the next chunk, and return False if the stream is over."""
+        if self.eof:
+            return False
+        chunk = self.stream.read(self.read_size)
+        self.eof = not chunk
+        self.buffer = self.buffer[self.pos:] + self.text_decoder.decode(
+            chunk or b"", final=self.eof
+        )
+        self.pos = 0
+        return True
+
+    def skip_whitespace(self):
+        """Skip the whitespaces, reading the chunks if needed."""
+        self.pos = _skip_spaces(self.buffer, self.pos).end()
+        while self.pos == len(self.buffer) and self.fill():
+            self.pos = _skip_spaces(self.buffer, self.pos).end()
+
+    def expect(self, chars):
+        """Consume and return one of chars after the whitespaces."""
+        self.skip_whitespace()
+        (buffer, pos) = (self.buffer, self.pos)
+        if pos >= len(buffer) or buffer[pos] not in chars:
+            raise ValueError(
+                f"Expecting one of {chars!r} at {pos} of the buffer."
+            )
+        self.pos += 1
+        return buffer[pos]
+
+    def _incomplete(self, exc):
+        """Return True if the error might be caused by the cut token."""
+        return exc.msg.startswith("Unterminated string") or \
+            len(self.buffer) - exc.pos <= _MAX_PARTIAL_TOKEN
+
+    def _cut_number(self, item, end):
+        """Return True if the number might continue in the next chunk."""
+        buffer = self.buffer
+        return isinstance(item, (int, float)) and \
+            (end == len(buffer) or buffer[end] not in _DELIMITERS)
+
+    def decode(self):
+        """Decode the item at the position, and return it and its end."""
+        while True:
+            try:
+                (item, end) = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as exc:
+                if self._incomplete(exc) and self.fill():
+                    continue
+                raise ValueError(str(exc)) from exc
+            # Only the item at the end of the buffer might be cut.
+            if len(self.buffer) - end > _MAX_PARTIAL_TOKEN or \
+                    not (self._cut_number(item, end) and self.fill()):
+                return (item, end)
+
+    def advance(self, end):
+        """Move to the next item, and return False if the array is closed."""
+        match = _separator(self.buffer, end)
+        if match is not None and match.end() < len(self.buffer):
+            # Fast path: the separator and the next item are buffered.
+            self.pos = match.end()
+            return match.group(1) != "]"
+        self.pos = end
+        if self.expect(",]") == "]":
+            return False
+        self.skip_whitespace()
+        return True
+
+    def items(self):
+        """Yield the items of the array."""
+        self.expect("[")
+        self.skip_whitespace()
+        if self.buffer.startswith("]", self.pos):
+            self.pos += 1
+        else:
+            more = True
+            while more:
+                (item, end) = self.decode()
+                yield item
+                more = self.advance(end)
+        self.skip_whitespace()
+        if self.pos < len(self.buffer):
+            raise ValueError("Extra data after the array.")
+
+
+def iter_json_array(stream, read_size=DEFAULT_READ_SIZE, decoder=None):
+    """
+    Parse the JSON array read from the stream, and yield its items.
+
+    stream is a file-like object (e.g. HttpRequest) that returns bytes in
+    UTF-8. Only the current item and a chunk are held on the memory, so the
+    generator can be passed to ListField directly:
+
+    ```Python
+    field.clean(iter_json_array(request))
+    ```
+
+    ValueError is raised when the payload isn't a JSON array.
+    """
+    return _ArrayReader(
+        stream, read_size, decoder or json.JSONDecoder()
+    ).items()
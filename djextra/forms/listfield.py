@@ -3,65 +3,676 @@
 
 """List field implementation code."""
 
+import asyncio
+import base64
+import binascii
+import sys
+import threading
+from array import array
+from collections.abc import Iterator, Mapping
+from collections import deque
+from itertools import chain, islice
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
 from django import forms
+from django.core.exceptions import NON_FIELD_ERRORS, ImproperlyConfigured
+from django.core.validators import (
+    DecimalValidator, MaxValueValidator, MinValueValidator
+)
+from django.db import connections
 from django.utils.translation import ugettext_lazy as _
 
+from .asyncform import is_empty, run_async_validators
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+# (to_python of the stock field, converter, types the converter accepts
+# exactly like to_python does)
+_BATCH_CONVERTERS = (
+    (forms.IntegerField.to_python, int, frozenset((str, int))),
+    (forms.FloatField.to_python, float, frozenset((str, int, float))),
+    (forms.DecimalField.to_python, Decimal, frozenset((str, int))),
+)
+_NUMBER_TYPES = frozenset((int, float, Decimal))
+DEFAULT_CONCURRENCY = 8
+# The number of the items of an iterator converted at once.
+STREAM_CHUNK_SIZE = 1024
+# The typecodes of the little-endian packed arrays ListField accepts.
+PACKED_TYPECODES = {
+    "int32": next(code for code in "ilh" if array(code).itemsize == 4),
+    "float64": "d",
+}
+CONTAINERS = ("list", "array", "numpy")
+
+
+def _container_typecode(field):
+    """Return the typecode of the array that holds the values of field."""
+    if isinstance(field, forms.DecimalField):
+        return None
+    if isinstance(field, forms.FloatField):
+        return "d"
+    if isinstance(field, forms.IntegerField):
+        return "q"
+    return None
+
+
+def _check_options(packed, container, form):
+    """Raise ValueError if the options of ListField are invalid."""
+    if packed is not None and packed not in PACKED_TYPECODES:
+        raise ValueError(
+            f"packed must be one of {', '.join(PACKED_TYPECODES)}."
+        )
+    if container not in CONTAINERS:
+        raise ValueError(f"container must be one of {', '.join(CONTAINERS)}.")
+    if form is not None and container != "list":
+        raise ValueError("container must be list for the form items.")
+
+
+def _resolve_typecode(container, field):
+    """Return the typecode of the container, or None for list."""
+    if container == "list":
+        return None
+    typecode = _container_typecode(field)
+    if typecode is None:
+        raise ValueError(
+            f"container={container} needs IntegerField or FloatField."
+        )
+    if container == "numpy" and numpy is None:
+        raise ImproperlyConfigured("numpy is needed for container=numpy.")
+    return typecode
+
+
+def _batch_to_python(field, values):
+    """
+    Convert the values with the stock numeric field at once.
+
+    None is returned if the field isn't IntegerField, FloatField nor
+    DecimalField (or the subclass that overrides to_python), or any value
+    can't be converted. In this case, the values should be converted one by
+    one to get the error of each value.
+    """
+    if field.localize:
+        return None
+    to_python = getattr(type(field), "to_python", None)
+    for (func, convert, types) in _BATCH_CONVERTERS:
+        if to_python is func:
+            break
+    else:
+        return None
+    if not types.issuperset(map(type, values)):
+        return None
+    try:
+        return list(map(convert, values))
+    except (ValueError, TypeError, ArithmeticError):
+        return None
+
+
+def _drop_plain_decimal_validator(validators, values):
+    """
+    Return the validators without DecimalValidator having no limits.
+
+    DecimalField without the limits only rejects NaN / Infinity, so the
+    values are checked here. None is returned if any value is rejected.
+    """
+    last = validators[-1] if validators else None
+    if type(last) is not DecimalValidator or \
+            last.max_digits is not None or last.decimal_places is not None:
+        return validators
+    if not all(type(item) is Decimal and item.is_finite() for item in values):
+        return None
+    return validators[:-1]
+
+
+def _bounds(values):
+    """Return the lowest and the highest numbers, or None if unknown."""
+    if not _NUMBER_TYPES.issuperset(map(type, values)):
+        return None
+    try:
+        (lowest, highest) = (min(values), max(values))
+    except (TypeError, ArithmeticError):
+        return None
+    # min / max can't find the bounds if the first value is NaN.
+    if lowest != lowest or highest != highest:
+        return None
+    return {MinValueValidator: lowest, MaxValueValidator: highest}
+
+
+def _pass_bounds(validators, bounds):
+    """Return True if the bounds pass the min / max validators."""
+    for validator in validators:
+        limit_value = validator.limit_value
+        if callable(limit_value):
+            limit_value = limit_value()
+        if validator.compare(
+            validator.clean(bounds[type(validator)]), limit_value
+        ):
+            return False
+    return True
+
+
+def _batch_validate(field, values):
+    """
+    Check the values with the validators of the field at once.
+
+    True is returned only if the field has no validator, or the numbers pass
+    all validators that are MinValueValidator / MaxValueValidator (and
+    DecimalValidator without the limits). Otherwise, the validators should be
+    run one by one.
+    """
+    if not values:
+        return True
+    validators = _drop_plain_decimal_validator(field.validators, values)
+    if validators is None:
+        return False
+    if not validators:
+        return True
+    if not all(
+        type(validator) in (MinValueValidator, MaxValueValidator)
+        for validator in validators
+    ):
+        return False
+    bounds = _bounds(values)
+    return bounds is not None and _pass_bounds(validators, bounds)
+
+
+class _JoinedMessages(object):
+    """
+    The messages of the error, joined when it's formatted.
+
+    This is lighter than django.utils.functional.lazy that builds a proxy
+    per call, and the messages of the items are rarely formatted when the
+    errors are read by iter_errors.
+    """
+
+    __slots__ = ("exc", )
+
+    def __init__(self, exc):
+        """Init."""
+        self.exc = exc
+
+    def __str__(self):
+        """Join the messages of the error."""
+        return "".join(self.exc.messages)
+
+
+def iter_errors(errors):
+    """
+    Yield the path and the message / code of the errors of ListField.
+
+    errors is the ValidationError raised by ListField, or its error_list
+    (e.g. form.errors.as_data()["tags"]). The path is the tuple of the index
+    (and the field name of the form item) of the item, or empty for the
+    errors of the whole list (e.g. max_items). The item errors are taken
+    from the original errors, so "Index %(index)d: ..." isn't formatted.
+    """
+    return _iter_errors(errors, {})
+
+
+def _iter_errors(errors, texts):
+    """Do iter_errors, translating each lazy message once in texts."""
+    for error in getattr(errors, "error_list", errors):
+        params = error.params or {}
+        if "errors" in params and "index" in params:
+            path = (params["index"], params["field"]) if "field" in params \
+                else (params["index"], )
+            for (inner_path, entry) in _iter_errors(params["errors"], texts):
+                yield (path + inner_path, entry)
+            continue
+        # The items usually share the lazy messages of the field.
+        text = texts.get(id(error.message))
+        if text is None:
+            text = texts[id(error.message)] = str(error.message)
+        if params:
+            text %= params
+        yield ((), {"message": text, "code": error.code or ""})
+
+
+def _memoized(func):
+    """Return func that reuses the result (or the error) of the value."""
+    memo = {}
+
+    def call(value):
+        try:
+            key = (type(value), value)
+            (result, error) = memo[key]
+        except TypeError:
+            return func(value)
+        except KeyError:
+            try:
+                (result, error) = (func(value), None)
+            except forms.ValidationError as exc:
+                (result, error) = (None, exc)
+            memo[key] = (result, error)
+        if error is not None:
+            # Drop the traceback so that it doesn't grow on each raise.
+            raise error.with_traceback(None)
+        return result
+    return call
+
+
+def _outcome(func, value):
+    """Call func with value, and return the result and the error."""
+    try:
+        return (func(value), None)
+    except forms.ValidationError as exc:
+        return (None, exc)
+
+
+def _close_connections(executor, workers):
+    """
+    Close the database connections of the threads of the pool.
+
+    The pool has up to workers threads, and the tasks wait for each other,
+    so each thread runs exactly one of them. The threads of the pool per
+    call are discarded, so the connections they opened would be left open
+    otherwise.
+    """
+    barrier = threading.Barrier(workers)
+
+    def close():
+        barrier.wait()
+        connections.close_all()
+
+    for future in [executor.submit(close) for _ in range(workers)]:
+        future.result()
+
+
+def _map_concurrently(executor, window, func, values):
+    """
+    Yield the outcomes of func on the executor in the order of the values.
+
+    At most window calls are submitted at once, and the calls not started
+    yet are cancelled when the generator is closed.
+    """
+    pending = deque()
+    try:
+        for value in values:
+            pending.append(executor.submit(_outcome, func, value))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
 
 class ListField(forms.Field):
-    """List Field."""
+    """
+    List Field.
+
+    max_items rejects the list that has more items before checking them, and
+    max_errors stops checking the items after the errors reach the number
+    (i.e. max_errors=1 means fail-fast). If memoize is True, each distinct
+    hashable value (compared with its type) is converted / validated once
+    per call, and the result is shared by the items having the value.
+
+    If executor (concurrent.futures.Executor, or "thread" to use a thread pool
+    per call) is specified, the validators of the items run on it, up to
+    concurrency items at once. The errors are still reported in the order of
+    the items.
+
+    A string is also accepted as the list if delimiter is specified (e.g.
+    "1,2,3" with delimiter=","), or packed ("int32" or "float64") is
+    specified and the string is the base64-encoded little-endian array.
+
+    If container is "array" (or "numpy"), the cleaned value is array.array
+    (or numpy.ndarray sharing the buffer) of int64 for IntegerField or
+    float64 for FloatField.
+
+    If form (Form class) is specified instead of field, each item should be
+    a dict and is validated by the form. The form is instantiated once per
+    thread and reused for the items, and the cleaned_data of the form is the
+    cleaned value of the item. The errors are reported per index and field.
+    error_map() converts the raised errors into the dict keyed by the index.
+
+    An iterator (e.g. iter_json_array) is also accepted, and its items are
+    converted one by one as they are read.
+
+    async_validators are the coroutine validators of the items. They are run
+    by arun_validators (e.g. on AsyncForm.ais_valid) with up to concurrency
+    items at once.
+    """
 
     default_error_messages = {
-        "invalid_list": _("Enter a list of values.")
+        "invalid_list": _("Enter a list of values."),
+        "max_items": _(
+            "Ensure this list has at most %(max_items)d items "
+            "(it has %(count)d)."
+        ),
+        "max_errors": _(
+            "Stopped checking the items after %(max_errors)d errors."
+        ),
+        "invalid_packed": _("Enter a base64-encoded %(packed)s array."),
+        "invalid_container": _(
+            "Enter the numbers that can be stored in the array."
+        ),
+        "invalid_item": _("Enter a mapping of the fields."),
     }
 
-    def __init__(self, *args, **kwargs):
+    def __init__(
+        self, *args, max_items=None, max_errors=None, memoize=False,
+        executor=None, concurrency=DEFAULT_CONCURRENCY,
+        async_validators=(), delimiter=None, packed=None, container="list",
+        form=None, **kwargs
+    ):
         """Init."""
+        _check_options(packed, container, form)
         self.field = kwargs.pop("field", None) or forms.CharField()
+        self.form = form
+        self._forms = threading.local()
+        self.container = container
+        self.typecode = _resolve_typecode(container, self.field)
+        self.delimiter = delimiter
+        self.packed = packed
+        self.max_items = max_items
+        self.max_errors = max_errors
+        self.memoize = memoize
+        self.executor = executor
+        self.concurrency = concurrency
+        self.async_validators = tuple(async_validators)
         super().__init__(*args, **kwargs)
 
-    def to_python(self, value):
-        """Normalize the value into python format with specified field."""
-        if not value:
-            return []
-        elif not isinstance(value, (list, tuple)):
-            raise forms.ValidationError(
-                self.error_messages["invalid_list"], code="invalid_list"
+    @staticmethod
+    def error_map(errors):
+        """
+        Return the errors of ListField keyed by the item.
+
+        The keys are the indices (e.g. "3", or "3.name" for the form items)
+        and "__all__" for the errors of the whole list, and the values are the
+        lists of {"message": ..., "code": ...}, so that the map can be dumped
+        into JSON as is.
+        """
+        result = {}
+        for (path, entry) in iter_errors(errors):
+            key = ".".join(map(str, path)) or NON_FIELD_ERRORS
+            result.setdefault(key, []).append(entry)
+        return result
+
+    def _apply(self, func, values, executor=None, start=0):
+        """
+        Call func with each value.
+
+        Return the results and the errors of the items. The errors are
+        collected up to max_errors, and the messages are formatted lazily.
+        The index of the first value is start.
+        """
+        if self.memoize:
+            func = _memoized(func)
+        if executor is None:
+            outcomes = (_outcome(func, value) for value in values)
+        else:
+            outcomes = _map_concurrently(
+                executor, self.concurrency, func, values
             )
+        return self._collect(
+            outcomes, len(values) if hasattr(values, "__len__") else None,
+            start
+        )
+
+    def _collect(self, outcomes, count, start=0):
+        """Collect the results and the errors from (result, error) pairs."""
+        results = []
         errors = []
-        normalize_values = []
-        for (index, item) in enumerate(value):
-            try:
-                normalize_values.append(self.field.to_python(item))
-            except forms.ValidationError as exc:
+        failures = 0
+        for (index, (result, exc)) in enumerate(outcomes, start):
+            if exc is None:
+                results.append(result)
+                continue
+            failures += 1
+            if hasattr(exc, "error_dict"):
+                # The errors of the inner form.
+                for (name, field_errors) in exc.error_dict.items():
+                    field_error = forms.ValidationError(field_errors)
+                    errors.append(forms.ValidationError(
+                        "Index %(index)d: %(field)s: %(err_msg)s", params={
+                            "index": index,
+                            "field": name,
+                            "err_msg": _JoinedMessages(field_error),
+                            "errors": field_error,
+                            "exception": exc
+                        }
+                    ))
+            else:
                 errors.append(forms.ValidationError(
                     "Index %(index)d: %(err_msg)s", params={
                         "index": index,
-                        "err_msg": ("").join(exc.messages),
+                        "err_msg": _JoinedMessages(exc),
+                        "errors": exc,
                         "exception": exc
                     }
                 ))
+            if self.max_errors and failures >= self.max_errors:
+                if count is None or index + 1 < start + count:
+                    errors.append(forms.ValidationError(
+                        self.error_messages["max_errors"],
+                        code="max_errors",
+                        params={"max_errors": self.max_errors}
+                    ))
+                break
+        if hasattr(outcomes, "close"):
+            outcomes.close()
+        return (results, errors)
+
+    def _clean_form_item(self, item):
+        """Validate the item with the pooled form."""
+        if not isinstance(item, Mapping):
+            raise forms.ValidationError(
+                self.error_messages["invalid_item"], code="invalid_item"
+            )
+        form = getattr(self._forms, "form", None)
+        if form is None:
+            form = self._forms.form = self.form()
+        form.data = item
+        form.files = {}
+        form.is_bound = True
+        form._errors = None
+        form._bound_fields_cache = {}
+        form.full_clean()
+        if form._errors:
+            raise forms.ValidationError(form._errors.as_data())
+        return form.cleaned_data
+
+    def _iterate(self, items):
+        """Yield the items of the iterator up to max_items."""
+        count = 0
+        while True:
+            try:
+                item = next(items)
+            except StopIteration:
+                return
+            except ValueError:
+                # e.g. the broken JSON from iter_json_array.
+                raise forms.ValidationError(
+                    self.error_messages["invalid_list"], code="invalid_list"
+                )
+            count += 1
+            self._check_max_items(count)
+            yield item
+
+    def _batch_iterate(self, items):
+        """
+        Convert the items of the iterator by chunks at once.
+
+        Return the converted values and the iterator of the rest of the items
+        (None if all items are converted) that should be converted one by one.
+        """
+        converted = []
+        while True:
+            chunk = list(islice(items, STREAM_CHUNK_SIZE))
+            if not chunk:
+                return (converted, None)
+            values = _batch_to_python(self.field, chunk)
+            if values is None:
+                return (converted, chain(chunk, items))
+            converted.extend(values)
+
+    def _check_max_items(self, count):
+        """Raise ValidationError if the list has more than max_items."""
+        if self.max_items is not None and count > self.max_items:
+            raise forms.ValidationError(
+                self.error_messages["max_items"], code="max_items",
+                params={"max_items": self.max_items, "count": count}
+            )
+
+    def _unpack(self, value):
+        """Decode the base64-encoded packed array."""
+        typecode = PACKED_TYPECODES[self.packed]
+        itemsize = array(typecode).itemsize
+        # Count the items from the length so that the oversized payload is
+        # rejected without being decoded.
+        self._check_max_items(
+            (len(value) * 3 // 4 - value[-2:].count("=")) // itemsize
+        )
+        try:
+            data = base64.b64decode(value, validate=True)
+        except (binascii.Error, ValueError):
+            data = None
+        if data is None or len(data) % itemsize:
+            raise forms.ValidationError(
+                self.error_messages["invalid_packed"], code="invalid_packed",
+                params={"packed": self.packed}
+            )
+        packed = array(typecode)
+        packed.frombytes(data)
+        if sys.byteorder == "big":
+            packed.byteswap()
+        return packed
+
+    def _normalize_packed(self, value):
+        """Normalize the base64-encoded packed array."""
+        packed = self._unpack(value)
+        if packed.typecode == self.typecode and \
+                _batch_to_python(self.field, packed[:1]) is not None:
+            # The stock field would convert the values into themselves.
+            return (packed, None)
+        return self._normalize_list(packed.tolist())
+
+    def _normalize_delimited(self, value):
+        """Normalize the delimited string."""
+        self._check_max_items(value.count(self.delimiter) + 1)
+        return self._normalize_list(value.split(self.delimiter))
+
+    def _normalize_iterator(self, value):
+        """Normalize the iterator (e.g. the stream of the JSON array)."""
+        items = self._iterate(value)
+        if self.form is not None:
+            return ([], items)
+        return self._batch_iterate(items)
+
+    def _normalize_list(self, value):
+        """Normalize the list / tuple."""
+        self._check_max_items(len(value))
+        if self.form is None:
+            converted = _batch_to_python(self.field, value)
+            if converted is not None:
+                return (converted, None)
+        return ([], value)
+
+    def _normalizer(self, value):
+        """Return the method that normalizes the shape of the value."""
+        if isinstance(value, str):
+            if self.packed:
+                return self._normalize_packed
+            if self.delimiter:
+                return self._normalize_delimited
+        elif isinstance(value, Iterator):
+            return self._normalize_iterator
+        elif isinstance(value, (list, tuple)):
+            return self._normalize_list
+        raise forms.ValidationError(
+            self.error_messages["invalid_list"], code="invalid_list"
+        )
+
+    def to_python(self, value):
+        """
+        Normalize the value into python format with specified field.
+
+        The normalizer of the shape converts the values at once if it can,
+        and returns the rest of the items to be converted one by one.
+        """
+        if not value:
+            return []
+        (converted, rest) = self._normalizer(value)(value)
+        if rest is None:
+            return converted
+        convert = (
+            self._clean_form_item if self.form is not None else
+            self.field.to_python
+        )
+        (normalize_values, errors) = self._apply(
+            convert, rest, start=len(converted)
+        )
         if errors:
             raise forms.ValidationError(errors, code="invalid")
+        if converted:
+            converted.extend(normalize_values)
+            return converted
         return normalize_values
 
     # validate(self, value) function is reserved for the subclass of this
     # class.
 
+    def clean(self, value):
+        """Clean the value, and put it into the container."""
+        value = super().clean(value)
+        if self.container == "list":
+            return value
+        if not (isinstance(value, array) and value.typecode == self.typecode):
+            try:
+                value = array(self.typecode, value)
+            except (TypeError, OverflowError):
+                raise forms.ValidationError(
+                    self.error_messages["invalid_container"],
+                    code="invalid_container"
+                )
+        if self.container == "numpy":
+            return numpy.frombuffer(value, dtype=value.typecode)
+        return value
+
     def run_validators(self, value):
         """Validate the value."""
-        errors = []
-        for (index, item) in enumerate(value):
-            try:
-                self.field.run_validators(item)
-            except forms.ValidationError as exc:
-                errors.append([
-                    forms.ValidationError(
-                        "Index %(index)d: %(err_msg)s", params={
-                            "index": index,
-                            "err_msg": ("").join(exc.messages),
-                            "exception": exc
-                        }
+        if self.form is not None or _batch_validate(self.field, value):
+            return
+        executor = self.executor
+        if executor == "thread":
+            with ThreadPoolExecutor(self.concurrency) as executor:
+                try:
+                    (_, errors) = self._apply(
+                        self.field.run_validators, value, executor
                     )
-                ])
+                finally:
+                    _close_connections(executor, self.concurrency)
+        else:
+            (_, errors) = self._apply(
+                self.field.run_validators, value, executor
+            )
+        if errors:
+            raise forms.ValidationError(errors, code="invalid")
+
+    async def arun_validators(self, value):
+        """Run async_validators on the items concurrently."""
+        if not self.async_validators:
+            return
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def check(item):
+            if is_empty(item, self.field.empty_values):
+                return (None, None)
+            async with semaphore:
+                try:
+                    await run_async_validators(self.async_validators, item)
+                except forms.ValidationError as exc:
+                    return (None, exc)
+            return (None, None)
+
+        (_, errors) = self._collect(
+            await asyncio.gather(*(check(item) for item in value)),
+            len(value)
+        )
         if errors:
             raise forms.ValidationError(errors, code="invalid")
@@ -0,0 +1,28 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Compile the widget templates."""
+
+from django.core.management.base import BaseCommand
+
+from djextra.forms.angular1.widgets.base import Jinja2Engine
+from djextra.forms.angular1.widgets.compiled import compile_templates
+
+
+class Command(BaseCommand):
+    """Compile the widget templates into a bundle."""
+
+    help = (
+        "Compile the templates of the widgets into a bundle. Set the path of "
+        "the bundle to DJEXTRA_COMPILED_WIDGET_TEMPLATES to use it."
+    )
+
+    def add_arguments(self, parser):
+        """Add the arguments."""
+        parser.add_argument("target", help="The path of the bundle.")
+
+    def handle(self, *args, **options):
+        """Compile the templates."""
+        env = Jinja2Engine().source_engine.env
+        for name in compile_templates(env, options["target"]):
+            self.stdout.write(f"Compiled {name}")
@@ -0,0 +1,26 @@
+/*
+ * Assign the initial values rendered by AngularForm.ng_init_script().
+ *
+ * angular.module("app", ["djextra"]);
+ * <form>{{ form.ng_init_script() }}...</form>
+ */
+(function (angular) {
+  "use strict";
+
+  angular.module("djextra", []).directive("djextraNgInit", [
+    "$parse",
+    function ($parse) {
+      return {
+        restrict: "A",
+        link: {
+          pre: function (scope, element) {
+            var values = JSON.parse(element.text());
+            angular.forEach(values, function (value, model) {
+              $parse(model).assign(scope, value);
+            });
+          }
+        }
+      };
+    }
+  ]);
+}(window.angular));
@@ -6,7 +6,7 @@ import sys
 import os.path as path
 from setuptools import setup, find_packages
 
-dependencies = ["django>=1.11", "jinja2"]
+dependencies = ["django>=1.11", "jinja2", "asgiref>=3.2"]
 name = "djextra"
 desc = "Additional Functions for Django"
 license = "MIT"
@@ -40,6 +40,7 @@ setup(
     packages=find_packages(exclude=["tests"]),
     include_package_data=True,
     install_requires=dependencies,
+    extras_require={"numpy": ["numpy"], "orjson": ["orjson"]},
     zip_safe=False,
     author=author,
     author_email=author_email,
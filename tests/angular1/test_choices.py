@@ -0,0 +1,472 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Choice utility tests."""
+
+import copy
+from unittest.mock import patch
+
+from django import forms, setup
+from django.contrib.contenttypes.models import ContentType
+from django.db.models.functions import Lower
+from django.test import TestCase, override_settings
+from django.utils.functional import Promise, lazy
+from django.utils.translation import gettext_lazy
+
+from djextra.forms.angular1 import MDSelect
+from djextra.forms.angular1.choices import (
+    ChoiceIndex, ChoiceTable, QuerySetChoices, choice_version, find_choices,
+    get_choice_index, intern_choices, iter_choices, page_choices
+)
+
+setup()
+
+
+class SequenceChoicesTest(TestCase):
+    """Choice utilities with sequence test."""
+
+    def setUp(self):
+        """Setup."""
+        self.choices = (
+            ("test", (("testTest1", "Test 1"), ("testTest2", "Test 2"))),
+            ("test2", "Test2"), ("test3", "Test3"), (None, "Test4")
+        )
+
+    def test_iter_choices(self):
+        """The groups should be flattened."""
+        self.assertEqual(list(iter_choices(self.choices)), [
+            ("testTest1", "Test 1"), ("testTest2", "Test 2"),
+            ("test2", "Test2"), ("test3", "Test3"), (None, "Test4")
+        ])
+
+    def test_page(self):
+        """The page should be sliced with offset and limit."""
+        self.assertEqual(page_choices(self.choices, 1, 2), [
+            ("testTest2", "Test 2"), ("test2", "Test2")
+        ])
+
+    def test_page_after(self):
+        """The page should start at the next of after."""
+        self.assertEqual(page_choices(self.choices, limit=2, after="test2"), [
+            ("test3", "Test3"), (None, "Test4")
+        ])
+
+    def test_find(self):
+        """The choices that have the values should be returned."""
+        self.assertEqual(find_choices(self.choices, ["test3", "testTest1"]), [
+            ("testTest1", "Test 1"), ("test3", "Test3")
+        ])
+
+
+class ModelChoicesTest(TestCase):
+    """Choice utilities with model-backed choices test."""
+
+    def setUp(self):
+        """Setup."""
+        self.queryset = ContentType.objects.order_by("pk")
+        self.field = forms.ModelChoiceField(self.queryset)
+
+    def test_page(self):
+        """The page should start with the empty label."""
+        page = page_choices(self.field.choices, 0, 3)
+        self.assertEqual(page[0], ("", self.field.empty_label))
+        self.assertEqual(
+            [value.value for (value, _) in page[1:]],
+            [obj.pk for obj in self.queryset[:2]]
+        )
+
+    def test_page_offset(self):
+        """The offset should count the empty label."""
+        page = page_choices(self.field.choices, 2, 2)
+        self.assertEqual(
+            [value.value for (value, _) in page],
+            [obj.pk for obj in self.queryset[1:3]]
+        )
+
+    def test_page_after(self):
+        """The page should be fetched with the keyset."""
+        first = self.queryset.first()
+        page = page_choices(self.field.choices, limit=2, after=first.pk)
+        self.assertEqual(
+            [value.value for (value, _) in page],
+            [obj.pk for obj in self.queryset.filter(pk__gt=first.pk)[:2]]
+        )
+
+    def test_page_after_ordering(self):
+        """The keyset pages should follow the ordering of the queryset."""
+        ContentType.objects.bulk_create(
+            ContentType(app_label=app_label, model=model)
+            for model in ("x", "y", "z") for app_label in ("a", "b")
+        )
+        queryset = ContentType.objects.order_by("-model")
+        field = forms.ModelChoiceField(queryset, empty_label=None)
+        expected = [
+            obj.pk for obj in ContentType.objects.order_by("-model", "pk")
+        ]
+        (pages, after) = ([], None)
+        while True:
+            page = page_choices(field.choices, limit=2, after=after)
+            if not page:
+                break
+            pages.extend(value.value for (value, _) in page)
+            after = pages[-1]
+        self.assertEqual(pages, expected)
+        # The offset pages don't need the tie breaker; both are "y".
+        self.assertEqual(
+            {value.value for (value, _) in page_choices(field.choices, 2, 2)},
+            set(expected[2:4])
+        )
+
+    def test_page_expression(self):
+        """The queryset ordered by the expression should be paged by offset."""
+        queryset = ContentType.objects.order_by(Lower("model"), "pk")
+        for ordered in (queryset, queryset.extra(order_by=["-id"])):
+            field = forms.ModelChoiceField(ordered, empty_label=None)
+            with self.subTest(query=str(ordered.query)):
+                self.assertEqual(
+                    [value.value for (value, _) in page_choices(
+                        field.choices, 1, 2
+                    )],
+                    [obj.pk for obj in ordered[1:3]]
+                )
+
+    def test_page_unordered(self):
+        """The unordered queryset should be paged by the key."""
+        field = forms.ModelChoiceField(
+            ContentType.objects.all(), empty_label=None
+        )
+        self.assertFalse(field.queryset.ordered)
+        self.assertEqual(
+            [value.value for (value, _) in page_choices(field.choices)],
+            [obj.pk for obj in ContentType.objects.order_by("pk")]
+        )
+
+    def test_page_after_unordered(self):
+        """The queryset ordered by the expression can't be paged by key."""
+        field = forms.ModelChoiceField(ContentType.objects.order_by("?"))
+        with self.assertRaises(ValueError):
+            page_choices(field.choices, limit=2, after=1)
+
+    def test_find(self):
+        """The choices that have the values should be returned."""
+        obj = self.queryset.last()
+        self.assertEqual(
+            [value.value for (value, _) in find_choices(
+                self.field.choices, [str(obj.pk)]
+            )],
+            [obj.pk]
+        )
+
+    def test_find_invalid(self):
+        """The invalid value should be ignored."""
+        self.assertEqual(find_choices(self.field.choices, ["invalid"]), [])
+
+
+class ChoiceIndexTest(TestCase):
+    """ChoiceIndex test."""
+
+    def setUp(self):
+        """Setup."""
+        self.choices = (
+            ("fruits", (
+                ("apple", "Apple"), ("pineapple", "Pineapple"),
+                ("grape", "Grape"), ("grapefruit", "Grapefruit")
+            )),
+            ("apricot", "Apricot"), (None, "Nothing")
+        )
+        self.index = ChoiceIndex(self.choices)
+
+    def test_prefix(self):
+        """The labels that start with the query should come first."""
+        self.assertEqual(self.index.search("ap"), [
+            ("apple", "Apple"), ("apricot", "Apricot"),
+            ("pineapple", "Pineapple"), ("grape", "Grape"),
+            ("grapefruit", "Grapefruit")
+        ])
+
+    def test_substring(self):
+        """The labels that contain the query should be found."""
+        self.assertEqual(self.index.search("APPLE"), [
+            ("apple", "Apple"), ("pineapple", "Pineapple")
+        ])
+
+    def test_limit(self):
+        """The result should be limited."""
+        self.assertEqual(self.index.search("gr", 1), [("grape", "Grape")])
+
+    def test_not_found(self):
+        """Nothing should be returned when nothing matches."""
+        self.assertEqual(self.index.search("banana"), [])
+
+    def test_none(self):
+        """None value should be normalized into an empty string."""
+        self.assertEqual(self.index.search("noth"), [("", "Nothing")])
+
+
+class ChoiceIndexCacheTest(TestCase):
+    """Choice index cache test."""
+
+    def test_reuse(self):
+        """The index should be reused for the same choices."""
+        choices = [("test1", "Test 1"), ("test2", "Test 2")]
+        self.assertIs(get_choice_index(choices), get_choice_index(
+            list(choices)
+        ))
+
+    def test_invalidate(self):
+        """The index should be rebuilt when the choices change."""
+        choices = [("test1", "Test 1"), ("test2", "Test 2")]
+        index = get_choice_index(choices)
+        choices.append(("test3", "Test 3"))
+        self.assertIsNot(index, get_choice_index(choices))
+        self.assertEqual(
+            get_choice_index(choices).search("test 3"), [("test3", "Test 3")]
+        )
+
+    def test_model_version(self):
+        """The version of model-backed choices should follow the saves."""
+        field = forms.ModelChoiceField(ContentType.objects.all())
+        version = choice_version(field.choices)
+        self.assertEqual(version, choice_version(field.choices))
+        ContentType.objects.create(app_label="test", model="test")
+        self.assertNotEqual(version, choice_version(field.choices))
+
+    def test_model_version_ttl(self):
+        """The changes the signals miss should be picked up after the TTL."""
+        field = forms.ModelChoiceField(ContentType.objects.all())
+        with override_settings(DJEXTRA_CHOICE_VERSION_TTL=60), patch(
+            "djextra.forms.angular1.choices.time.time", return_value=6000.0
+        ) as now:
+            index = get_choice_index(field.choices)
+            ContentType.objects.bulk_create([
+                ContentType(app_label="test", model="bulk")
+            ])
+            self.assertIs(get_choice_index(field.choices), index)
+            now.return_value = 6060.0
+            self.assertEqual(
+                get_choice_index(field.choices).search("bulk")[0][1], "bulk"
+            )
+
+
+class ChoiceTableTest(TestCase):
+    """ChoiceTable test."""
+
+    def setUp(self):
+        """Setup."""
+        self.choices = [("a", "A"), ("Group", [["b", "B"]])]
+
+    def test_table(self):
+        """The groups should be tuples, and the version should be kept."""
+        table = ChoiceTable(self.choices)
+        self.assertEqual(table, (("a", "A"), ("Group", (("b", "B"), ))))
+        self.assertEqual(choice_version(table), table.version)
+        self.assertIs(copy.deepcopy(table), table)
+        self.assertIs(table(), table)
+
+    def test_intern(self):
+        """The same choices should share the table."""
+        table = intern_choices(self.choices)
+        self.assertIs(intern_choices(list(self.choices)), table)
+        self.assertIsNot(intern_choices([("c", "C")]), table)
+        self.assertIs(
+            intern_choices(forms.ChoiceField(choices=table).choices), table
+        )
+
+    def test_intern_types(self):
+        """The equal choices of the other types shouldn't be shared."""
+        intern_choices([(True, "Yes")])
+        table = intern_choices([(1, "Yes")])
+        self.assertIs(type(table[0][0]), int)
+        self.assertIn(
+            "data-value=\"1\"", MDSelect(choices=[(1, "Yes")]).render("a", 1)
+        )
+        intern_choices([(0.0, "Zero")])
+        self.assertEqual(repr(intern_choices([(-0.0, "Zero")])[0][0]), "-0.0")
+        intern_choices([("g", [(True, "Yes")])])
+        self.assertIs(
+            type(intern_choices([("g", [(1, "Yes")])])[0][1][0][0]), int
+        )
+
+    def test_intern_lazy(self):
+        """The lazy labels shouldn't be replaced by the plain strings."""
+        intern_choices([("y", "Yes")])
+        table = intern_choices([("y", gettext_lazy("Yes"))])
+        self.assertIsInstance(table[0][1], Promise)
+        self.assertIsNot(intern_choices([("y", gettext_lazy("Yes"))]), table)
+
+    def test_widget(self):
+        """The copies of the widget should share the choices."""
+        widget = MDSelect(choices=self.choices)
+        copied = copy.deepcopy(widget)
+        self.assertIs(copied._choices, widget._choices)
+        copied.choices = [("c", "C")]
+        self.assertEqual(widget.choices, intern_choices(self.choices))
+
+    def test_widget_modified(self):
+        """The modified choices should be copied into the widget."""
+        table = intern_choices(self.choices)
+        (widget, other) = (MDSelect(choices=table), MDSelect(choices=table))
+        widget.choices.append(("d", "D"))
+        del widget.choices[0]
+        self.assertEqual(
+            widget.choices, [("Group", (("b", "B"), )), ("d", "D")]
+        )
+        self.assertIs(other._choices, table)
+        self.assertEqual(len(table), 2)
+        self.assertIn("data-value=\"d\"", widget.render("item", None))
+        other.choices = widget.choices
+        self.assertIsNot(other._choices, widget._choices)
+        self.assertEqual(other.choices, widget.choices)
+
+    def test_lazy_not_evaluated(self):
+        """The lazy labels shouldn't be evaluated until rendering."""
+        def fail():
+            raise AssertionError("Evaluated.")
+
+        label = lazy(fail, str)()
+        widget = MDSelect(choices=[("a", label)])
+        copy.deepcopy(widget)
+        forms.ChoiceField(choices=[("a", label)], widget=MDSelect)
+
+    def test_intern_bounded(self):
+        """The interned tables should be bounded by the choices in total."""
+        with patch("djextra.forms.angular1.choices.MAX_TABLE_ITEMS", 4):
+            tables = [
+                intern_choices([(f"{idx}-{sub}", "") for sub in range(2)])
+                for idx in range(3)
+            ]
+            self.assertIsNot(intern_choices(list(tables[0])), tables[0])
+            self.assertIs(intern_choices(list(tables[2])), tables[2])
+            big = [(idx, "") for idx in range(5)]
+            self.assertIsNot(intern_choices(big), intern_choices(big))
+
+    def test_form(self):
+        """The form instances should share the choices of the field."""
+
+        class TestForm(forms.Form):
+
+            item = forms.ChoiceField(
+                choices=ChoiceTable(self.choices), widget=MDSelect
+            )
+
+        (form1, form2) = (TestForm(data={"item": "b"}), TestForm())
+        self.assertIs(
+            form1.fields["item"].widget._choices,
+            form2.fields["item"].widget._choices
+        )
+        self.assertTrue(form1.is_valid())
+        self.assertIn("data-value=\"b\" data-selected", str(form1["item"]))
+
+
+class QuerySetChoicesTest(TestCase):
+    """QuerySetChoices test."""
+
+    def setUp(self):
+        """Setup."""
+        self.queryset = ContentType.objects.order_by("pk")
+        self.choices = QuerySetChoices(
+            self.queryset, label_field="model", chunk_size=2,
+            empty_label="---"
+        )
+
+    def test_iter(self):
+        """The values and labels should be fetched by values_list."""
+        self.assertEqual(
+            list(self.choices),
+            [("", "---")] + list(self.queryset.values_list("pk", "model"))
+        )
+
+    def test_instances(self):
+        """The instances should be labelled without label_field."""
+        choices = QuerySetChoices(
+            self.queryset, "model", label_from_instance=lambda obj: obj.pk
+        )
+        self.assertEqual(
+            list(choices), list(self.queryset.values_list("model", "pk"))
+        )
+
+    def test_streamed(self):
+        """The rows should be fetched by chunks."""
+        with patch(
+            "django.db.models.query.QuerySet.iterator",
+            autospec=True, side_effect=lambda queryset, chunk_size: iter(())
+        ) as iterator:
+            self.assertEqual(list(self.choices), [("", "---")])
+        self.assertEqual(iterator.call_args[1], {"chunk_size": 2})
+
+    def test_page_and_find(self):
+        """The choices should be paged and found by the query."""
+        rows = list(self.queryset.values_list("pk", "model"))
+        self.assertEqual(
+            page_choices(self.choices, 0, 3), [("", "---")] + rows[:2]
+        )
+        self.assertEqual(
+            page_choices(self.choices, limit=2, after=rows[0][0]), rows[1:3]
+        )
+        self.assertEqual(
+            find_choices(self.choices, [str(rows[-1][0]), "x"]), []
+        )
+        self.assertEqual(
+            find_choices(self.choices, [str(rows[-1][0])]), rows[-1:]
+        )
+
+    def test_version(self):
+        """The version should follow the query and the model."""
+        version = choice_version(self.choices)
+        self.assertEqual(choice_version(self.choices), version)
+        self.assertNotEqual(choice_version(QuerySetChoices(
+            self.queryset.filter(app_label="auth"), label_field="model"
+        )), version)
+
+    def test_field(self):
+        """The choices of ChoiceField shouldn't be copied."""
+        field = forms.ChoiceField(choices=self.choices, widget=MDSelect)
+        self.assertIs(field.widget.choices, self.choices)
+        self.assertIs(copy.deepcopy(field).widget.choices, self.choices)
+
+
+class MDSelectQuerySetTest(TestCase):
+    """MDSelect streaming the model-backed choices test."""
+
+    def setUp(self):
+        """Setup."""
+        self.queryset = ContentType.objects.order_by("pk")
+        self.obj = self.queryset.last()
+
+    def render(self, widget):
+        """Render the field with the widget."""
+        field = forms.ModelChoiceField(self.queryset, widget=widget)
+        return field.widget.render("ct", self.obj.pk)
+
+    def test_label_field(self):
+        """The options should be labelled by label_field."""
+        html = self.render(MDSelect(label_field="model"))
+        self.assertIn(
+            f"data-value=\"{self.obj.pk}\" data-selected>\n{self.obj.model}",
+            html
+        )
+        self.assertEqual(html.count("<md-option"), self.queryset.count() + 1)
+
+    def test_same_html(self):
+        """The chunked options should be the same as ModelChoiceField's."""
+        self.assertEqual(
+            self.render(MDSelect(chunk_size=3)), self.render(MDSelect())
+        )
+
+    def test_lazy_optgroups(self):
+        """The optgroups should be generated while rendering."""
+        field = forms.ModelChoiceField(
+            self.queryset, widget=MDSelect(label_field="model")
+        )
+        groups = field.widget.optgroups("ct", [])
+        self.assertNotIsInstance(groups, list)
+        self.assertEqual(len(list(groups)), self.queryset.count() + 1)
+
+    def test_paging(self):
+        """The page should be fetched by values_list."""
+        field = forms.ModelChoiceField(
+            self.queryset, widget=MDSelect(page_size=2, label_field="model")
+        )
+        html = field.widget.render("ct", self.obj.pk)
+        self.assertEqual(html.count("<md-option"), 3)
+        self.assertIn(f"{self.obj.model}\n</md-option>", html)
@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Serializer tests."""
+
+import json
+import uuid
+from array import array
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from unittest import skipUnless
+from unittest.mock import patch
+
+from django import forms, setup
+from django.test import TestCase
+from django.utils.translation import gettext_lazy
+
+from djextra.forms.angular1 import AngularForm
+from djextra.forms.angular1.serializers import (
+    Serializer, default_serializer, orjson, register_defaults
+)
+
+setup()
+
+
+class Money(object):
+    """Custom value."""
+
+    def __init__(self, amount):
+        """Init."""
+        self.amount = amount
+
+
+class SerializerTest(TestCase):
+    """Serializer test."""
+
+    values = {
+        "decimal": Decimal("1.50"),
+        "datetime": datetime(2020, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        "date": date(2020, 1, 2),
+        "uuid": uuid.UUID(int=1),
+        "lazy": gettext_lazy("Test"),
+        "array": array("q", [1, 2]),
+        "set": {1},
+        "tuple": (1, "あ"),
+    }
+    expected = (
+        "{\"decimal\":\"1.50\",\"datetime\":\"2020-01-02T03:04:05+00:00\","
+        "\"date\":\"2020-01-02\","
+        "\"uuid\":\"00000000-0000-0000-0000-000000000001\","
+        "\"lazy\":\"Test\",\"array\":[1,2],\"set\":[1],\"tuple\":[1,\"あ\"]}"
+    )
+
+    def test_json(self):
+        """The standard types should be encoded."""
+        serializer = register_defaults(Serializer(backend="json"))
+        self.assertEqual(serializer.dumps(self.values), self.expected)
+
+    @skipUnless(orjson, "orjson isn't installed.")
+    def test_orjson(self):
+        """The orjson backend should write the same JSON."""
+        serializer = register_defaults(Serializer(backend="orjson"))
+        self.assertEqual(serializer.dumps(self.values), self.expected)
+
+    def test_register(self):
+        """The registered encoder should be used."""
+        serializer = Serializer()
+        with self.assertRaises(TypeError):
+            serializer.dumps(Money(1))
+        serializer.register(Money, lambda value: {"amount": value.amount})
+        self.assertEqual(
+            serializer.dumps([Money(1)]), "[{\"amount\":1}]"
+        )
+
+    def test_memo(self):
+        """The immutable values should be dumped once."""
+        serializer = register_defaults(Serializer(backend="json"))
+        with patch.object(
+            serializer, "_dumps", wraps=serializer._dumps
+        ) as dumps:
+            for _ in range(2):
+                serializer.dumps(("a", 1))
+                serializer.dumps(["a", 1])
+        self.assertEqual(dumps.call_count, 3)
+
+    def test_memo_key(self):
+        """The equal values dumped differently shouldn't share the memo."""
+        tz = timezone(timedelta(hours=9))
+        moment = datetime(2020, 1, 1, tzinfo=timezone.utc)
+        for (first, second) in (
+            ((1, ), (True, )), (0.0, -0.0), (Decimal("1"), Decimal("1.0")),
+            (moment, moment.astimezone(tz)),
+        ):
+            self.assertNotEqual(
+                default_serializer.dumps(first),
+                default_serializer.dumps(second)
+            )
+
+    def test_memo_size(self):
+        """The memo should be bounded."""
+        serializer = Serializer(memo_size=2)
+        for value in range(3):
+            serializer.dumps(value)
+        self.assertEqual(len(serializer.memo), 2)
+
+
+class FormSerializerTest(TestCase):
+    """AngularForm with the serializer test."""
+
+    def test_ng_init(self):
+        """The values should be dumped by ng_init_serializer."""
+        serializer = register_defaults(Serializer(backend="json"))
+        serializer.register(Money, lambda value: str(value.amount))
+
+        class TestForm(AngularForm):
+
+            class Meta(object):
+                handle_ng_init = True
+                ng_init_serializer = serializer
+
+            price = forms.DecimalField()
+            tags = forms.Field()
+
+        form = TestForm(initial={"price": Money(3), "tags": ("a", "b")})
+        self.assertIn(
+            "data-ng-init=\"model.price = &quot;3&quot;\"", str(form["price"])
+        )
+        self.assertEqual(
+            json.loads(TestForm.get_ng_model_plan().serializer.dumps(
+                form.ng_init_data()
+            )), {"model.price": "3", "model.tags": ["a", "b"]}
+        )
+
+    def test_ng_init_dates(self):
+        """The top-level date should be formatted by the widget."""
+
+        class TestForm(AngularForm):
+
+            class Meta(object):
+                handle_ng_init = True
+                ng_init_serializer = register_defaults(
+                    Serializer(backend="json")
+                )
+
+            day = forms.DateField(
+                widget=forms.DateInput(format="%d/%m/%Y")
+            )
+            days = forms.Field()
+
+        form = TestForm(initial={
+            "day": date(2020, 1, 2), "days": (date(2020, 1, 2), 1)
+        })
+        self.assertIn(
+            "data-ng-init=\"model.day = &quot;02/01/2020&quot;\"",
+            str(form["day"])
+        )
+        self.assertIn(
+            "data-ng-init=\"model.days = [&quot;2020-01-02&quot;,1]\"",
+            str(form["days"])
+        )
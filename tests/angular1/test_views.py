@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""View tests."""
+
+import json
+
+from django import forms, setup
+from django.contrib.contenttypes.models import ContentType
+from django.test import RequestFactory, TestCase
+
+from djextra.forms.angular1.views import ChoicePageView, ChoiceSearchView
+
+setup()
+
+
+class ChoicePageViewTest(TestCase):
+    """ChoicePageView test."""
+
+    def setUp(self):
+        """Setup."""
+        class TestForm(forms.Form):
+            item = forms.ChoiceField(choices=[
+                (f"test{idx}", f"Test {idx}") for idx in range(10)
+            ])
+
+        self.view = ChoicePageView.as_view(
+            form_class=TestForm, field_name="item", page_size=4
+        )
+        self.factory = RequestFactory()
+
+    def get(self, **query):
+        """Request the view."""
+        return self.view(self.factory.get("/", query))
+
+    def test_first_page(self):
+        """The first page should be served with page_size."""
+        result = json.loads(self.get().content)
+        self.assertEqual(result, {
+            "results": [
+                {"value": f"test{idx}", "label": f"Test {idx}"}
+                for idx in range(4)
+            ],
+            "has_next": True
+        })
+
+    def test_last_page(self):
+        """The last page shouldn't have the next page."""
+        result = json.loads(self.get(offset=8, limit=4).content)
+        self.assertEqual(
+            [item["value"] for item in result["results"]], ["test8", "test9"]
+        )
+        self.assertFalse(result["has_next"])
+
+    def test_after(self):
+        """The page should start at the next of after."""
+        result = json.loads(self.get(after="test6").content)
+        self.assertEqual(
+            [item["value"] for item in result["results"]],
+            ["test7", "test8", "test9"]
+        )
+
+    def test_invalid(self):
+        """The invalid parameters should be rejected."""
+        for query in ({"offset": "a"}, {"offset": -1}, {"limit": 0}):
+            self.assertEqual(self.get(**query).status_code, 400)
+
+    def test_invalid_after(self):
+        """The after that can't be used for the queryset should be rejected."""
+        class TestForm(forms.Form):
+            item = forms.ModelChoiceField(ContentType.objects.order_by("?"))
+
+        view = ChoicePageView.as_view(form_class=TestForm, field_name="item")
+        for after in ("1", "a"):
+            self.assertEqual(view(self.factory.get(
+                "/choices", {"after": after}
+            )).status_code, 400)
+        self.assertEqual(view(self.factory.get(
+            "/choices", {"offset": 1, "limit": 2}
+        )).status_code, 200)
+
+
+class ChoiceSearchViewTest(TestCase):
+    """ChoiceSearchView test."""
+
+    def setUp(self):
+        """Setup."""
+        class TestForm(forms.Form):
+            item = forms.ChoiceField(choices=[
+                (f"test{idx}", f"Test {idx}") for idx in range(30)
+            ])
+
+        self.view = ChoiceSearchView.as_view(
+            form_class=TestForm, field_name="item"
+        )
+        self.factory = RequestFactory()
+
+    def test_search(self):
+        """The matched choices should be returned."""
+        result = json.loads(
+            self.view(self.factory.get("/", {"q": "test 2", "limit": 3}))
+            .content
+        )
+        self.assertEqual(result, {"results": [
+            {"value": "test2", "label": "Test 2"},
+            {"value": "test20", "label": "Test 20"},
+            {"value": "test21", "label": "Test 21"}
+        ]})
+
+    def test_invalid(self):
+        """The invalid limit should be rejected."""
+        for limit in ("a", 0):
+            self.assertEqual(
+                self.view(self.factory.get("/", {"limit": limit}))
+                .status_code, 400
+            )
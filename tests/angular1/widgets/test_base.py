@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""BaseWidget Tests."""
+
+from unittest.mock import patch
+
+from django import setup
+from django.forms.renderers import get_default_renderer as get_form_renderer
+from django.test import TestCase, override_settings
+
+from djextra.forms.angular1.widgets import MDSelect
+from djextra.forms.angular1.widgets.base import (
+    Jinja2Engine, get_default_renderer
+)
+
+setup()
+
+
+class SharedRendererTest(TestCase):
+    """Shared renderer test."""
+
+    def test_shared(self):
+        """The renderer should be shared in the process."""
+        self.assertIsInstance(get_default_renderer(), Jinja2Engine)
+        self.assertIs(get_default_renderer(), get_default_renderer())
+
+    def test_engine_shared(self):
+        """The rendering should reuse the environment."""
+        renderer = get_default_renderer()
+        engine = renderer.engine
+        MDSelect(choices=(("test", "Test"), )).render("result", None)
+        self.assertIs(get_default_renderer().engine, engine)
+
+    @override_settings(
+        FORM_RENDERER="djextra.forms.angular1.widgets.base.Jinja2Engine"
+    )
+    def test_form_renderer(self):
+        """The renderer in FORM_RENDERER should be honoured."""
+        get_form_renderer.cache_clear()
+        self.addCleanup(get_form_renderer.cache_clear)
+        self.assertIsInstance(get_form_renderer(), Jinja2Engine)
+        self.assertIs(get_default_renderer(), get_form_renderer())
+
+    def test_passed_renderer(self):
+        """The passed renderer should be used when it can find templates."""
+        renderer = Jinja2Engine()
+        with patch.object(
+            renderer, "get_template", wraps=renderer.get_template
+        ) as get_template:
+            MDSelect().render("result", None, renderer=renderer)
+        get_template.assert_called_once_with("md_select.html")
+
+    def test_unrelated_renderer(self):
+        """The renderer that doesn't know the templates should be ignored."""
+        result = MDSelect().render(
+            "result", None, renderer=get_form_renderer()
+        )
+        self.assertEqual(
+            str(result).replace("\n", ""),
+            "<md-select data-name=\"result\"></md-select>"
+        )
+
+
+class StreamTest(TestCase):
+    """Streaming render test."""
+
+    def setUp(self):
+        """Setup."""
+        self.widget = MDSelect(choices=[
+            (f"test{idx}", f"Test {idx}") for idx in range(100)
+        ])
+
+    def test_stream(self):
+        """The joined chunks should be the same as the rendered html."""
+        self.assertEqual(
+            "".join(self.widget.stream("result", "test3")),
+            self.widget.render("result", "test3")
+        )
+
+    def test_chunk_size(self):
+        """The chunks should have chunk_size chars at least."""
+        chunks = list(self.widget.stream("result", None, chunk_size=256))
+        self.assertGreater(len(chunks), 1)
+        for chunk in chunks[:-1]:
+            self.assertGreaterEqual(len(chunk), 256)
+
+    def test_lazy(self):
+        """The stream should be rendered lazily."""
+        stream = self.widget.stream("result", None, chunk_size=1)
+        self.assertTrue(next(stream).startswith("<md-select"))
@@ -0,0 +1,194 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Fragment cache tests."""
+
+import os
+import subprocess
+import sys
+from datetime import date
+from decimal import Decimal
+from unittest.mock import patch
+
+from django import forms, setup
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache.backends.locmem import LocMemCache
+from django.test import TestCase
+
+from djextra.forms.angular1.keys import freeze
+from djextra.forms.angular1.widgets import MDCheckBox, MDDateSelect, MDSelect
+from djextra.forms.angular1.widgets.cache import FragmentCache
+
+setup()
+
+
+class FragmentCacheTest(TestCase):
+    """FragmentCache test."""
+
+    def test_lru(self):
+        """The least recently used fragment should be evicted by the size."""
+        cache = FragmentCache(max_size=10)
+        cache.set("a", "aaaa")
+        cache.set("b", "bbbb")
+        cache.get("a")
+        cache.set("c", "cccc")
+        self.assertEqual(cache.get("a"), "aaaa")
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), "cccc")
+        self.assertEqual(cache.stats(), {
+            "hits": 3, "misses": 1, "entries": 2, "size": 8
+        })
+
+    def test_too_large(self):
+        """The fragment larger than max_size shouldn't be kept."""
+        cache = FragmentCache(max_size=3)
+        cache.set("a", "aaaa")
+        self.assertIsNone(cache.get("a"))
+
+    def test_backend(self):
+        """The fragments should be shared via the backend."""
+        backend = LocMemCache("djextra-test", {})
+        FragmentCache(backend=backend).set(("key", 1), "html")
+        cache = FragmentCache(backend=backend)
+        self.assertEqual(cache.get(("key", 1)), "html")
+        self.assertEqual(cache.stats()["entries"], 1)
+
+    def test_freeze(self):
+        """Unstable values shouldn't be frozen."""
+        self.assertEqual(
+            freeze({"a": [1, 2]}),
+            ("dict", (("str", "a"), (("int", 1), ("int", 2))))
+        )
+        with self.assertRaises(TypeError):
+            freeze(lambda: None)
+        with self.assertRaises(TypeError):
+            freeze(object())
+
+
+class WidgetCacheTest(TestCase):
+    """Widget rendering with fragment cache."""
+
+    def setUp(self):
+        """Setup."""
+        self.cache = FragmentCache()
+        self.choices = [("a", "A"), ("b", "B")]
+
+    def test_hit(self):
+        """The second rendering should skip get_context."""
+        widget = MDSelect(
+            choices=self.choices, fragment_cache=self.cache
+        )
+        expected = MDSelect(choices=self.choices).render("test", "a")
+        self.assertEqual(widget.render("test", "a"), expected)
+        with patch.object(MDSelect, "get_context") as get_context:
+            self.assertEqual(widget.render("test", "a"), expected)
+        get_context.assert_not_called()
+        self.assertEqual(self.cache.stats()["hits"], 1)
+        self.assertEqual(self.cache.stats()["misses"], 1)
+
+    def test_key(self):
+        """Value, attrs, and choices should be a part of the key."""
+        widget = MDSelect(
+            choices=self.choices, fragment_cache=self.cache
+        )
+        widget.render("test", "a")
+        widget.render("test", "b")
+        widget.render("test", "a", attrs={"id": "test"})
+        widget.choices = self.choices + [("c", "C")]
+        self.assertIn("data-value=\"c\"", widget.render("test", "a"))
+        self.assertEqual(self.cache.stats()["hits"], 0)
+        self.assertEqual(self.cache.stats()["entries"], 4)
+
+    def test_shared_between_instances(self):
+        """The widgets having the same configuration should share."""
+        for _ in range(2):
+            MDCheckBox(
+                label="Check", fragment_cache=self.cache
+            ).render("test", True)
+        self.assertEqual(self.cache.stats()["hits"], 1)
+
+    def test_date_select(self):
+        """The date select should be rendered and cached."""
+        widget = MDDateSelect(years=[2020], fragment_cache=self.cache)
+        html = widget.render("test", date(2020, 2, 3))
+        self.assertIn("data-value=\"2\" data-selected", html)
+        self.assertEqual(widget.render("test", date(2020, 2, 3)), html)
+        self.assertEqual(self.cache.stats()["hits"], 1)
+
+    def test_equal_values(self):
+        """The equal values of the different types shouldn't share."""
+        choices = [(1, "one"), ("1.0", "one-point-oh")]
+        widget = MDSelect(choices=choices, fragment_cache=self.cache)
+        plain = MDSelect(choices=choices)
+        for (value, attrs) in (
+            ("1.0", None), (1.0, None), (1, {"required": 1}),
+            (True, {"required": True}),
+        ):
+            self.assertEqual(
+                widget.render("test", value, attrs=attrs),
+                plain.render("test", value, attrs=attrs)
+            )
+        self.assertEqual(self.cache.stats()["hits"], 0)
+        self.assertNotEqual(freeze(Decimal("1")), freeze(Decimal("1.0")))
+        self.assertNotEqual(freeze(0.0), freeze(-0.0))
+
+    def test_choice_types(self):
+        """The choices different only in the types shouldn't share."""
+        MDSelect(
+            choices=[(1, "x"), (2.0, "y")], fragment_cache=self.cache
+        ).render("test", None)
+        html = MDSelect(
+            choices=[(True, "x"), (2, "y")], fragment_cache=self.cache
+        ).render("test", None)
+        self.assertIn("data-value=\"True\"", html)
+        self.assertIn("data-value=\"2\"", html)
+        self.assertEqual(self.cache.stats()["hits"], 0)
+
+    def test_key_between_processes(self):
+        """The backend key should be the same in the other processes."""
+        code = (
+            "import django; django.setup()\n"
+            "from djextra.forms.angular1.widgets import MDSelect\n"
+            "from djextra.forms.angular1.widgets.cache import FragmentCache\n"
+            "widget = MDSelect(choices=[('a', 'A'), (1, 'B')])\n"
+            "print(FragmentCache.backend_key("
+            "widget.fragment_key('test', 'a')))\n"
+        )
+        keys = set()
+        for seed in ("1", "2"):
+            keys.add(subprocess.run(
+                [sys.executable, "-c", code], check=True,
+                stdout=subprocess.PIPE, universal_newlines=True,
+                env=dict(
+                    os.environ, PYTHONHASHSEED=seed,
+                    PYTHONPATH=os.pathsep.join(filter(None, sys.path)),
+                    DJANGO_SETTINGS_MODULE="settings"
+                )
+            ).stdout.strip())
+        self.assertEqual(len(keys), 1)
+
+    def test_model_choices_backend(self):
+        """The model-backed choices shouldn't be shared via the backend."""
+        field = forms.ModelChoiceField(
+            ContentType.objects.all(), widget=MDSelect(
+                fragment_cache=FragmentCache(
+                    backend=LocMemCache("djextra-test-model", {})
+                )
+            )
+        )
+        self.assertIsNone(field.widget.fragment_key("test", None))
+        field.widget.fragment_cache = self.cache
+        self.assertIsNotNone(field.widget.fragment_key("test", None))
+
+    def test_bypass(self):
+        """The cache should be bypassed if get_context is overridden."""
+        widget = MDSelect(
+            choices=self.choices, fragment_cache=self.cache
+        )
+        MDSelect(
+            choices=self.choices, fragment_cache=self.cache
+        ).render("test", "a", attrs={"data-callback": object()})
+        widget.get_context = widget.get_context
+        widget.render("test", "a")
+        self.assertEqual(self.cache.stats()["misses"], 0)
+        self.assertEqual(self.cache.stats()["entries"], 0)
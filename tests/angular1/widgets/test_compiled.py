@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Precompiled template tests."""
+
+import os
+import shutil
+from io import StringIO
+import tempfile
+from unittest.mock import patch
+
+from django import setup
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from djextra.forms.angular1.widgets import MDCheckBox, MDSelect
+from djextra.forms.angular1.widgets.base import Jinja2Engine
+from djextra.forms.angular1.widgets.compiled import PrecompiledLoader
+
+setup()
+
+
+class PrecompiledTemplateTest(TestCase):
+    """Precompiled template test."""
+
+    def setUp(self):
+        """Setup."""
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp)
+        self.bundle = os.path.join(self.tmp, "widgets.bundle")
+        call_command("compilewidgets", self.bundle, stdout=StringIO())
+        self.widgets = (
+            (MDSelect(choices=(
+                ("test", (("testTest1", "Test 1"), ("testTest2", "Test 2"))),
+                ("test2", "Test2"), (None, "Test3")
+            )), "testTest2"),
+            (MDCheckBox("Check", "Help"), True),
+        )
+
+    def test_loader(self):
+        """The engine should use the bundle without auto-reloading."""
+        with override_settings(DJEXTRA_COMPILED_WIDGET_TEMPLATES=self.bundle):
+            env = Jinja2Engine().engine.env
+        self.assertIsInstance(env.loader, PrecompiledLoader)
+        self.assertFalse(env.auto_reload)
+        self.assertIn("md_select.html", env.loader.list_templates())
+
+    def test_render(self):
+        """The rendered html should be the same as the source templates."""
+        with override_settings(DJEXTRA_COMPILED_WIDGET_TEMPLATES=self.bundle):
+            renderer = Jinja2Engine()
+            renderer.engine
+        for (widget, value) in self.widgets:
+            with patch.object(
+                renderer.engine.env, "compile", side_effect=AssertionError
+            ):
+                result = widget.render("result", value, renderer=renderer)
+            self.assertEqual(
+                result,
+                widget.render("result", value, renderer=Jinja2Engine())
+            )
+
+    def test_stale_bundle(self):
+        """The bundle compiled by the other environment should be refused."""
+        with open(self.bundle, "r+b") as bundle:
+            bundle.write(b"X")
+        with self.assertRaises(ImproperlyConfigured):
+            PrecompiledLoader(self.bundle)
@@ -54,6 +54,16 @@ class SimpleMDMultiSelectTest(TestCase):
         )
         self.assertEqual(result, data)
 
+    def test_optgroups_non_str_values(self):
+        """The selected values should be compared as strings."""
+        widget = MDMultiSelect(choices=[(index, index) for index in range(5)])
+        groups = widget.optgroups("result", widget.format_value([1, 3, 9]))
+        self.assertEqual(
+            [option["value"] for (_, options, _) in groups
+             for option in options if option["selected"]],
+            [1, 3]
+        )
+
 
 class MDMultiSelectNoChoiceTest(TestCase):
     """MDMultiSelect without no options Test."""
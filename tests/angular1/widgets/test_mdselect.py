@@ -3,7 +3,9 @@
 
 """MDSelect Tests."""
 
-from django import setup
+from django import forms, setup
+from django.contrib.contenttypes.models import ContentType
+from django.db.models.functions import Lower
 from django.test import TestCase
 
 from djextra.forms.angular1.widgets import MDSelect
@@ -134,3 +136,108 @@ class MDSelectDisableSelectTest(TestCase):
             "</md-select>"
         )
         self.assertEqual(result, data)
+
+
+class MDSelectOptionTemplateTest(TestCase):
+    """MDSelect option template test."""
+
+    def setUp(self):
+        """Setup."""
+        class IncludedOptionSelect(MDSelect):
+            option_template_name = "./md_select_option.html"
+
+        choices = (
+            ("test", (
+                ("testTest1", "Test <1>"), ("testTest2", "Test \"2\"")
+            )),
+            ("test2", "Test2"), (None, "Test3")
+        )
+        self.field = MDSelect(choices=choices)
+        self.included = IncludedOptionSelect(choices=choices)
+
+    def test_render(self):
+        """The inlined options should be the same as the included ones."""
+        for value in (None, "testTest2", "test2"):
+            self.assertEqual(
+                self.field.render("result", value, attrs={"id": "result"}),
+                self.included.render("result", value, attrs={"id": "result"})
+            )
+
+
+class MDSelectPagingTest(TestCase):
+    """MDSelect paging test."""
+
+    def setUp(self):
+        """Setup."""
+        self.field = MDSelect(
+            choices=[(f"test{idx}", f"Test{idx}") for idx in range(10)],
+            page_size=2, page_url="/choices"
+        )
+
+    def test_render(self):
+        """Only the first page and the selected option should be rendered."""
+        result = str(self.field.render("result", "test7")).replace("\n", "")
+        data = (
+            "<md-select data-name=\"result\" data-page-size=\"2\" "
+            "data-page-url=\"/choices\">"
+            "<md-option data-value=\"test0\">Test0</md-option>"
+            "<md-option data-value=\"test1\">Test1</md-option>"
+            "<md-option data-value=\"test7\" data-selected>Test7</md-option>"
+            "</md-select>"
+        )
+        self.assertEqual(result, data)
+
+    def test_render_selected_in_page(self):
+        """The selected option in the page shouldn't be duplicated."""
+        result = str(self.field.render("result", "test1")).replace("\n", "")
+        data = (
+            "<md-select data-name=\"result\" data-page-size=\"2\" "
+            "data-page-url=\"/choices\">"
+            "<md-option data-value=\"test0\">Test0</md-option>"
+            "<md-option data-value=\"test1\" data-selected>Test1</md-option>"
+            "</md-select>"
+        )
+        self.assertEqual(result, data)
+
+
+class MDSelectModelPagingTest(TestCase):
+    """MDSelect paging the model-backed choices test."""
+
+    def test_render_expression(self):
+        """The queryset ordered by the expression should be rendered."""
+        for queryset in (
+            ContentType.objects.order_by(Lower("model")),
+            ContentType.objects.order_by("?"),
+            ContentType.objects.extra(order_by=["-id"]),
+        ):
+            with self.subTest(query=str(queryset.query)):
+                field = forms.ModelChoiceField(
+                    queryset, widget=MDSelect(page_size=2)
+                )
+                result = str(field.widget.render("result", None))
+                self.assertEqual(result.count("<md-option"), 2)
+
+
+class MDSelectSearchTest(TestCase):
+    """MDSelect search url test."""
+
+    def test_render(self):
+        """The search url should be rendered."""
+        result = str(
+            MDSelect(search_url="/search").render("result", None)
+        ).replace("\n", "")
+        data = (
+            "<md-select data-name=\"result\" data-search-url=\"/search\">"
+            "</md-select>"
+        )
+        self.assertEqual(result, data)
+
+
+class MDSelectPositionalTest(TestCase):
+    """MDSelect with the positional arguments test."""
+
+    def test_choices(self):
+        """The positional attrs and choices should be kept."""
+        widget = MDSelect(False, {"class": "x"}, [("a", "A")])
+        self.assertEqual(widget.attrs, {"class": "x"})
+        self.assertEqual(list(widget.choices), [("a", "A")])
@@ -12,7 +12,8 @@ except ImportError:
 from django import forms, setup
 from django.utils.timezone import now
 from django.test import TestCase
-from djextra.forms.angular1 import AngularForm
+from djextra.forms import ListField
+from djextra.forms.angular1 import AngularForm, MDCheckBox, MDSelect
 
 setup()
 
@@ -139,3 +140,199 @@ class AngularFormHasValueTest(TestCase):
                 f"Expected: {expected}, "
                 f'Actual: {context["attrs"]["data-ng-init"]}'
             )
+
+
+class AngularFormStreamTest(TestCase):
+    """AngularForm streaming test."""
+
+    def setUp(self):
+        """Setup."""
+        class TestForm(AngularForm):
+
+            name = forms.CharField(required=False)
+            choice = forms.ChoiceField(
+                choices=[(f"test{idx}", f"Test {idx}") for idx in range(50)],
+                widget=MDSelect()
+            )
+            check = forms.BooleanField(widget=MDCheckBox("Check"))
+            number = forms.IntegerField(show_hidden_initial=True)
+
+        self.form = TestForm(initial={"choice": "test3", "number": 3})
+
+    def test_stream(self):
+        """The joined chunks should be the same as the rendered fields."""
+        self.assertEqual(
+            "".join(self.form.stream()),
+            "".join(str(field) for field in self.form)
+        )
+
+    def test_chunks(self):
+        """The form should be rendered in multiple chunks."""
+        self.assertGreater(len(list(self.form.stream(chunk_size=128))), 1)
+
+
+class AngularFormPlanTest(TestCase):
+    """AngularForm ng-model plan test."""
+
+    def setUp(self):
+        """Setup."""
+        class TestForm(AngularForm):
+
+            class Meta(object):
+                ng_model_prefix = "pwn"
+                handle_ng_init = True
+
+            name = forms.CharField(required=False)
+
+        class SubForm(TestForm):
+
+            class Meta(object):
+                ng_model_prefix = "sub"
+
+            number = forms.IntegerField(required=False)
+
+        self.form_cls = TestForm
+        self.sub_cls = SubForm
+
+    def test_plan_cached(self):
+        """The plan should be built once per class."""
+        self.form_cls()
+        self.assertIs(
+            self.form_cls.get_ng_model_plan(),
+            self.form_cls.get_ng_model_plan()
+        )
+        self.assertEqual(
+            self.form_cls.get_ng_model_plan().models, {"name": "pwn.name"}
+        )
+
+    def test_subclass(self):
+        """The subclass should have its own plan."""
+        self.form_cls()
+        plan = self.sub_cls.get_ng_model_plan()
+        self.assertIsNot(plan, self.form_cls.get_ng_model_plan())
+        self.assertEqual(
+            plan.models, {"name": "sub.name", "number": "sub.number"}
+        )
+        self.assertFalse(plan.handle_ng_init)
+
+    def test_instances(self):
+        """Each instance should have its own wiring."""
+        (form1, form2) = (self.form_cls(), self.form_cls())
+        widget1 = form1.fields["name"].widget
+        widget2 = form2.fields["name"].widget
+        self.assertIsNot(widget1.attrs, widget2.attrs)
+        self.assertEqual(
+            widget1.get_context("name", "a", {})["widget"]["attrs"],
+            {"data-ng-model": "pwn.name", "data-ng-init": "pwn.name = \"a\""}
+        )
+        self.assertEqual(
+            widget2.get_context("name", "b", {})["widget"]["attrs"],
+            {"data-ng-model": "pwn.name", "data-ng-init": "pwn.name = \"b\""}
+        )
+
+
+class LineForm(forms.Form):
+    """The item form."""
+
+    name = forms.CharField()
+
+
+class AngularFormErrorsTest(TestCase):
+    """AngularForm structured errors test."""
+
+    class TestForm(AngularForm):
+        """The form."""
+
+        name = forms.CharField()
+        tags = ListField(field=forms.IntegerField(min_value=0))
+        lines = ListField(form=LineForm, required=False)
+
+        def clean(self):
+            """Reject the form."""
+            raise forms.ValidationError("Broken", code="broken")
+
+    def setUp(self):
+        """Setup."""
+        self.form = self.TestForm(data={
+            "tags": ["1", "x", "-1"], "lines": [{"name": "a"}, {}]
+        })
+        self.required = forms.CharField().error_messages["required"]
+
+    def test_ng_errors(self):
+        """The errors should be keyed by the ng-model path."""
+        self.assertEqual(self.form.ng_errors, {
+            "model": [{"message": "Broken", "code": "broken"}],
+            "model.name": [{"message": self.required, "code": "required"}],
+            "model.tags.1": [{
+                "message": "Enter a whole number.", "code": "invalid"
+            }],
+            "model.lines.1.name": [{
+                "message": self.required, "code": "required"
+            }],
+        })
+
+    def test_ng_errors_validators(self):
+        """The errors of the validators should be keyed by the index."""
+        form = self.TestForm(data={"name": "a", "tags": ["1", "-1"]})
+        self.assertEqual(
+            form.ng_errors["model.tags.1"][0]["code"], "min_value"
+        )
+
+    def test_json(self):
+        """The errors should be dumped into the compact JSON."""
+        self.assertEqual(
+            json.loads(self.form.ng_errors_json()), self.form.ng_errors
+        )
+        self.assertNotIn(", ", self.form.ng_errors_json())
+
+
+class AngularFormNgInitScriptTest(TestCase):
+    """AngularForm ng-init JSON block test."""
+
+    class TestForm(AngularForm):
+        """The form."""
+
+        class Meta(object):
+            """Metadata."""
+
+            handle_ng_init = "json"
+            ng_init_format_func = {"age": lambda value: f"{value} years"}
+
+        name = forms.CharField()
+        age = forms.IntegerField()
+        tags = ListField(required=False)
+
+    def setUp(self):
+        """Setup."""
+        self.form = self.TestForm(
+            initial={"name": "</script>&", "age": 20, "tags": ["a"]}
+        )
+
+    def test_no_attribute(self):
+        """The fields shouldn't have data-ng-init."""
+        self.assertNotIn("data-ng-init", str(self.form["name"]))
+
+    def test_data(self):
+        """The values should be keyed by the ng-model path."""
+        self.assertEqual(self.form.ng_init_data(), {
+            "model.name": "</script>&", "model.age": "20 years",
+            "model.tags": ["a"]
+        })
+
+    def test_script(self):
+        """The values should be rendered as one escaped JSON block."""
+        script = self.form.ng_init_script()
+        self.assertTrue(script.startswith(
+            "<script id=\"model-ng-init\" type=\"application/json\" "
+            "data-djextra-ng-init>"
+        ))
+        self.assertNotIn("</script>&", script)
+        payload = script[script.index(">") + 1:script.rindex("</script>")]
+        self.assertEqual(json.loads(payload), self.form.ng_init_data())
+
+    def test_prefix(self):
+        """The form prefix should be a part of the element id."""
+        self.assertIn(
+            "id=\"order-model-ng-init\"",
+            self.TestForm(prefix="order").ng_init_script()
+        )
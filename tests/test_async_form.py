@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""AsyncForm tests."""
+
+import asyncio
+import time
+from unittest import skipUnless
+
+from django import forms
+from django.test import TestCase
+
+from djextra.forms import AllRequiredForm, AsyncForm, ListField
+from djextra.forms.angular1 import AngularForm
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+def slow_validator(message, delay=0.1):
+    """Return the coroutine validator that rejects "bad" after delay."""
+    async def validator(value):
+        await asyncio.sleep(delay)
+        if "bad" in value:
+            raise forms.ValidationError(message)
+    return validator
+
+
+class AsyncFormTest(TestCase):
+    """AsyncForm test."""
+
+    class TestForm(AsyncForm):
+        """The form."""
+
+        class Meta(object):
+            """Metadata."""
+
+            async_validators = {
+                "name": [slow_validator("Name 1"), slow_validator("Name 2")],
+                "email": [slow_validator("Email")],
+            }
+
+        name = forms.CharField()
+        email = forms.CharField()
+        note = forms.CharField(required=False)
+        tags = ListField(
+            required=False, async_validators=[slow_validator("Tag")]
+        )
+
+        def clean(self):
+            """Record that clean is called."""
+            cleaned_data = super().clean()
+            cleaned_data["cleaned"] = True
+            return cleaned_data
+
+    async def test_valid(self):
+        """The valid data should be cleaned like is_valid."""
+        form = self.TestForm(data={
+            "name": "Test", "email": "test", "tags": ["a", "b"]
+        })
+        self.assertTrue(await form.ais_valid())
+        self.assertEqual(form.cleaned_data, {
+            "name": "Test", "email": "test", "note": "",
+            "tags": ["a", "b"], "cleaned": True
+        })
+
+    async def test_concurrent(self):
+        """The validators should run concurrently, reporting the errors."""
+        form = self.TestForm(data={
+            "name": "bad", "email": "bad",
+            "tags": ["a", "bad", "c", "bad"]
+        })
+        started = time.perf_counter()
+        self.assertFalse(await form.ais_valid())
+        self.assertLess(time.perf_counter() - started, 0.3)
+        self.assertEqual(dict(form.errors), {
+            "name": ["Name 1", "Name 2"],
+            "email": ["Email"],
+            "tags": ["Index 1: Tag", "Index 3: Tag"],
+        })
+        self.assertNotIn("name", form.cleaned_data)
+
+    @skipUnless(numpy, "numpy is not installed.")
+    async def test_numpy(self):
+        """The validators should check the items of the numpy array."""
+        checked = []
+
+        async def positive(value):
+            checked.append(value)
+            if value <= 0:
+                raise forms.ValidationError("Positive")
+
+        class TestForm(AsyncForm):
+
+            class Meta(object):
+                async_validators = {"values": [
+                    lambda value: positive(len(value))
+                ]}
+
+            values = ListField(
+                field=forms.FloatField(), container="numpy",
+                async_validators=[positive]
+            )
+
+        form = TestForm(data={"values": ["1.5", "2"]})
+        self.assertTrue(await form.ais_valid())
+        self.assertEqual(sorted(checked), [1.5, 2, 2])
+        form = TestForm(data={"values": ["1", "0"]})
+        self.assertFalse(await form.ais_valid())
+        self.assertEqual(form.errors["values"], ["Index 1: Positive"])
+
+    async def test_invalid_field_skipped(self):
+        """The validators of the invalid fields shouldn't run."""
+        form = self.TestForm(data={"email": "bad"})
+        self.assertFalse(await form.ais_valid())
+        self.assertEqual(
+            form.errors["name"], [form.fields["name"].error_messages[
+                "required"
+            ]]
+        )
+
+    async def test_unbound(self):
+        """The unbound form should be invalid."""
+        self.assertFalse(await self.TestForm().ais_valid())
+
+
+class AsyncSubclassTest(TestCase):
+    """The forms of djextra should be validated asynchronously."""
+
+    class TestForm(AngularForm, AllRequiredForm):
+        """The form."""
+
+        class Meta(object):
+            """Metadata."""
+
+            optional = ("note", )
+            async_validators = {"name": [slow_validator("Name", 0)]}
+
+        name = forms.CharField()
+        note = forms.CharField(required=False)
+
+    async def test_async(self):
+        """The validators and AllRequiredForm should work."""
+        form = self.TestForm(data={"note": "bad"})
+        self.assertFalse(await form.ais_valid())
+        self.assertEqual(list(form.errors), ["name"])
+        form = self.TestForm(data={"name": "bad"})
+        self.assertFalse(await form.ais_valid())
+        self.assertEqual(dict(form.errors), {"name": ["Name"]})
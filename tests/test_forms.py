@@ -9,6 +9,7 @@ except ImportError:
     from mock import MagicMock  # noqa
 from django import forms, setup
 from django.test import TestCase
+from django.core.exceptions import ImproperlyConfigured
 from djextra.forms import AllRequiredForm, FieldAttributeForm
 
 setup()
@@ -84,6 +85,71 @@ class FieldCommonAttributeFormTest(TestCase):
         )
 
 
+class FieldAttributeFormPlanTest(TestCase):
+    """FieldAttributeForm attribute plan test."""
+
+    def setUp(self):
+        """Setup."""
+        class TestForm(FieldAttributeForm):
+
+            class Meta(object):
+                common_attrs = {
+                    "data-first": lambda form, fld, name, value: name,
+                    "data-second": "second"
+                }
+                fld_attrs = {
+                    "name1": {
+                        "data-first": "overridden",
+                        "data-third": lambda form, fld, name, value: value
+                    }
+                }
+
+            name1 = forms.CharField(required=False)
+            name2 = forms.CharField(required=False)
+        self.form_cls = TestForm
+
+    def test_plan(self):
+        """The plan should be built once with the callables separated."""
+        self.form_cls()
+        plan = self.form_cls.get_attrs_plan()
+        self.assertIs(plan, self.form_cls.get_attrs_plan())
+        self.assertEqual(
+            [key for (key, _) in plan["name1"][1]], ["data-third"]
+        )
+        self.assertEqual(
+            [key for (key, _) in plan["name2"][1]], ["data-first"]
+        )
+
+    def test_evaluate(self):
+        """The attributes should be evaluated in the declared order."""
+        form = self.form_cls()
+        self.assertEqual(
+            list(form.fields["name1"].widget.get_context(
+                "name1", "value", {"id": "id_name1"}
+            )["widget"]["attrs"].items()),
+            [
+                ("id", "id_name1"), ("data-first", "overridden"),
+                ("data-second", "second"), ("data-third", "value")
+            ]
+        )
+        self.assertEqual(
+            form.fields["name2"].widget.get_context(
+                "name2", "value", {}
+            )["widget"]["attrs"],
+            {"data-first": "name2", "data-second": "second"}
+        )
+
+    def test_prefix(self):
+        """The attributes should be applied to the prefixed form."""
+        form = self.form_cls(prefix="test", initial={"name1": "init"})
+        self.assertEqual(
+            str(form["name1"]),
+            "<input type=\"text\" name=\"test-name1\" value=\"init\" "
+            "id=\"id_test-name1\" data-first=\"overridden\" "
+            "data-second=\"second\" data-third=\"init\">"
+        )
+
+
 class AllRequiredFormSimpleTest(TestCase):
     """All required form simple initialization test."""
 
@@ -137,3 +203,146 @@ class AllRequiredFormExceptionTest(TestCase):
                 result.fields[name].required,
                 "required flag of %s is Falsy" % name
             )
+
+
+class AllRequiredFormPlanTest(TestCase):
+    """All required form plan test."""
+
+    def setUp(self):
+        """Setup."""
+        class ParentForm(forms.Form):
+            name1 = forms.CharField(required=False)
+            name2 = forms.CharField(required=False)
+
+        class TestForm(AllRequiredForm, ParentForm):
+            class Meta(object):
+                optional = ("name2", )
+
+        self.parent_cls = ParentForm
+        self.form_cls = TestForm
+
+    def test_class_level(self):
+        """The required flags should be resolved on the class."""
+        self.form_cls()
+        self.assertTrue(self.form_cls.base_fields["name1"].required)
+        self.assertFalse(self.form_cls.base_fields["name2"].required)
+
+    def test_parent_untouched(self):
+        """The fields of the parent form shouldn't be changed."""
+        self.form_cls()
+        self.assertFalse(self.parent_cls.base_fields["name1"].required)
+        self.assertFalse(self.parent_cls().fields["name1"].required)
+
+    def test_added_field(self):
+        """The fields added on the instantiation should be required."""
+        class TestForm(self.form_cls):
+            def __init__(self, *args, **kwargs):
+                self.base_fields = dict(self.base_fields)
+                self.base_fields["name3"] = forms.CharField(required=False)
+                super().__init__(*args, **kwargs)
+
+        self.assertTrue(TestForm().fields["name3"].required)
+
+    def test_optional_declared_required(self):
+        """The optional field declared as required should be kept required."""
+        class TestForm(AllRequiredForm):
+            class Meta(object):
+                optional = ("name1", "name2")
+
+            name1 = forms.CharField()
+            name2 = forms.CharField(required=False)
+
+        self.assertTrue(TestForm.base_fields["name1"].required)
+        form = TestForm(data={"name2": "x"})
+        self.assertFalse(form.is_valid())
+        self.assertEqual(list(form.errors), ["name1"])
+        self.assertTrue(TestForm(data={"name1": "x"}).is_valid())
+
+
+class AllRequiredFormRuleTest(TestCase):
+    """All required form conditional rule test."""
+
+    def setUp(self):
+        """Setup."""
+        class TestForm(AllRequiredForm):
+            class Meta(object):
+                optional = ("contact_by_phone", "is_private", "country")
+                required_if = {
+                    "phone": "contact_by_phone",
+                    "state": ("country", lambda value: value == "US")
+                }
+                optional_if = {
+                    "company": [
+                        "is_private", ("country", lambda value: value == "JP")
+                    ]
+                }
+
+            name = forms.CharField()
+            contact_by_phone = forms.BooleanField(required=False)
+            phone = forms.CharField()
+            country = forms.CharField(required=False)
+            state = forms.CharField()
+            is_private = forms.BooleanField(required=False)
+            company = forms.CharField()
+        self.form_cls = TestForm
+
+    def errors(self, **data):
+        """Return the error codes of the form."""
+        form = self.form_cls(data=dict({"name": "test"}, **data))
+        form.is_valid()
+        return {
+            name: [error.code for error in errors]
+            for (name, errors) in form.errors.as_data().items()
+        }
+
+    def test_field_flags(self):
+        """The conditional fields shouldn't be required on the field."""
+        form = self.form_cls()
+        for name in ("phone", "state", "company"):
+            self.assertFalse(form.fields[name].required, name)
+        self.assertTrue(form.fields["name"].required)
+
+    def test_required_if(self):
+        """The field should be required when the condition is met."""
+        self.assertEqual(self.errors(company="c"), {})
+        self.assertEqual(
+            self.errors(company="c", contact_by_phone="on"),
+            {"phone": ["required"]}
+        )
+        self.assertEqual(
+            self.errors(company="c", contact_by_phone="on", phone="1"), {}
+        )
+        self.assertEqual(
+            self.errors(company="c", country="US"), {"state": ["required"]}
+        )
+        self.assertEqual(self.errors(company="c", country="UK"), {})
+
+    def test_optional_if(self):
+        """The field should be optional when the condition is met."""
+        self.assertEqual(self.errors(), {"company": ["required"]})
+        self.assertEqual(self.errors(is_private="on"), {})
+        self.assertEqual(self.errors(country="JP"), {})
+
+    def test_unknown_field(self):
+        """The rule with unknown field should be refused."""
+        class TestForm(AllRequiredForm):
+            class Meta(object):
+                required_if = {"name": "unknown"}
+
+            name = forms.CharField()
+
+        with self.assertRaises(ImproperlyConfigured):
+            TestForm()
+
+    def test_conflict(self):
+        """The field in both rules should be refused."""
+        class TestForm(AllRequiredForm):
+            class Meta(object):
+                required_if = {"name": "flag"}
+                optional_if = {"name": "flag"}
+
+            name = forms.CharField()
+            flag = forms.BooleanField()
+
+        with self.assertRaises(ImproperlyConfigured):
+            TestForm()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Incremental JSON array parser tests."""
+
+import io
+import json
+
+from django import forms
+from django.test import TestCase
+
+from djextra.forms import ListField, iter_json_array
+
+
+class IterJSONArrayTest(TestCase):
+    """iter_json_array test."""
+
+    def parse(self, payload, read_size):
+        """Parse the payload."""
+        return list(iter_json_array(
+            io.BytesIO(payload.encode("utf-8")), read_size=read_size
+        ))
+
+    def test_items(self):
+        """The items should be parsed whatever the chunks are cut."""
+        items = [
+            12345, -0.5e-3, "日本語 \\\"quoted\\\" 😀", True, None,
+            {"a": [1, {"b": "c"}]}, [], "", 6789
+        ]
+        payload = " [ " + " , ".join(json.dumps(item) for item in items) + \
+            " ] \n"
+        for read_size in (1, 2, 3, 7, 64, 65536):
+            with self.subTest(read_size=read_size):
+                self.assertEqual(self.parse(payload, read_size), items)
+
+    def test_empty(self):
+        """The empty array should be parsed."""
+        for payload in ("[]", " [ \n ] "):
+            with self.subTest(payload=payload):
+                self.assertEqual(self.parse(payload, 1), [])
+
+    def test_invalid(self):
+        """The payload other than JSON array should be rejected."""
+        for payload in (
+            "", "{}", "[1, 2", "[1 2]", "[1, x, 3]", "[1,]", "[1] 2",
+            '["unterminated]'
+        ):
+            for read_size in (1, 4, 65536):
+                with self.subTest(payload=payload, read_size=read_size):
+                    with self.assertRaises(ValueError):
+                        self.parse(payload, read_size)
+
+    def test_lazy(self):
+        """The stream should be read as the items are consumed."""
+        stream = io.BytesIO(b"[1, 2, 3, 4, 5, 6, 7, 8]")
+        items = iter_json_array(stream, read_size=4)
+        self.assertEqual(next(items), 1)
+        self.assertLess(stream.tell(), 12)
+
+
+class ListFieldStreamTest(TestCase):
+    """ListField with the iterator test."""
+
+    def test_clean(self):
+        """The items should be converted and validated."""
+        field = ListField(field=forms.IntegerField(min_value=0))
+        stream = io.BytesIO(b'[1, "2", 3]')
+        self.assertEqual(
+            field.clean(iter_json_array(stream, read_size=2)), [1, 2, 3]
+        )
+        for (payload, expected) in (
+            (b'[1, "x", "y"]', ["Index 1", "Index 2"]),
+            (b'[1, -1, 2, -2]', ["Index 1", "Index 3"]),
+        ):
+            with self.subTest(payload=payload):
+                with self.assertRaises(forms.ValidationError) as cm:
+                    field.clean(iter_json_array(io.BytesIO(payload)))
+                self.assertEqual([
+                    message.split(":")[0]
+                    for message in cm.exception.messages
+                ], expected)
+
+    def test_invalid_json(self):
+        """The broken JSON should be invalid_list."""
+        with self.assertRaises(forms.ValidationError) as cm:
+            ListField().clean(iter_json_array(io.BytesIO(b'["a", b]')))
+        self.assertEqual(cm.exception.code, "invalid_list")
+
+    def test_max_items(self):
+        """The stream should stop being read over max_items."""
+        stream = io.BytesIO(("[" + ", ".join(["1"] * 1000) + "]").encode())
+        with self.assertRaises(forms.ValidationError) as cm:
+            ListField(max_items=3).clean(
+                iter_json_array(stream, read_size=16)
+            )
+        self.assertEqual(cm.exception.code, "max_items")
+        self.assertLess(stream.tell(), 64)
+
+    def test_error_index_after_chunks(self):
+        """The index should count the items converted by chunks."""
+        field = ListField(field=forms.IntegerField())
+        payload = ["1"] * 1500 + ["x"]
+        with self.assertRaises(forms.ValidationError) as cm:
+            field.clean(iter(payload))
+        self.assertEqual(
+            [message.split(":")[0] for message in cm.exception.messages],
+            ["Index 1500"]
+        )
+        self.assertEqual(
+            field.clean(iter(["1"] * 1500 + [2])), [1] * 1500 + [2]
+        )
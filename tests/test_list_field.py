@@ -3,11 +3,25 @@
 
 """ListField Test code."""
 
+import threading
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from unittest import skipUnless
+from unittest.mock import PropertyMock, patch
+
 from django import forms
+from django.contrib.contenttypes.models import ContentType
+from django.db.backends.signals import connection_created
 from django.test import TestCase
 
 from djextra import forms as extraforms
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 class ListFieldFalsyBehaviorTest(TestCase):
     """ListField falsy value behavior test."""
@@ -170,3 +184,494 @@ class ListFieldValidationErrorTest(TestCase):
         self.assertEqual(dict(self.form.errors), {
             "emails": [f"Index 2: {errmsg}", f"Index 3: {errmsg}"]
         })
+
+
+class ListFieldBatchTest(TestCase):
+    """ListField batched conversion / validation test."""
+
+    def test_batch_equals_per_item(self):
+        """The batched conversion should behave like the inner field."""
+        cases = (
+            (forms.IntegerField(), ["10", 20, " 30 ", "4_0", "50.00"]),
+            (forms.FloatField(), ["1.5", 2, 3.25, "1e3"]),
+            (forms.DecimalField(), ["1.50", 2, " 3 "]),
+        )
+        for (inner, payload) in cases:
+            with self.subTest(field=type(inner).__name__):
+                field = extraforms.ListField(field=inner)
+                result = field.clean(payload)
+                self.assertEqual(
+                    result, [inner.to_python(item) for item in payload]
+                )
+                self.assertEqual(
+                    [type(item) for item in result],
+                    [type(inner.to_python(item)) for item in payload]
+                )
+
+    def test_non_batchable_types(self):
+        """The values the converter treats differently should be checked."""
+        field = extraforms.ListField(field=forms.IntegerField())
+        with self.assertRaises(forms.ValidationError) as cm:
+            field.clean([1, 2.5, True])
+        self.assertEqual(len(cm.exception.error_list), 2)
+
+    def test_overridden_to_python(self):
+        """The subclass that overrides to_python shouldn't be batched."""
+        class DoubleField(forms.IntegerField):
+            def to_python(self, value):
+                return super().to_python(value) * 2
+
+        field = extraforms.ListField(field=DoubleField())
+        self.assertEqual(field.clean(["1", "2"]), [2, 4])
+
+    def test_bounds(self):
+        """The values out of the bounds should be reported by index."""
+        field = extraforms.ListField(
+            field=forms.FloatField(min_value=0, max_value=10)
+        )
+        self.assertEqual(field.clean(["0", "10"]), [0.0, 10.0])
+        with self.assertRaises(forms.ValidationError) as cm:
+            field.clean(["1", "-1", "11"])
+        self.assertEqual(
+            [
+                message.split(":")[0]
+                for message in cm.exception.messages
+            ],
+            ["Index 1", "Index 2"]
+        )
+
+    def test_nan_bounds(self):
+        """The NaN shouldn't hide the values out of the bounds."""
+        field = extraforms.ListField(field=forms.FloatField(min_value=0))
+        with self.assertRaises(forms.ValidationError) as cm:
+            field.clean(["nan", "-1"])
+        self.assertEqual(
+            [message.split(":")[0] for message in cm.exception.messages],
+            ["Index 1"]
+        )
+
+    def test_decimal_not_finite(self):
+        """The decimal field should reject NaN / Infinity."""
+        field = extraforms.ListField(field=forms.DecimalField())
+        with self.assertRaises(forms.ValidationError) as cm:
+            field.clean(["1", "Infinity"])
+        self.assertEqual(len(cm.exception.error_list), 1)
+
+
+class ListFieldBoundTest(TestCase):
+    """ListField max_items / max_errors test."""
+
+    def test_max_items(self):
+        """The list having too many items should be rejected at first."""
+        field = extraforms.ListField(max_items=2)
+        with patch.object(field.field, "to_python") as to_python:
+            with self.assertRaises(forms.ValidationError) as cm:
+                field.clean(["a", "b", "c"])
+        to_python.assert_not_called()
+        self.assertEqual(cm.exception.code, "max_items")
+        self.assertEqual(field.clean(["a", "b"]), ["a", "b"])
+
+    def test_max_errors(self):
+        """The items after max_errors errors shouldn't be checked."""
+        field = extraforms.ListField(
+            field=forms.IntegerField(), max_errors=2
+        )
+        with self.assertRaises(forms.ValidationError) as cm:
+            field.clean(["x", "1", "y", "z"])
+        self.assertEqual(
+            [error.code for error in cm.exception.error_list],
+            [None, None, "max_errors"]
+        )
+        self.assertTrue(cm.exception.messages[0].startswith("Index 0: "))
+
+    def test_fail_fast(self):
+        """max_errors=1 should stop at the first error."""
+        field = extraforms.ListField(
+            field=forms.EmailField(), max_errors=1
+        )
+        with patch.object(
+            field.field, "run_validators", side_effect=forms.ValidationError(
+                "Invalid"
+            )
+        ) as run_validators:
+            with self.assertRaises(forms.ValidationError) as cm:
+                field.clean(["a@example.com", "b@example.com"])
+        self.assertEqual(run_validators.call_count, 1)
+        self.assertEqual(
+            cm.exception.messages, [
+                "Index 0: Invalid",
+                "Stopped checking the items after 1 errors."
+            ]
+        )
+
+    def test_lazy_message(self):
+        """The messages of the items should be formatted on demand."""
+        field = extraforms.ListField(field=forms.IntegerField())
+        with patch.object(
+            forms.ValidationError, "messages",
+            new_callable=PropertyMock, return_value=["Invalid"]
+        ) as messages:
+            with self.assertRaises(forms.ValidationError) as cm:
+                field.clean(["x"])
+            messages.assert_not_called()
+            self.assertEqual(cm.exception.error_list[0].message % (
+                cm.exception.error_list[0].params
+            ), "Index 0: Invalid")
+
+
+class ListFieldMemoizeTest(TestCase):
+    """ListField memoize test."""
+
+    def setUp(self):
+        """Setup."""
+        self.field = extraforms.ListField(
+            field=forms.EmailField(), memoize=True
+        )
+
+    def test_validated_once(self):
+        """Each distinct value should be checked once."""
+        payload = ["a@example.com", "b@example.com"] * 50
+        with patch.object(
+            self.field.field, "run_validators",
+            wraps=self.field.field.run_validators
+        ) as run_validators:
+            self.assertEqual(self.field.clean(payload), payload)
+        self.assertEqual(run_validators.call_count, 2)
+
+    def test_errors_per_index(self):
+        """The errors should be reported for every index."""
+        with self.assertRaises(forms.ValidationError) as cm:
+            self.field.clean(["test", "a@example.com", "test"])
+        errmsg = self.field.field.validators[0].message
+        self.assertEqual(
+            cm.exception.messages, [f"Index 0: {errmsg}", f"Index 2: {errmsg}"]
+        )
+
+    def test_type_is_a_part_of_key(self):
+        """The values equal to each other but of the other type differ."""
+        field = extraforms.ListField(
+            field=forms.IntegerField(), memoize=True
+        )
+        with self.assertRaises(forms.ValidationError) as cm:
+            field.clean([1, 1.0, True, [1]])
+        self.assertEqual(
+            [message.split(":")[0] for message in cm.exception.messages],
+            ["Index 2", "Index 3"]
+        )
+
+
+def slow_validator(value):
+    """Take the time that decreases by the value, and reject the odd."""
+    time.sleep(0.01 * (10 - int(value)))
+    if int(value) % 2:
+        raise forms.ValidationError("Odd")
+
+
+class ListFieldConcurrencyTest(TestCase):
+    """ListField concurrency test."""
+
+    def setUp(self):
+        """Setup."""
+        self.payload = [str(index) for index in range(10)]
+
+    def field(self, **kwargs):
+        """Return the field having the slow validator."""
+        return extraforms.ListField(
+            field=forms.CharField(validators=[slow_validator]), **kwargs
+        )
+
+    def clean(self, field):
+        """Clean the payload, and return the messages and the elapsed time."""
+        started = time.perf_counter()
+        with self.assertRaises(forms.ValidationError) as cm:
+            field.clean(self.payload)
+        return (cm.exception.messages, time.perf_counter() - started)
+
+    def test_thread(self):
+        """The validators should run in parallel with the order kept."""
+        (expected, sequential) = self.clean(self.field())
+        (messages, concurrent) = self.clean(
+            self.field(executor="thread", concurrency=10)
+        )
+        self.assertEqual(messages, expected)
+        self.assertEqual(messages[0], "Index 1: Odd")
+        self.assertLess(concurrent, sequential / 2)
+
+    def test_thread_connections(self):
+        """Each thread should open a connection, and close it at the end."""
+        (opened, closed) = ([], [])
+
+        def exists(value):
+            ContentType.objects.filter(model=value).exists()
+
+        def record(sender, connection, **kwargs):
+            opened.append(threading.get_ident())
+
+        field = extraforms.ListField(
+            field=forms.CharField(validators=[exists]),
+            executor="thread", concurrency=4
+        )
+        connection_created.connect(record)
+        try:
+            with patch("djextra.forms.listfield.connections") as connections:
+                connections.close_all.side_effect = \
+                    lambda: closed.append(threading.get_ident())
+                field.clean([str(index) for index in range(50)])
+        finally:
+            connection_created.disconnect(record)
+        self.assertTrue(opened)
+        self.assertLessEqual(len(opened), 4)
+        self.assertEqual(len(closed), 4)
+        self.assertLessEqual(set(opened), set(closed))
+
+    def test_executor(self):
+        """The given executor should be used."""
+        with ThreadPoolExecutor(4) as executor:
+            (messages, _) = self.clean(
+                self.field(executor=executor, concurrency=4, max_errors=2)
+            )
+        self.assertEqual(messages, [
+            "Index 1: Odd", "Index 3: Odd",
+            "Stopped checking the items after 2 errors."
+        ])
+
+
+class ListFieldEncodedTest(TestCase):
+    """ListField delimited / packed string test."""
+
+    def test_delimiter(self):
+        """The delimited string should be split."""
+        field = extraforms.ListField(
+            field=forms.IntegerField(), delimiter=",", max_items=3
+        )
+        self.assertEqual(field.clean("1, 2,3"), [1, 2, 3])
+        with self.assertRaises(forms.ValidationError) as cm:
+            field.clean("1,2,3,4")
+        self.assertEqual(cm.exception.code, "max_items")
+
+    def test_string_without_delimiter(self):
+        """The string should be rejected without delimiter / packed."""
+        with self.assertRaises(forms.ValidationError) as cm:
+            extraforms.ListField().clean("a,b")
+        self.assertEqual(cm.exception.code, "invalid_list")
+
+    def test_packed(self):
+        """The base64-encoded packed arrays should be decoded."""
+        cases = (
+            ("int32", forms.IntegerField(), "AQAAAP7///8DAAAA", [1, -2, 3]),
+            ("float64", forms.FloatField(), "AAAAAAAA4D8AAAAAAAD4Pw==",
+             [0.5, 1.5]),
+        )
+        for (packed, inner, payload, expected) in cases:
+            with self.subTest(packed=packed):
+                field = extraforms.ListField(field=inner, packed=packed)
+                self.assertEqual(field.clean(payload), expected)
+
+    def test_packed_validators(self):
+        """The decoded values should be validated."""
+        field = extraforms.ListField(
+            field=forms.IntegerField(min_value=0), packed="int32"
+        )
+        with self.assertRaises(forms.ValidationError) as cm:
+            field.clean("AQAAAP7///8DAAAA")
+        self.assertTrue(cm.exception.messages[0].startswith("Index 1: "))
+
+    def test_invalid_packed(self):
+        """The broken payload should be rejected."""
+        field = extraforms.ListField(
+            field=forms.IntegerField(), packed="int32"
+        )
+        for payload in ("AQAAAP7///8DAAA", "AQAA*AAA", "AQA="):
+            with self.subTest(payload=payload):
+                with self.assertRaises(forms.ValidationError) as cm:
+                    field.clean(payload)
+                self.assertEqual(cm.exception.code, "invalid_packed")
+
+    def test_packed_max_items(self):
+        """The oversized payload should be rejected before being decoded."""
+        field = extraforms.ListField(
+            field=forms.FloatField(), packed="float64", max_items=2
+        )
+        self.assertEqual(field.clean("AAAAAAAA4D8AAAAAAAD4Pw=="), [0.5, 1.5])
+        with patch("djextra.forms.listfield.base64.b64decode") as decode:
+            with self.assertRaises(forms.ValidationError) as cm:
+                field.clean("AAAAAAAA4D8" * 4 + "AAAAAAAA4D8=")
+        self.assertEqual(cm.exception.code, "max_items")
+        decode.assert_not_called()
+
+    def test_unknown_packed(self):
+        """The unknown packed type should be rejected."""
+        with self.assertRaises(ValueError):
+            extraforms.ListField(packed="int64")
+
+
+class ListFieldContainerTest(TestCase):
+    """ListField container test."""
+
+    def test_array(self):
+        """The cleaned value should be array."""
+        cases = (
+            (forms.IntegerField(), ["1", "2"], "q"),
+            (forms.FloatField(), ["1.5", "2"], "d"),
+        )
+        for (inner, payload, typecode) in cases:
+            with self.subTest(typecode=typecode):
+                result = extraforms.ListField(
+                    field=inner, container="array"
+                ).clean(payload)
+                self.assertEqual(result, array(typecode, [
+                    inner.to_python(item) for item in payload
+                ]))
+
+    def test_packed_kept(self):
+        """The decoded array should be used as it is if it can."""
+        field = extraforms.ListField(
+            field=forms.FloatField(max_value=1), packed="float64",
+            container="array"
+        )
+        self.assertIsInstance(
+            field.to_python("AAAAAAAA4D8AAAAAAADwPw=="), array
+        )
+        self.assertEqual(
+            field.clean("AAAAAAAA4D8AAAAAAADwPw=="), array("d", [0.5, 1])
+        )
+        with self.assertRaises(forms.ValidationError):
+            field.clean("AAAAAAAA4D8AAAAAAAD4Pw==")
+
+    def test_invalid_container_values(self):
+        """The values the array can't hold should be rejected."""
+        field = extraforms.ListField(
+            field=forms.IntegerField(required=False), container="array"
+        )
+        for payload in (["1", ""], [str(2 ** 64)]):
+            with self.subTest(payload=payload):
+                with self.assertRaises(forms.ValidationError) as cm:
+                    field.clean(payload)
+                self.assertEqual(cm.exception.code, "invalid_container")
+
+    def test_invalid_container(self):
+        """The unknown container or non-numeric field should be rejected."""
+        with self.assertRaises(ValueError):
+            extraforms.ListField(container="set")
+        with self.assertRaises(ValueError):
+            extraforms.ListField(container="array")
+        with self.assertRaises(ValueError):
+            extraforms.ListField(
+                field=forms.DecimalField(), container="array"
+            )
+
+    @skipUnless(numpy, "numpy is not installed.")
+    def test_numpy(self):
+        """The cleaned value should be numpy array."""
+        result = extraforms.ListField(
+            field=forms.FloatField(), container="numpy"
+        ).clean(["1.5", "2"])
+        self.assertIsInstance(result, numpy.ndarray)
+        self.assertEqual(result.tolist(), [1.5, 2.0])
+
+
+class ListFieldFormTest(TestCase):
+    """ListField with the inner form test."""
+
+    class LineItemForm(forms.Form):
+        """The inner form."""
+
+        name = forms.CharField()
+        quantity = forms.IntegerField(min_value=1)
+
+    def setUp(self):
+        """Setup."""
+        self.field = extraforms.ListField(form=self.LineItemForm)
+
+    def test_cleaned_data(self):
+        """The items should be cleaned by the form."""
+        self.assertEqual(self.field.clean([
+            {"name": "Apple", "quantity": "2"},
+            {"name": "Orange", "quantity": 1},
+        ]), [
+            {"name": "Apple", "quantity": 2},
+            {"name": "Orange", "quantity": 1},
+        ])
+
+    def test_errors(self):
+        """The errors should be reported per index and field."""
+        with self.assertRaises(forms.ValidationError) as cm:
+            self.field.clean([
+                {"name": "Apple", "quantity": "2"},
+                {"quantity": "0"},
+                "Orange",
+            ])
+        form = self.LineItemForm(data={"quantity": "0"})
+        form.is_valid()
+        self.assertEqual(cm.exception.messages, [
+            f"Index 1: name: {form.errors['name'][0]}",
+            f"Index 1: quantity: {form.errors['quantity'][0]}",
+            "Index 2: Enter a mapping of the fields.",
+        ])
+
+    def test_pooled(self):
+        """The form should be instantiated once."""
+        with patch.object(
+            self.LineItemForm, "__init__",
+            autospec=True, side_effect=forms.Form.__init__
+        ) as init:
+            self.field.clean([{"name": "A", "quantity": 1}] * 3)
+            copy = self.field.__deepcopy__({})
+            copy.clean([{"name": "B", "quantity": 1}])
+        self.assertEqual(init.call_count, 1)
+
+    def test_max_errors(self):
+        """max_errors should count the items."""
+        field = extraforms.ListField(form=self.LineItemForm, max_errors=1)
+        with self.assertRaises(forms.ValidationError) as cm:
+            field.clean([{}, {}])
+        self.assertEqual(
+            [error.code for error in cm.exception.error_list],
+            [None, None, "max_errors"]
+        )
+
+
+class ListFieldErrorMapTest(TestCase):
+    """ListField.error_map test."""
+
+    def test_items(self):
+        """The errors should be keyed by the index."""
+        field = extraforms.ListField(
+            field=forms.IntegerField(), max_errors=2
+        )
+        with self.assertRaises(forms.ValidationError) as cm:
+            field.clean(["x", "1", "y", "z"])
+        self.assertEqual(field.error_map(cm.exception), {
+            "0": [{"message": "Enter a whole number.", "code": "invalid"}],
+            "2": [{"message": "Enter a whole number.", "code": "invalid"}],
+            "__all__": [{
+                "message": "Stopped checking the items after 2 errors.",
+                "code": "max_errors"
+            }],
+        })
+
+    def test_validators(self):
+        """The errors of the validators should be keyed by the index."""
+        field = extraforms.ListField(field=forms.IntegerField(max_value=5))
+        with self.assertRaises(forms.ValidationError) as cm:
+            field.clean(["1", "9"])
+        self.assertEqual(field.error_map(cm.exception), {"1": [{
+            "message": "Ensure this value is less than or equal to 5.",
+            "code": "max_value"
+        }]})
+
+    def test_form_items(self):
+        """The errors of the form items should be keyed by the field."""
+        field = extraforms.ListField(form=ListFieldFormTest.LineItemForm)
+        with self.assertRaises(forms.ValidationError) as cm:
+            field.clean([{"name": "a", "quantity": "0"}])
+        self.assertEqual(list(field.error_map(cm.exception)), ["0.quantity"])
+
+    def test_list(self):
+        """The errors of the list should be keyed by __all__."""
+        field = extraforms.ListField(max_items=1)
+        with self.assertRaises(forms.ValidationError) as cm:
+            field.clean(["a", "b"])
+        self.assertEqual(
+            field.error_map(cm.exception)["__all__"][0]["code"], "max_items"
+        )